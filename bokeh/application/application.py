@@ -89,14 +89,25 @@ class Application(object):
                 The user-supplied metadata is returned as-is under the
                 ``"data"`` key in the blob.
 
+            template_document (bool or None): whether to run the handlers
+                only once, and initialize every new document as a copy of the
+                resulting template document (default: None)
+
+                If None, the value of the ``BOKEH_SESSION_TEMPLATE`` setting
+                is used. See ``initialize_document`` for details.
+
         '''
         metadata = kwargs.pop('metadata', None)
+        template_document = kwargs.pop('template_document', None)
         if kwargs:
             raise TypeError("Invalid keyword argument: %s" %
                 list(kwargs.keys())[0])
         self._static_path = None
         self._handlers = []
         self._metadata = metadata
+        self._template_document = settings.session_template(template_document)
+        self._template = None
+        self._template_unusable = False
         for h in handlers:
             self.add(h)
 
@@ -123,6 +134,14 @@ class Application(object):
         '''
         return all(handler.safe_to_fork for handler in self._handlers)
 
+    @property
+    def template_document(self):
+        ''' Whether new documents are initialized as copies of a template
+        document, instead of by running the handlers every time.
+
+        '''
+        return self._template_document
+
     @property
     def static_path(self):
         ''' Path to any (optional) static resources specified by handlers.
@@ -163,7 +182,23 @@ class Application(object):
     def initialize_document(self, doc):
         ''' Fills in a new document using the Application's handlers.
 
+        If ``template_document`` is enabled, the handlers are only run once,
+        on a separate template document without a session context. After
+        that, every document is filled in with copies of the template's models
+        that have new IDs, and that share any NumPy array data with the
+        template. This can make creating sessions much cheaper for
+        applications that build large documents.
+
+        If the handlers fail on the template document, or add any Python
+        callbacks to it, then the template can not be shared, and the handlers
+        are run for every document, as usual.
+
         '''
+        template = self._get_template() if self._template_document else None
+        if template is not None:
+            template._copy_to(doc)
+            return
+
         for h in self._handlers:
             # TODO (havocp) we need to check the 'failed' flag on each handler
             # and build a composite error display. In develop mode, we want to
@@ -243,6 +278,34 @@ class Application(object):
             request_data.update(h.process_request(request))
         return request_data
 
+    # Private methods ---------------------------------------------------------
+
+    def _get_template(self):
+        ''' Return the template document, running the handlers to create it
+        the first time, or None if the handlers' output can not be shared.
+
+        '''
+        if self._template is None and not self._template_unusable:
+            doc = Document()
+            for h in self._handlers:
+                h.modify_document(doc)
+                if h.failed:
+                    reason = "handler %r failed: %s" % (h, h.error)
+                    break
+            else:
+                reason = _unshareable_reason(doc)
+
+            if reason is None:
+                if settings.perform_document_validation():
+                    doc.validate()
+                self._template = doc
+            else:
+                log.warning("Not using a template document for new sessions, because %s", reason)
+                doc.delete_modules()
+                self._template_unusable = True
+
+        return self._template
+
 
 class ServerContext(metaclass=ABCMeta):
     ''' A harness for server-specific information and tasks related to
@@ -432,6 +495,22 @@ class SessionContext(metaclass=ABCMeta):
 # Private API
 #-----------------------------------------------------------------------------
 
+def _unshareable_reason(doc):
+    ''' Describe why copies of a document would not behave like the document
+    itself, or return None if they would.
+
+    '''
+    if doc.session_callbacks:
+        return "it has session callbacks"
+    if doc._callbacks or doc.session_destroyed_callbacks:
+        return "it has Python document callbacks"
+    if any(msg_type != "bokeh_event" or len(callbacks) > 1 for msg_type, callbacks in doc._message_callbacks.items()):
+        return "it has message callbacks"
+    for model in doc._all_models.values():
+        if any(model._callbacks.values()) or any(model._event_callbacks.values()):
+            return "%r has Python callbacks" % model
+    return None
+
 #-----------------------------------------------------------------------------
 # Code
 #-----------------------------------------------------------------------------
@@ -184,6 +184,13 @@ class DirectoryHandler(Handler):
         '''
         return self._main_handler.failed or self._lifecycle_handler.failed
 
+    @property
+    def has_session_created_hook(self):
+        ''' ``True`` if ``server_lifecycle.py`` defines ``on_session_created``.
+
+        '''
+        return self._lifecycle_handler.has_session_created_hook
+
     @property
     def safe_to_fork(self):
         ''' Whether it is still safe for the Bokeh server to fork new workers.
@@ -102,6 +102,13 @@ class Handler(object):
         '''
         return self._failed
 
+    @property
+    def has_session_created_hook(self):
+        ''' ``True`` if the handler runs any code when a session is created.
+
+        '''
+        return type(self).on_session_created is not Handler.on_session_created
+
     # Public methods ----------------------------------------------------------
 
     def modify_document(self, doc):
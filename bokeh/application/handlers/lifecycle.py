@@ -47,6 +47,15 @@ class LifecycleHandler(Handler):
         self._on_session_destroyed = _do_nothing
         self.safe_to_fork = True
 
+    # Properties --------------------------------------------------------------
+
+    @property
+    def has_session_created_hook(self):
+        ''' ``True`` if the configured module defines ``on_session_created``.
+
+        '''
+        return self._on_session_created is not _do_nothing
+
     # Public methods ----------------------------------------------------------
 
     def modify_document(self, doc):
@@ -355,6 +355,51 @@ To configure how often unused sessions last. set the
 The value is specified in milliseconds. The default lifetime interval for
 unused sessions is 15 seconds. Only positive integer values are accepted.
 
+Session Creation Options
+~~~~~~~~~~~~~~~~~~~~~~~~
+
+To keep a number of documents initialized ahead of time, so that new sessions
+do not have to wait for the application code to run, set the
+``--session-pool-size`` option:
+
+.. code-block:: sh
+
+    bokeh serve app_script.py --session-pool-size 4
+
+Pooled documents are initialized in the background, before any session exists
+for them, so the application code can not depend on the session context (e.g.
+request arguments). The pool is disabled, with a warning, for applications that
+define ``on_session_created`` hooks, or that fail to initialize a document
+without a session context. By default, no documents are pooled.
+
+To keep slow application code from blocking other sessions on the same
+server, set the ``--session-executor-threads`` option:
+
+.. code-block:: sh
+
+    bokeh serve app_script.py --session-executor-threads 4
+
+Session documents are then initialized, patched by clients and serialized
+for clients in a pool of worker threads, while the document lock of each
+session is held. Application code still runs for only one new document at
+a time.
+
+Updates to a document are queued separately for every connected client, so
+that one slow client does not hold up the others. When more than
+``--send-queue-high-watermark`` messages are waiting for a client, the
+``--send-queue-policy`` option decides what happens, until no more than
+``--send-queue-low-watermark`` messages are left:
+
+.. code-block:: sh
+
+    bokeh serve app_script.py --send-queue-high-watermark 100 --send-queue-policy drop
+
+With the ``merge`` policy (the default), queued updates are combined into
+fewer messages, and consecutive streams to the same data source into a single
+update. With ``drop``, queued property updates that have been
+superseded by newer values are discarded. With ``disconnect``, the client is
+disconnected and may reconnect to a fresh session.
+
 Diagnostic Options
 ~~~~~~~~~~~~~~~~~~
 
@@ -395,6 +440,31 @@ set the ``--mem-log-frequency`` option:
 The value is specified in milliseconds. The default interval for
 logging stats is 0 (disabled). Only positive integer values are accepted.
 
+To export counters and histograms that describe the activity of the server
+(e.g. sessions, connections, and the time taken to create sessions and to
+encode updates), in a format that can be scraped by Prometheus, set the
+``--enable-metrics`` option:
+
+.. code-block:: sh
+
+    bokeh serve app_script.py --enable-metrics
+
+The metrics are then served on the ``/metrics`` path, subject to any
+authentication configured for the server. See :mod:`bokeh.server.metrics`
+for the list of metrics.
+
+To find the callbacks that hold up sessions, set the ``--profile-locks``
+option:
+
+.. code-block:: sh
+
+    bokeh serve app_script.py --profile-locks
+
+The time spent waiting for and holding the document lock of every session is
+then recorded for each callback, and a summary of the callbacks that held the
+locks the longest is logged when the server shuts down. See
+:mod:`bokeh.server.tracing` to trace document locks in other ways.
+
 '''
 
 #-----------------------------------------------------------------------------
@@ -419,12 +489,14 @@ from tornado.autoreload import watch
 
 # Bokeh imports
 from bokeh.application import Application
+from bokeh.core.enums import SendQueuePolicy
 from bokeh.resources import DEFAULT_SERVER_PORT
 from bokeh.server.auth_provider import AuthModule, NullAuth
 from bokeh.server.tornado import (
     DEFAULT_SESSION_TOKEN_EXPIRATION,
     DEFAULT_WEBSOCKET_MAX_MESSAGE_SIZE_BYTES,
 )
+from bokeh.server.tracing import LockProfiler, add_lock_tracer
 from bokeh.settings import settings
 from bokeh.util.logconfig import basicConfig
 from bokeh.util.string import format_docstring, nice_join
@@ -439,6 +511,7 @@ from ..util import build_single_handler_applications, die, report_server_init_er
 
 LOGLEVELS = ('trace', 'debug', 'info', 'warning', 'error', 'critical')
 SESSION_ID_MODES = ('unsigned', 'signed', 'external-signed')
+SEND_QUEUE_POLICIES = tuple(SendQueuePolicy)
 DEFAULT_LOG_FORMAT = "%(asctime)s %(message)s"
 
 base_serve_args = (
@@ -580,6 +653,42 @@ class Serve(Subcommand):
             default = None,
         )),
 
+        ('--session-pool-size', dict(
+            metavar = 'N',
+            type    = int,
+            help    = "How many initialized documents to keep ready for new sessions",
+            default = None,
+        )),
+
+        ('--session-executor-threads', dict(
+            metavar = 'N',
+            type    = int,
+            help    = "How many threads to use for blocking session work, 0 to use the IOLoop",
+            default = None,
+        )),
+
+        ('--send-queue-high-watermark', dict(
+            metavar = 'N',
+            type    = int,
+            help    = "How many messages may be queued for a client before the send queue policy applies",
+            default = None,
+        )),
+
+        ('--send-queue-low-watermark', dict(
+            metavar = 'N',
+            type    = int,
+            help    = "How many messages may be queued for a client when the send queue policy stops applying",
+            default = None,
+        )),
+
+        ('--send-queue-policy', dict(
+            metavar = 'POLICY',
+            action  = 'store',
+            default = None,
+            choices = SEND_QUEUE_POLICIES,
+            help    = "What to do with updates for clients that can not keep up",
+        )),
+
         ('--stats-log-frequency', dict(
             metavar = 'MILLISECONDS',
             type    = int,
@@ -594,6 +703,16 @@ class Serve(Subcommand):
             default = None,
         )),
 
+        ('--enable-metrics', dict(
+            action = 'store_true',
+            help   = "Export server metrics on the /metrics path",
+        )),
+
+        ('--profile-locks', dict(
+            action = 'store_true',
+            help   = "Log a summary of the time spent holding session document locks on shutdown",
+        )),
+
         ('--use-xheaders', dict(
             action = 'store_true',
             help   = "Prefer X-headers for IP/protocol information",
@@ -795,6 +914,11 @@ class Serve(Subcommand):
                                                               'keep_alive_milliseconds',
                                                               'check_unused_sessions_milliseconds',
                                                               'unused_session_lifetime_milliseconds',
+                                                              'session_pool_size',
+                                                              'session_executor_threads',
+                                                              'send_queue_high_watermark',
+                                                              'send_queue_low_watermark',
+                                                              'send_queue_policy',
                                                               'stats_log_frequency_milliseconds',
                                                               'mem_log_frequency_milliseconds',
                                                               'use_xheaders',
@@ -841,6 +965,7 @@ class Serve(Subcommand):
         server_kwargs['cookie_secret'] = settings.cookie_secret(getattr(args, 'cookie_secret', None))
         server_kwargs['use_index'] = not args.disable_index
         server_kwargs['redirect_root'] = not args.disable_index_redirect
+        server_kwargs['use_metrics'] = args.enable_metrics
         server_kwargs['autoreload'] = args.dev is not None
 
         def find_autoreload_targets(app_path: str) -> None:
@@ -876,6 +1001,11 @@ class Serve(Subcommand):
 
         server_kwargs = self.customize_kwargs(args, server_kwargs)
 
+        lock_profiler = None
+        if args.profile_locks:
+            lock_profiler = LockProfiler()
+            add_lock_tracer(lock_profiler)
+
         with report_server_init_errors(**server_kwargs):
             server = Server(applications, **server_kwargs)
 
@@ -899,6 +1029,9 @@ class Serve(Subcommand):
             log.info("Starting Bokeh server with process id: %d" % os.getpid())
             server.run_until_shutdown()
 
+            if lock_profiler is not None:
+                log.info("Document lock profile for process id %d:\n%s" % (os.getpid(), lock_profiler.summary()))
+
 #-----------------------------------------------------------------------------
 # Dev API
 #-----------------------------------------------------------------------------
@@ -116,6 +116,7 @@ __all__ = (
     'RenderMode',
     'ResetPolicy',
     'RoundingFunction',
+    'SendQueuePolicy',
     'SizingMode',
     'SizingPolicy',
     'SortDirection',
@@ -379,6 +380,9 @@ ResetPolicy = enumeration("standard", "event_only")
 #: Specify a policy for  how numbers should be rounded
 RoundingFunction = enumeration("round", "nearest", "floor", "rounddown", "ceil", "roundup")
 
+#: Specify what the Bokeh server does when a client can not keep up with updates
+SendQueuePolicy = enumeration("merge", "drop", "disconnect")
+
 #: Sizing mode policies
 SizingMode = enumeration("stretch_width", "stretch_height", "stretch_both",
                          "scale_width", "scale_height", "scale_both",
@@ -149,7 +149,14 @@ class MetaHasProps(type):
             if "__doc__" in class_dict and class_dict["__doc__"] is not None:
                 class_dict["__doc__"] += _EXAMPLE_TEMPLATE % dict(path=path)
 
-        return super().__new__(meta_cls, class_name, bases, class_dict)
+        cls = super().__new__(meta_cls, class_name, bases, class_dict)
+
+        # collect the names of all (including inherited) validation methods
+        # once, so that check_integrity does not need to inspect every model
+        cls.__validators__ = tuple(name for name in dir(cls) if name.startswith("_check")
+                                   and getattr(getattr(cls, name, None), "validator_type", None))
+
+        return cls
 
     def __init__(cls, class_name, bases, nmspc):
         if class_name == 'HasProps':
@@ -55,13 +55,14 @@ import collections
 import datetime as dt
 import decimal
 import json
+from math import isfinite
 
 # External imports
 import numpy as np
 
 # Bokeh imports
 from ..settings import settings
-from ..util.dependencies import import_optional
+from ..util.dependencies import import_optional, import_required
 from ..util.serialization import (
     convert_datetime_type,
     convert_timedelta_type,
@@ -81,7 +82,12 @@ pd = import_optional('pandas')
 
 __all__ = (
     'BokehJSONEncoder',
+    'get_json_backend',
+    'OrjsonBackend',
     'serialize_json',
+    'serialize_json_wire',
+    'StdlibJSONBackend',
+    'to_json_compatible',
 )
 
 #-----------------------------------------------------------------------------
@@ -100,6 +106,9 @@ def serialize_json(obj, pretty=None, indent=None, **kwargs):
 
     The resulting JSON always has sorted keys. By default. the output is
     as compact as possible unless pretty output or indentation is requested.
+    The output is always produced by the standard library ``json`` module,
+    so that it is reproducible byte for byte. To serialize messages that are
+    only consumed by BokehJS, ``serialize_json_wire`` may be faster.
 
     Args:
         obj (obj) : the object to serialize to JSON format
@@ -165,6 +174,55 @@ def serialize_json(obj, pretty=None, indent=None, **kwargs):
 
     return json.dumps(obj, cls=BokehJSONEncoder, allow_nan=False, indent=indent, separators=separators, sort_keys=True, **kwargs)
 
+def serialize_json_wire(obj):
+    ''' Return a compact serialized JSON representation of objects, to be
+    sent to BokehJS over the wire.
+
+    Values are converted in the same way as by ``serialize_json``, but keys
+    are not sorted, and the JSON backend configured by the ``json_backend``
+    setting is used, so the exact output may differ between backends.
+
+    Args:
+        obj (obj) : the object to serialize to JSON format
+
+    Returns:
+        str
+
+    '''
+    return get_json_backend().dumps(obj)
+
+def to_json_compatible(obj):
+    ''' Return a representation of objects that consists only of plain JSON
+    types (dict, list, str, int, float, bool and None), suitable to send to
+    BokehJS.
+
+    Values are converted in exactly the same way as by ``serialize_json``,
+    so the result is equal to ``json.loads(serialize_json(obj))``, but is
+    computed in a single pass without producing and parsing a JSON string.
+
+    Args:
+        obj (obj) : the object to convert to JSON types
+
+    Returns:
+        JSON-data
+
+    Raises:
+        TypeError, if some value can not be converted
+
+        ValueError, for NaN or infinite float values
+
+    Examples:
+
+        .. code-block:: python
+
+            >>> data = dict(b=np.datetime64('2017-01-01'), a = np.arange(3))
+
+            >>> to_json_compatible(data)
+            {'b': 1483228800000.0, 'a': [0, 1, 2]}
+
+    '''
+    return _to_json_compatible(obj, BokehJSONEncoder().default)
+
 
 #-----------------------------------------------------------------------------
 # Dev API
@@ -260,10 +318,159 @@ class BokehJSONEncoder(json.JSONEncoder):
         else:
             return self.transform_python_types(obj)
 
+class StdlibJSONBackend(object):
+    ''' Encode compact JSON with the standard library ``json`` module.
+
+    '''
+    name = "json"
+
+    def dumps(self, obj):
+        ''' Serialize objects to a JSON string, without sorting keys.
+
+        Args:
+            obj (obj) : the object to serialize to JSON format
+
+        Returns:
+            str
+
+        '''
+        return json.dumps(obj, cls=BokehJSONEncoder, allow_nan=False, separators=(",", ":"))
+
+class OrjsonBackend(object):
+    ''' Encode compact JSON with `orjson`_, which must be installed.
+
+    Objects are first converted with ``to_json_compatible``, so that NaN and
+    infinite float values raise an error just as they do with the standard
+    library (``orjson`` would silently encode them as ``null``). Values
+    ``orjson`` can not encode (e.g. integers outside the 64-bit range) fall
+    back to the standard library.
+
+    .. _orjson: https://github.com/ijl/orjson
+
+    '''
+    name = "orjson"
+
+    def __init__(self):
+        self._orjson = import_required("orjson", "The orjson JSON backend requires orjson to be installed")
+        self._default = BokehJSONEncoder().default
+
+    def dumps(self, obj):
+        ''' Serialize objects to a JSON string, without sorting keys.
+
+        Args:
+            obj (obj) : the object to serialize to JSON format
+
+        Returns:
+            str
+
+        Raises:
+            ValueError, for NaN or infinite float values
+
+        '''
+        obj = _to_json_compatible(obj, self._default)
+        try:
+            return self._orjson.dumps(obj).decode("utf-8")
+        except self._orjson.JSONEncodeError:
+            return StdlibJSONBackend().dumps(obj)
+
+def get_json_backend(name=None):
+    ''' Return a JSON backend by name.
+
+    Args:
+        name (str, optional) :
+            One of ``"json"``, ``"orjson"`` or ``"auto"``, which selects
+            ``orjson`` if it is installed, and the standard library otherwise.
+            If None, the ``json_backend`` setting is used. (default: None)
+
+    Returns:
+        StdlibJSONBackend or OrjsonBackend
+
+    Raises:
+        ValueError, if the name is not a known backend
+
+    '''
+    name = settings.json_backend(name)
+
+    if name not in _json_backends:
+        if name == "auto":
+            _json_backends[name] = get_json_backend("orjson" if import_optional("orjson") else "json")
+        elif name in _json_backend_classes:
+            _json_backends[name] = _json_backend_classes[name]()
+        else:
+            raise ValueError("Unknown JSON backend %r, valid values are: auto, %s" % (name, ", ".join(_json_backend_classes)))
+
+    return _json_backends[name]
+
 #-----------------------------------------------------------------------------
 # Private API
 #-----------------------------------------------------------------------------
 
+_json_backend_classes = {
+    StdlibJSONBackend.name: StdlibJSONBackend,
+    OrjsonBackend.name: OrjsonBackend,
+}
+
+_json_backends = {}
+
+def _check_float(value):
+    if value != value or value in (float("inf"), float("-inf")):
+        raise ValueError("Out of range float values are not JSON compliant: %r" % value)
+    return value
+
+def _json_key(key):
+    # mirrors the key conversions done by json.dumps
+    if isinstance(key, str):
+        return str(key)
+    elif key is True:
+        return "true"
+    elif key is False:
+        return "false"
+    elif key is None:
+        return "null"
+    elif isinstance(key, int):
+        return int.__repr__(key)
+    elif isinstance(key, float):
+        return float.__repr__(_check_float(key))
+    raise TypeError("keys must be str, int, float, bool or None, not %s" % type(key).__name__)
+
+def _to_json_compatible(obj, default):
+    # the checks below follow the order json.JSONEncoder uses, with exact
+    # type checks for the most common types first
+    typ = type(obj)
+    if typ is str or typ is int or typ is bool or obj is None:
+        return obj
+    elif typ is float:
+        return _check_float(obj)
+    elif typ is list or typ is tuple:
+        return _to_json_compatible_list(obj, default)
+    elif typ is dict:
+        return {_json_key(key): _to_json_compatible(value, default) for key, value in obj.items()}
+    elif isinstance(obj, str):
+        return str(obj)
+    elif isinstance(obj, int):
+        return int(int.__repr__(obj))
+    elif isinstance(obj, float):
+        return _check_float(float(obj))
+    elif isinstance(obj, (list, tuple)):
+        return _to_json_compatible_list(obj, default)
+    elif isinstance(obj, dict):
+        return {_json_key(key): _to_json_compatible(value, default) for key, value in obj.items()}
+    elif isinstance(obj, np.ndarray) and obj.dtype.kind in "biufmM":
+        # lists from numeric arrays hold only plain JSON values (non-finite
+        # values are converted to strings), so there is no need to descend
+        return transform_array(obj, force_list=True)
+    return _to_json_compatible(default(obj), default)
+
+_PLAIN_TYPES = {str, int, bool, type(None)}
+_NUMBER_TYPES = {int, float, bool}
+
+def _to_json_compatible_list(obj, default):
+    # long homogeneous lists (e.g. data columns) are common, check them in bulk
+    types = set(map(type, obj))
+    if types <= _PLAIN_TYPES or (types <= _NUMBER_TYPES and all(map(isfinite, obj))):
+        return list(obj)
+    return [_to_json_compatible(item, default) for item in obj]
+
 #-----------------------------------------------------------------------------
 # Code
 #-----------------------------------------------------------------------------
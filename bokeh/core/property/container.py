@@ -22,7 +22,12 @@ log = logging.getLogger(__name__)
 from collections.abc import Container, Iterable, Mapping, Sequence, Sized
 
 # Bokeh imports
-from ...util.serialization import decode_base64_dict, transform_column_source_data
+from ...util.serialization import (
+    decode_base64_dict,
+    decode_ragged_dict,
+    transform_column_source_data,
+)
+from .any import Any, AnyRef
 from .bases import ContainerProperty, DeserializationError
 from .descriptors import ColumnDataPropertyDescriptor
 from .enum import Enum
@@ -75,7 +80,7 @@ class Seq(ContainerProperty):
         super().validate(value, True)
 
         if value is not None:
-            if not (self._is_seq(value) and all(self.item_type.is_valid(item) for item in value)):
+            if not (self._is_seq(value) and (self._accepts_any_item or all(self.item_type.is_valid(item) for item in value))):
                 if self._is_seq(value):
                     invalid = []
                     for item in value:
@@ -87,6 +92,12 @@ class Seq(ContainerProperty):
                     msg = "" if not detail else "expected an element of %s, got %r" % (self, value)
                     raise ValueError(msg)
 
+    @property
+    def _accepts_any_item(self):
+        # avoid checking every item (e.g. of large CDS columns) when every
+        # item is valid regardless
+        return type(self.item_type) in (Any, AnyRef)
+
     @classmethod
     def _is_seq(cls, value):
         return ((isinstance(value, Sequence) or cls._is_seq_like(value)) and
@@ -238,6 +249,8 @@ class ColumnData(Dict):
             key = self.keys_type.from_json(key, models)
             if isinstance(value, dict) and '__ndarray__' in value:
                 new_data[key] = decode_base64_dict(value)
+            elif isinstance(value, dict) and '__ragged__' in value:
+                new_data[key] = decode_ragged_dict(value)
             elif isinstance(value, list) and any(isinstance(el, dict) and '__ndarray__' in el for el in value):
                 new_list = []
                 for el in value:
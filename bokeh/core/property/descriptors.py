@@ -703,8 +703,6 @@ class BasicPropertyDescriptor(PropertyDescriptor):
 
         is_themed = obj.themed_values() is not None and self.name in obj.themed_values()
 
-        default = self.instance_default(obj)
-
         if is_themed:
             unstable_dict = obj._unstable_themed_values
         else:
@@ -713,6 +711,8 @@ class BasicPropertyDescriptor(PropertyDescriptor):
         if self.name in unstable_dict:
             return unstable_dict[self.name]
 
+        default = self.instance_default(obj)
+
         if self.property._may_have_unstable_default():
             if isinstance(default, PropertyValueContainer):
                 default._register_owner(obj, self)
@@ -801,7 +801,7 @@ class BasicPropertyDescriptor(PropertyDescriptor):
         # Normally we want a "no-op" if the new value and old value are identical
         # but some hinted events are in-place. This check will allow those cases
         # to continue on to the notification machinery
-        if self.property.matches(value, old) and (hint is None):
+        if hint is None and self.property.matches(value, old):
             return
 
         was_set = self.name in obj._property_values
@@ -338,6 +338,11 @@ class PropertyValueColumnData(PropertyValueDict):
 
     '''
 
+    def __init__(self, *args, **kwargs):
+        # preallocated storage for array columns streamed with a rollover
+        self._stream_buffers = {}
+        super().__init__(*args, **kwargs)
+
     # x[i] = y
     # don't wrap with notify_owner --- notifies owners explicitly
     def __setitem__(self, i, y):
@@ -371,6 +376,9 @@ class PropertyValueColumnData(PropertyValueDict):
             else:
                 cols |= { x[0] for x in E }
 
+        for col in cols:
+            self._stream_buffers.pop(col, None)
+
         # we must loop ourselves here instead of calling _notify_owners
         # because the hint is customized for each owner separately
         for (owner, descriptor) in self._owners:
@@ -400,6 +408,10 @@ class PropertyValueColumnData(PropertyValueDict):
         only the small streamed data that BokehJS needs in order to
         efficiently synchronize.
 
+        When a ``rollover`` is given, array columns are kept as views into
+        larger preallocated arrays (see ``_StreamBuffer``), so that each update
+        only copies the newly streamed rows, instead of the entire column.
+
         .. warning::
             This function assumes the integrity of ``new_data`` has already
             been verified.
@@ -413,9 +425,10 @@ class PropertyValueColumnData(PropertyValueDict):
         # self._saved_copy() makes a shallow copy.
         for k, v in  new_data.items():
             if isinstance(self[k], np.ndarray) or isinstance(new_data[k], np.ndarray):
-                data = np.append(self[k], new_data[k])
-                if rollover and len(data) > rollover:
-                    data = data[-rollover:]
+                if rollover:
+                    data = self._stream_buffered(k, new_data[k], rollover)
+                else:
+                    data = np.append(self[k], new_data[k])
                 # call dict.__setitem__ directly, bypass wrapped version on base class
                 dict.__setitem__(self, k, data)
             else:
@@ -429,6 +442,21 @@ class PropertyValueColumnData(PropertyValueDict):
         self._notify_owners(old,
                             hint=ColumnsStreamedEvent(doc, source, new_data, rollover, setter))
 
+    def _stream_buffered(self, k, new_data, rollover):
+        ''' Append ``new_data`` to the array column ``k`` using a preallocated
+        ``_StreamBuffer``, and return the new (view) value for the column.
+
+        '''
+        column = self[k]
+        buffer = self._stream_buffers.get(k)
+
+        # the column may have been replaced since it was last streamed to
+        if buffer is None or buffer.data is not column or not buffer.append(new_data, rollover):
+            buffer = _StreamBuffer(column, new_data, rollover)
+            self._stream_buffers[k] = buffer
+
+        return buffer.data
+
     # don't wrap with notify_owner --- notifies owners explicitly
     def _patch(self, doc, source, patches, setter=None):
         ''' Internal implementation to handle special-casing patch events
@@ -458,6 +486,7 @@ class PropertyValueColumnData(PropertyValueDict):
         old = self._saved_copy()
 
         for name, patch in patches.items():
+            self._make_writable(name, patch)
             for ind, value in patch:
                 if isinstance(ind, (int, slice)):
                     self[name][ind] = value
@@ -470,10 +499,91 @@ class PropertyValueColumnData(PropertyValueDict):
         self._notify_owners(old,
                             hint=ColumnsPatchedEvent(doc, source, patches, setter))
 
+    def _make_writable(self, name, patch):
+        ''' Replace read-only NumPy arrays in the column ``name`` that ``patch``
+        modifies in place with writable copies.
+
+        Session documents that are copied from a template document share array
+        buffers with the template through read-only views.
+
+        '''
+        column = self[name]
+        if isinstance(column, np.ndarray):
+            if not column.flags.writeable:
+                # call dict.__setitem__ directly, bypass wrapped version on base class
+                dict.__setitem__(self, name, column.copy())
+            return
+
+        for ind, _ in patch:
+            if isinstance(ind, (int, slice)):
+                continue
+            item = column[ind[0]]
+            if isinstance(item, np.ndarray) and not item.flags.writeable:
+                column[ind[0]] = item.copy()
+
 #-----------------------------------------------------------------------------
 # Private API
 #-----------------------------------------------------------------------------
 
+class _StreamBuffer(object):
+    ''' Preallocated storage for a 1d array column that is streamed to with
+    a rollover.
+
+    The column value is always a view ``array[start:end]`` into a larger
+    backing array. New rows are copied into the spare capacity after ``end``,
+    and the view is advanced, so an update costs time proportional to the
+    number of new rows only. When the spare capacity is exhausted, the rows
+    that are kept are copied into a new backing array with twice their size,
+    which keeps the amortized cost of every appended row constant.
+
+    Rows of the backing array are never overwritten once they have been part
+    of a view, so previous column values (e.g. the "old" values reported in
+    change notifications) are never modified by later updates.
+
+    '''
+
+    def __init__(self, column, new_data, rollover):
+        # np.append determines the dtype (and flattening) exactly as before
+        data = np.append(column, new_data)[-rollover:]
+        size = len(data)
+        self._array = np.empty(max(2 * size, 1), dtype=data.dtype)
+        self._array[:size] = data
+        self._start = 0
+        self._end = size
+        self.data = self._array[:size]
+
+    def append(self, new_data, rollover):
+        ''' Append new rows in place, if possible.
+
+        Returns:
+            bool : False if the new rows can not be stored without changing
+            the dtype or shape of the column, True otherwise
+
+        '''
+        new_data = np.asarray(new_data)
+        if new_data.ndim != 1 or np.result_type(self._array, new_data) != self._array.dtype:
+            return False
+
+        # only the last ``rollover`` new rows can survive
+        if len(new_data) > rollover:
+            new_data = new_data[-rollover:]
+
+        n = len(new_data)
+        keep = min(self._end - self._start + n, rollover)
+
+        if self._end + n > len(self._array):
+            array = np.empty(max(2 * keep, 1), dtype=self._array.dtype)
+            old_keep = keep - n
+            array[:old_keep] = self._array[self._end - old_keep:self._end]
+            self._array, self._start, self._end = array, 0, old_keep
+
+        self._array[self._end:self._end + n] = new_data
+        self._end += n
+        self._start = self._end - keep
+        self.data = self._array[self._start:self._end]
+        return True
+
+
 #-----------------------------------------------------------------------------
 # Code
 #-----------------------------------------------------------------------------
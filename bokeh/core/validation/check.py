@@ -108,14 +108,15 @@ def check_integrity(models):
     messages = dict(error=[], warning=[])
 
     for model in models:
-        validators = []
-        for name in dir(model):
-            if not name.startswith("_check"): continue
-            obj = getattr(model, name)
-            if getattr(obj, "validator_type", None):
-                validators.append(obj)
-        for func in validators:
-            messages[func.validator_type].extend(func())
+        # HasProps classes collect the names of their validators when created
+        names = getattr(type(model), "__validators__", None)
+        if names is None:
+            names = [name for name in dir(model) if name.startswith("_check")]
+        for name in names:
+            func = getattr(model, name)
+            validator_type = getattr(func, "validator_type", None)
+            if validator_type:
+                messages[validator_type].extend(func())
 
     for msg in sorted(messages['error']):
         log.error("E-%d (%s): %s: %s" % msg)
@@ -33,7 +33,7 @@ log = logging.getLogger(__name__)
 
 # Standard library imports
 import sys
-from collections import defaultdict
+from collections import Counter, defaultdict, deque
 from functools import wraps
 from inspect import isclass
 from json import loads
@@ -44,16 +44,22 @@ import jinja2
 
 # Bokeh imports
 from ..core.enums import HoldPolicy
-from ..core.json_encoder import serialize_json
+from ..core.json_encoder import serialize_json, to_json_compatible
 from ..core.query import find
 from ..core.templates import FILE
 from ..core.validation import check_integrity
 from ..events import Event
-from ..model import Model
+from ..model import (
+    Model,
+    _visit_immediate_value_references,
+    _visit_value_and_its_immediate_references,
+    collect_models,
+)
 from ..themes import Theme, built_in_themes
 from ..themes import default as default_theme
 from ..util.callback_manager import _check_callback
 from ..util.datatypes import MultiValuedDict
+from ..util.serialization import decode_binary_dict, decode_ragged_dict
 from ..util.version import __version__
 from .events import (
     ModelChangedEvent,
@@ -65,6 +71,7 @@ from .events import (
 )
 from .locking import UnlockedDocumentProxy
 from .util import (
+    copy_references,
     initialize_references_json,
     instantiate_references_json,
     references_json,
@@ -109,9 +116,12 @@ class Document(object):
         self._title = kwargs.pop('title', DEFAULT_TITLE)
         self._template = FILE
         self._all_models_freeze_count = 0
+        self._all_models_stale = False
         self._all_models = dict()
         self._all_models_by_name = MultiValuedDict()
+        self._all_models_refcounts = dict()
         self._all_former_model_ids = set()
+        self._models_to_validate = set()
         self._callbacks = {}
         self._message_callbacks = {}
         self._session_destroyed_callbacks = set()
@@ -219,7 +229,7 @@ class Document(object):
         else:
             raise ValueError("Theme must be a string or an instance of the Theme class")
 
-        for model in self._all_models.values():
+        for model in list(self._all_models.values()):
             self._theme.apply_to_model(model)
 
     @property
@@ -315,6 +325,8 @@ class Document(object):
         # well. But in embedded cases, you may well want more than one.
         try:
             self._roots.append(model)
+            self._update_model_references(None, model)
+            self._models_to_validate.add(model)
         finally:
             self._pop_all_models_freeze()
         self._trigger_on_change(RootAddedEvent(self, model, setter))
@@ -353,7 +365,7 @@ class Document(object):
             for model in subscribed:
                 model._trigger_event(event)
 
-    def apply_json_patch(self, patch, setter=None):
+    def apply_json_patch(self, patch, setter=None, buffers=None):
         ''' Apply a JSON patch object and process any resulting events.
 
         Args:
@@ -371,6 +383,10 @@ class Document(object):
                 The session can compare the event setter to itself, and
                 suppress any updates that originate from itself.
 
+            buffers (list, optional) :
+                Binary buffers (headers and payloads) that accompany the patch,
+                used to decode binary encoded column data (default: None)
+
         Returns:
             None
 
@@ -415,7 +431,7 @@ class Document(object):
                 if source_id not in self._all_models:
                     raise RuntimeError("Cannot apply patch to %s which is not in the document" % (str(source_id)))
                 source = self._all_models[source_id]
-                value = event_json['new']
+                value = { name: _decode_binary_array(values, buffers) for name, values in event_json['new'].items() }
                 source.set_from_json('data', value, models=references, setter=setter)
 
             elif event_json['kind'] == 'ColumnsStreamed':
@@ -423,7 +439,7 @@ class Document(object):
                 if source_id not in self._all_models:
                     raise RuntimeError("Cannot stream to %s which is not in the document" % (str(source_id)))
                 source = self._all_models[source_id]
-                data = event_json['data']
+                data = { name: _decode_binary_array(values, buffers) for name, values in event_json['data'].items() }
                 rollover = event_json.get('rollover', None)
                 source._stream(data, rollover, setter)
 
@@ -432,7 +448,8 @@ class Document(object):
                 if source_id not in self._all_models:
                     raise RuntimeError("Cannot apply patch to %s which is not in the document" % (str(source_id)))
                 source = self._all_models[source_id]
-                patches = event_json['patches']
+                patches = { name: [ (_decode_patch_index(index), _decode_binary_array(value, buffers)) for index, value in patch ]
+                            for name, patch in event_json['patches'].items() }
                 source.patch(patches, setter)
 
             elif event_json['kind'] == 'RootAdded':
@@ -491,6 +508,7 @@ class Document(object):
         self._roots = []
         self._all_models = None
         self._all_models_by_name = None
+        self._models_to_validate = set()
         self._theme = None
         self._template = None
         self._session_context = None
@@ -780,6 +798,8 @@ class Document(object):
         self._push_all_models_freeze()
         try:
             self._roots.remove(model)
+            self._update_model_references(model, None)
+            self._models_to_validate.add(model)
         finally:
             self._pop_all_models_freeze()
         self._trigger_on_change(RootRemovedEvent(self, model, setter))
@@ -876,11 +896,7 @@ class Document(object):
             JSON-data
 
         '''
-
-        # this is a total hack to go via a string, needed because
-        # our BokehJSONEncoder goes straight to a string.
-        doc_json = self.to_json_string()
-        return loads(doc_json)
+        return to_json_compatible(self._to_json_like())
 
     def to_json_string(self, indent=None) -> str:
         ''' Convert the document to a JSON string.
@@ -893,33 +909,23 @@ class Document(object):
             str
 
         '''
-        root_ids = []
-        for r in self._roots:
-            root_ids.append(r.id)
-
-        root_references = self._all_models.values()
-
-        json = {
-            'title' : self.title,
-            'roots' : {
-                'root_ids' : root_ids,
-                'references' : references_json(root_references)
-            },
-            'version' : __version__
-        }
-
-        return serialize_json(json, indent=indent)
+        return serialize_json(self._to_json_like(), indent=indent)
 
     def validate(self):
-        ''' Perform integrity checks on the modes in this document.
+        ''' Perform integrity checks on the models in this document.
+
+        Only the models that were added to this document or changed since
+        the last validation, and the models that refer to those (directly or
+        not), are checked again.
 
         Returns:
             None
 
         '''
-        for r in self.roots:
-            refs = r.references()
-            check_integrity(refs)
+        pending = [ m for m in self._models_to_validate if self._all_models.get(m.id) is m ]
+        self._models_to_validate = set()
+        if pending:
+            check_integrity(self._models_referring_to(pending))
 
     # Private methods ---------------------------------------------------------
 
@@ -964,6 +970,35 @@ class Document(object):
 
         return callback_obj
 
+    def _copy_to(self, dest_doc):
+        ''' Add structural copies of all roots in this doc to the dest_doc.
+
+        The copied models have new IDs, and share any NumPy array buffers with
+        the models in this doc (see ``copy_references``). Python callbacks are
+        not copied.
+
+        Args:
+            dest_doc (Document) :
+                The Bokeh document to populate with copies of this one
+
+        Returns:
+            None
+
+        '''
+
+        if dest_doc is self:
+            raise RuntimeError("Attempted to copy a document into itself")
+
+        copies = copy_references(self._all_models.values())
+
+        dest_doc.title = self.title
+        dest_doc.template = self.template
+        dest_doc.template_variables.update(self.template_variables)
+        dest_doc.theme = self.theme
+
+        for r in self.roots:
+            dest_doc.add_root(copies[r.id])
+
     def _destructively_move(self, dest_doc):
         ''' Move all data in this doc to the dest_doc, leaving this doc empty.
 
@@ -1002,14 +1037,57 @@ class Document(object):
 
         dest_doc.title = self.title
 
-    def _invalidate_all_models(self):
+    def _add_model_references(self, models):
+        ''' Count one more reference to each of ``models``, attaching any that
+        are new to this document together with everything they newly reach.
+
+        '''
+        if self._all_models_stale:
+            return
+
+        refcounts = self._all_models_refcounts
+        queued = deque(models)
+        while queued:
+            model = queued.popleft()
+            if model.id in refcounts:
+                refcounts[model.id] += 1
+                continue
+            refcounts[model.id] = 1
+            self._attach_model(model)
+            _visit_immediate_value_references(model, queued.append)
+
+    def _attach_model(self, model):
+        '''
+
+        '''
+        self._all_models[model.id] = model
+        if model.name is not None:
+            self._all_models_by_name.add_value(model.name, model)
+        self._models_to_validate.add(model)
+        model._attach_document(self)
+
+    def _detach_model(self, model):
+        '''
+
         '''
+        del self._all_models[model.id]
+        if model.name is not None:
+            self._all_models_by_name.remove_value(model.name, model)
+        self._all_former_model_ids.add(model.id)
+        self._models_to_validate.discard(model)
+        model._detach_document()
+
+    def _invalidate_all_models(self):
+        ''' Recompute the all-models index from the roots, or mark it stale
+        to be recomputed when the outermost freeze is popped.
 
         '''
 
         # if freeze count is > 0, we'll recompute on unfreeze
         if self._all_models_freeze_count == 0:
             self._recompute_all_models()
+        else:
+            self._all_models_stale = True
 
     def _is_single_string_selector(self, selector, field):
         '''
@@ -1022,10 +1100,33 @@ class Document(object):
             return False
         return isinstance(selector[field], str)
 
+    def _models_referring_to(self, models):
+        ''' The given models, and all models of this document that refer to
+        any of them, directly or through other models.
+
+        Validators may look at all models that a model refers to, so these
+        are the models that a change to ``models`` can affect.
+
+        '''
+        referrers = defaultdict(list)
+        for model in self._all_models.values():
+            _visit_immediate_value_references(model, lambda ref: referrers[ref.id].append(model))
+
+        found = { m.id: m for m in models }
+        queued = list(found.values())
+        while queued:
+            for referrer in referrers[queued.pop().id]:
+                if referrer.id not in found:
+                    found[referrer.id] = referrer
+                    queued.append(referrer)
+        return list(found.values())
+
     def _notify_change(self, model, attr, old, new, hint=None, setter=None, callback_invoker=None):
         ''' Called by Model when it changes
 
         '''
+        self._models_to_validate.add(model)
+
         # if name changes, update by-name index
         if attr == 'name':
             if old is not None:
@@ -1052,33 +1153,107 @@ class Document(object):
 
         '''
         self._all_models_freeze_count -= 1
-        if self._all_models_freeze_count == 0:
+        if self._all_models_freeze_count == 0 and self._all_models_stale:
             self._recompute_all_models()
 
     def _recompute_all_models(self):
-        '''
+        ''' Rebuild the all-models index and its reference counts by walking
+        the entire graph from the roots.
+
+        This is only needed when the index could not be kept up to date
+        incrementally, see ``_update_model_references``.
 
         '''
-        new_all_models_set = set()
-        for r in self.roots:
-            new_all_models_set = new_all_models_set.union(r.references())
+        new_all_models_set = set(collect_models(*self.roots))
         old_all_models_set = set(self._all_models.values())
         to_detach = old_all_models_set - new_all_models_set
         to_attach = new_all_models_set - old_all_models_set
 
         recomputed = {}
         recomputed_by_name = MultiValuedDict()
+        refcounts = dict.fromkeys((m.id for m in new_all_models_set), 0)
+        def count(obj):
+            refcounts[obj.id] += 1
+        _visit_value_and_its_immediate_references(self.roots, count)
         for m in new_all_models_set:
             recomputed[m.id] = m
             if m.name is not None:
                 recomputed_by_name.add_value(m.name, m)
+            _visit_immediate_value_references(m, count)
         for d in to_detach:
             self._all_former_model_ids.add(d.id)
+            self._models_to_validate.discard(d)
             d._detach_document()
         for a in to_attach:
+            self._models_to_validate.add(a)
             a._attach_document(self)
         self._all_models = recomputed
         self._all_models_by_name = recomputed_by_name
+        self._all_models_refcounts = refcounts
+        self._all_models_stale = False
+
+    def _remove_model_references(self, models):
+        ''' Drop one reference to each of ``models``, detaching whatever part
+        of the graph reachable from them is no longer reachable from a root.
+
+        '''
+        if self._all_models_stale:
+            return
+
+        refcounts = self._all_models_refcounts
+        for model in models:
+            if refcounts.get(model.id, 0) <= 0:
+                # the index has drifted from the graph (e.g. a nested value was
+                # mutated in place without a change notification), start over
+                self._invalidate_all_models()
+                return
+            refcounts[model.id] -= 1
+
+        # Reference cycles can keep counts above zero, so find which of the
+        # candidates are still referenced from outside the candidate subgraph,
+        # and detach everything those do not reach.
+        candidates = { m.id: m for m in collect_models(*models) }
+        if any(model_id not in refcounts for model_id in candidates):
+            self._invalidate_all_models()
+            return
+
+        internal = dict.fromkeys(candidates, 0)
+        def count(obj):
+            internal[obj.id] += 1
+        for model in candidates.values():
+            _visit_immediate_value_references(model, count)
+
+        external = [ m for model_id, m in candidates.items() if refcounts[model_id] > internal[model_id] ]
+        alive = { m.id for m in collect_models(*external) }
+        unreachable = [ m for model_id, m in candidates.items() if model_id not in alive ]
+
+        def release(obj):
+            if obj.id in refcounts:
+                refcounts[obj.id] -= 1
+        for model in unreachable:
+            del refcounts[model.id]
+        for model in unreachable:
+            _visit_immediate_value_references(model, release)
+        for model in unreachable:
+            self._detach_model(model)
+
+    def _update_model_references(self, old, new):
+        ''' Update the all-models index for a property value (or a root) that
+        changed from ``old`` to ``new``, only visiting the parts of the graph
+        that were added or released by the change.
+
+        '''
+        old_refs, new_refs = [], []
+        _visit_value_and_its_immediate_references(old, old_refs.append)
+        _visit_value_and_its_immediate_references(new, new_refs.append)
+        if not (old_refs or new_refs):
+            return
+
+        old_refs, new_refs = Counter(old_refs), Counter(new_refs)
+        # add before removing, so that models that only moved within the graph
+        # are never detached
+        self._add_model_references(list((new_refs - old_refs).elements()))
+        self._remove_model_references(list((old_refs - new_refs).elements()))
 
     def _remove_session_callback(self, callback_obj, originator):
         ''' Remove a callback added earlier with ``add_periodic_callback``,
@@ -1117,6 +1292,26 @@ class Document(object):
             self._title = title
             self._trigger_on_change(TitleChangedEvent(self, title, setter))
 
+    def _to_json_like(self):
+        ''' Return the document as a dictionary that still contains Bokeh and
+        NumPy types, to be converted by ``to_json`` or ``to_json_string``.
+
+        '''
+        root_ids = []
+        for r in self._roots:
+            root_ids.append(r.id)
+
+        root_references = self._all_models.values()
+
+        return {
+            'title' : self.title,
+            'roots' : {
+                'root_ids' : root_ids,
+                'references' : references_json(root_references)
+            },
+            'version' : __version__
+        }
+
     def _trigger_on_change(self, event):
         '''
 
@@ -1191,6 +1386,12 @@ def _combine_document_events(new_event, old_events):
         if event.combine(new_event):
             return
 
+        # don't combine with any events before an earlier change to the same
+        # attribute that could not be combined (e.g. a stream followed by a
+        # patch), since that would re-order the changes to the attribute
+        if _is_same_attr_change(event, new_event):
+            break
+
     # no combination was possible
     old_events.append(new_event)
 
@@ -1198,6 +1399,23 @@ def _combine_document_events(new_event, old_events):
 # Private API
 #-----------------------------------------------------------------------------
 
+def _decode_binary_array(value, buffers):
+    if buffers and isinstance(value, dict):
+        if '__buffer__' in value:
+            return decode_binary_dict(value, buffers)
+        if '__ragged__' in value:
+            return decode_ragged_dict(value, buffers)
+    return value
+
+def _decode_patch_index(index):
+    if isinstance(index, dict):
+        return slice(index.get('start'), index.get('stop'), index.get('step'))
+    return index
+
+def _is_same_attr_change(event1, event2):
+    return (isinstance(event1, ModelChangedEvent) and isinstance(event2, ModelChangedEvent) and
+            event1.model is event2.model and event1.attr == event2.attr)
+
 #-----------------------------------------------------------------------------
 # Code
 #-----------------------------------------------------------------------------
@@ -25,9 +25,17 @@ log = logging.getLogger(__name__)
 # Standard library imports
 from typing import Any, Union
 
+# External imports
+import numpy as np
+
 # Bokeh imports
 from ..util.dependencies import import_optional
-from ..util.serialization import make_id
+from ..util.serialization import (
+    BINARY_ARRAY_TYPES,
+    make_id,
+    transform_array,
+    transform_series,
+)
 
 #-----------------------------------------------------------------------------
 # Globals and constants
@@ -250,7 +258,11 @@ class ModelChangedEvent(DocumentPatchedEvent):
         if self.document != event.document: return False
 
         if self.hint:
-            return self.hint.combine(event.hint)
+            if self.hint.combine(event.hint):
+                self.new = event.new
+                self.callback_invoker = event.callback_invoker
+                return True
+            return False
 
         if (self.model == event.model) and (self.attr == event.attr):
             self.new = event.new
@@ -456,6 +468,48 @@ class ColumnsStreamedEvent(DocumentPatchedEvent):
         self.data = data
         self.rollover = rollover
 
+    def combine(self, event):
+        ''' Combine with a subsequent stream to the same data source.
+
+        The data streamed by both events is concatenated. Streams can only be
+        combined if the result is identical to applying both streams one after
+        the other, i.e. if the rollover of ``event`` is the same as, or tighter
+        than, the rollover of this event (or neither has a rollover).
+
+        '''
+        if not isinstance(event, ColumnsStreamedEvent): return False
+
+        # If these are not true something weird is going on, maybe updates from
+        # Python bokeh.client, don't try to combine
+        if self.setter != event.setter: return False
+        if self.document != event.document: return False
+
+        if self.column_source is not event.column_source: return False
+        if set(self.data) != set(event.data): return False
+
+        if event.rollover is None:
+            if self.rollover is not None: return False
+        elif self.rollover is not None and event.rollover > self.rollover:
+            return False
+
+        rollover = event.rollover
+        data = {}
+        for name, old_values in self.data.items():
+            new_values = event.data[name]
+            if _is_array(old_values) or _is_array(new_values):
+                values = np.append(old_values, new_values)
+            else:
+                values = list(old_values) + list(new_values)
+            # only the last ``rollover`` rows are ever visible
+            if rollover and len(values) > rollover:
+                values = values[-rollover:]
+            data[name] = values
+
+        self.data = data
+        self.rollover = rollover
+        self.callback_invoker = event.callback_invoker
+        return True
+
     def dispatch(self, receiver):
         ''' Dispatch handling of this event to a receiver.
 
@@ -495,9 +549,13 @@ class ColumnsStreamedEvent(DocumentPatchedEvent):
                 modified in-place.
 
         '''
+        data = self.data
+        if buffers is not None:
+            data = { name: _encode_binary_array(values, buffers) for name, values in data.items() }
+
         return { 'kind'          : 'ColumnsStreamed',
                  'column_source' : self.column_source.ref,
-                 'data'          : self.data,
+                 'data'          : data,
                  'rollover'      : self.rollover }
 
 class ColumnsPatchedEvent(DocumentPatchedEvent):
@@ -573,9 +631,14 @@ class ColumnsPatchedEvent(DocumentPatchedEvent):
                 modified in-place.
 
         '''
+        patches = self.patches
+        if buffers is not None and isinstance(patches, dict):
+            patches = { name: [ (index, _encode_binary_array(value, buffers)) for index, value in patch ]
+                        for name, patch in patches.items() }
+
         return { 'kind'          : 'ColumnsPatched',
                  'column_source' : self.column_source.ref,
-                 'patches'       : self.patches }
+                 'patches'       : patches }
 
 class TitleChangedEvent(DocumentPatchedEvent):
     ''' A concrete event representing a change to the title of a Bokeh
@@ -848,6 +911,21 @@ class SessionCallbackRemoved(DocumentChangedEvent):
 # Private API
 #-----------------------------------------------------------------------------
 
+def _is_array(values):
+    return isinstance(values, np.ndarray) or (pd and isinstance(values, (pd.Series, pd.Index)))
+
+def _encode_binary_array(values, buffers):
+    ''' Encode NumPy arrays (and Pandas series) with a binary dtype as binary
+    buffers. Any other values are returned as-is, to be converted by the JSON
+    encoder as usual.
+
+    '''
+    if pd and isinstance(values, (pd.Series, pd.Index)):
+        return transform_series(values, buffers=buffers)
+    if isinstance(values, np.ndarray) and values.dtype in BINARY_ARRAY_TYPES:
+        return transform_array(values, buffers=buffers)
+    return values
+
 #-----------------------------------------------------------------------------
 # Code
 #-----------------------------------------------------------------------------
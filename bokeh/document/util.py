@@ -19,15 +19,24 @@ log = logging.getLogger(__name__)
 # Imports
 #-----------------------------------------------------------------------------
 
+# Standard library imports
+from copy import deepcopy
+
+# External imports
+import numpy as np
+
 # Bokeh imports
 from ..core.has_props import HasProps
-from ..model import get_class
+from ..core.property.validation import validate
+from ..core.property.wrappers import PropertyValueContainer
+from ..model import Model, get_class
 
 #-----------------------------------------------------------------------------
 # Globals and constants
 #-----------------------------------------------------------------------------
 
 __all__ = (
+    'copy_references',
     'initialize_references_json',
     'instantiate_references_json',
     'references_json',
@@ -41,6 +50,63 @@ __all__ = (
 # Dev API
 #-----------------------------------------------------------------------------
 
+def copy_references(references):
+    ''' Given all the models in a graph, return structural copies of them
+    with new model IDs.
+
+    References between the models are replaced by references between their
+    copies. NumPy arrays are not copied, instead the copies get read-only
+    views that share the original buffers. Column data sources copy such
+    columns before they are patched in place, other in-place changes to the
+    arrays will raise an error.
+
+    Args:
+        references (seq[Model]) :
+            A list of all models to copy, including every model they refer to
+
+    Returns:
+        dict[str, Model] : a mapping of original model IDs to their copies
+
+    '''
+    copies = {}
+    for obj in references:
+        cls = obj.__class__
+        copies[obj.id] = cls.__new__(cls)
+
+    def copy_value(value):
+        if isinstance(value, (str, int, float, type(None))):
+            return value
+        if isinstance(value, Model):
+            return copies[value.id]
+        if isinstance(value, np.ndarray):
+            view = value.view()
+            view.flags.writeable = False
+            return view
+        if isinstance(value, dict):
+            return {k: copy_value(v) for k, v in value.items()}
+        if isinstance(value, list):
+            return [copy_value(v) for v in value]
+        if isinstance(value, tuple):
+            return tuple(copy_value(v) for v in value)
+        return deepcopy(value)
+
+    # the values were validated when they were set on the original models
+    with validate(False):
+        for obj in references:
+            instance = copies[obj.id]
+
+            # like when loading from JSON, skip any Model specific initialization
+            HasProps.__init__(instance)
+
+            for name, value in _explicit_property_values(obj).items():
+                descriptor = instance.lookup(name)
+                value = descriptor.property.prepare_value(instance, name, copy_value(value))
+                if isinstance(value, PropertyValueContainer):
+                    value._register_owner(instance, descriptor)
+                instance._property_values[name] = value
+
+    return copies
+
 def initialize_references_json(references_json, references, setter=None):
     ''' Given a JSON representation of the models in a graph, and new model
     objects, set the properties on the models from the JSON
@@ -135,6 +201,17 @@ def references_json(references):
 # Private API
 #-----------------------------------------------------------------------------
 
+def _explicit_property_values(obj):
+    ''' Property values of a model that are not plain defaults, including
+    default values that are instances of other models (e.g. ``Plot.toolbar``).
+
+    '''
+    values = dict(obj._property_values)
+    for name, value in obj._unstable_default_values.items():
+        if name not in values and not isinstance(value, PropertyValueContainer):
+            values[name] = value
+    return values
+
 #-----------------------------------------------------------------------------
 # Code
 #-----------------------------------------------------------------------------
@@ -21,7 +21,13 @@ log = logging.getLogger(__name__)
 
 # Bokeh imports
 from .server import server_document, server_session
-from .standalone import autoload_static, components, file_html, json_item
+from .standalone import (
+    autoload_static,
+    batch_file_html,
+    components,
+    file_html,
+    json_item,
+)
 
 #-----------------------------------------------------------------------------
 # Globals and constants
@@ -29,6 +35,7 @@ from .standalone import autoload_static, components, file_html, json_item
 
 __all__ = (
     'autoload_static',
+    'batch_file_html',
     'components',
     'file_html',
     'json_item',
@@ -20,17 +20,18 @@ log = logging.getLogger(__name__)
 
 # Standard library imports
 import json
+from functools import lru_cache
 from os.path import abspath, basename, dirname, exists, join
 from typing import Dict, List, NamedTuple, Optional
 from warnings import warn
 
 # Bokeh imports
 from ..core.templates import CSS_RESOURCES, JS_RESOURCES
-from ..document.document import Document
 from ..model import Model
 from ..resources import BaseResources, Resources
 from ..settings import settings
 from ..util.compiler import bundle_models
+from .util import collect_all_models
 
 #-----------------------------------------------------------------------------
 # Globals and constants
@@ -89,10 +90,10 @@ class Bundle(object):
         yield self._render_css()
 
     def _render_js(self):
-        return JS_RESOURCES.render(js_files=self.js_files, js_raw=self.js_raw, hashes=self.hashes)
+        return _render_js_resources(tuple(self.js_files), tuple(self.js_raw), tuple(sorted(self.hashes.items())))
 
     def _render_css(self):
-        return CSS_RESOURCES.render(css_files=self.css_files, css_raw=self.css_raw)
+        return _render_css_resources(tuple(self.css_files), tuple(self.css_raw))
 
     def scripts(self, tag=True):
         if tag:
@@ -130,6 +131,19 @@ def bundle_for_objs_and_resources(objs, resources):
     Returns:
         Bundle
 
+    '''
+    # XXX: force all components on server and in notebook, because we don't know in advance what will be used
+    return _bundle_for_models(_all_objs(objs) if objs else None, resources)
+
+#-----------------------------------------------------------------------------
+# Private API
+#-----------------------------------------------------------------------------
+
+def _bundle_for_models(all_objs, resources):
+    ''' Generate rendered CSS and JS resources suitable for the given
+    collection of models, e.g. from ``_all_objs``, or for all models if
+    ``all_objs`` is None.
+
     '''
     # Any env vars will overide a local default passed in
     resources = settings.resources(default=resources)
@@ -151,10 +165,10 @@ def bundle_for_objs_and_resources(objs, resources):
 
     from copy import deepcopy
 
-    # XXX: force all components on server and in notebook, because we don't know in advance what will be used
-    use_widgets = _use_widgets(objs) if objs else True
-    use_tables  = _use_tables(objs)  if objs else True
-    use_gl      = _use_gl(objs)      if objs else True
+    if all_objs is not None:
+        use_gl, use_tables, use_widgets = _features(all_objs)
+    else:
+        use_gl = use_tables = use_widgets = True
 
     js_files = []
     js_raw = []
@@ -179,7 +193,7 @@ def bundle_for_objs_and_resources(objs, resources):
         css_raw.extend(css_resources.css_raw)
 
     if js_resources:
-        extensions = _bundle_extensions(objs, js_resources)
+        extensions = _bundle_extensions(all_objs, js_resources)
         mode = js_resources.mode if resources is not None else "inline"
         if mode == "inline":
             js_raw.extend([ Resources._inline(bundle.artifact_path) for bundle in extensions ])
@@ -190,36 +204,24 @@ def bundle_for_objs_and_resources(objs, resources):
         else:
             js_files.extend([ bundle.artifact_path for bundle in extensions ])
 
-    models = [ obj.__class__ for obj in _all_objs(objs) ] if objs else None
+    models = [ obj.__class__ for obj in all_objs ] if all_objs is not None else None
     ext = bundle_models(models)
     if ext is not None:
         js_raw.append(ext)
 
     return Bundle.of(js_files, js_raw, css_files, css_raw, js_resources.hashes if js_resources else {})
 
-#-----------------------------------------------------------------------------
-# Private API
-#-----------------------------------------------------------------------------
+# Inlined resources are multi-megabyte strings that are shared between bundles
+# (see ``BaseResources._inline``), so these are cheap to look up and expensive
+# to render. There are only a few distinct combinations of components.
 
-def _query_extensions(objs, query):
-    names = set()
+@lru_cache(maxsize=8)
+def _render_js_resources(js_files, js_raw, hashes):
+    return JS_RESOURCES.render(js_files=js_files, js_raw=js_raw, hashes=dict(hashes))
 
-    for obj in _all_objs(objs):
-        if hasattr(obj, "__implementation__"):
-            continue
-        name = obj.__view_module__.split(".")[0]
-        if name == "bokeh":
-            continue
-        if name in names:
-            continue
-        names.add(name)
-
-        for model in Model.model_class_reverse_map.values():
-            if model.__module__.startswith(name):
-                if query(model):
-                    return True
-
-    return False
+@lru_cache(maxsize=8)
+def _render_css_resources(css_files, css_raw):
+    return CSS_RESOURCES.render(css_files=css_files, css_raw=css_raw)
 
 _default_cdn_host = "https://unpkg.com"
 
@@ -230,13 +232,13 @@ class ExtensionEmbed(NamedTuple):
 
 extension_dirs: Dict[str, str] = {} # name -> path
 
-def _bundle_extensions(objs, resources: Resources) -> List[ExtensionEmbed]:
+def _bundle_extensions(all_objs, resources: Resources) -> List[ExtensionEmbed]:
     names = set()
     bundles = []
 
     extensions = [".min.js", ".js"] if resources.minified else [".js"]
 
-    for obj in _all_objs(objs) if objs is not None else Model.model_class_reverse_map.values():
+    for obj in all_objs if all_objs is not None else Model.model_class_reverse_map.values():
         if hasattr(obj, "__implementation__"):
             continue
         name = obj.__view_module__.split(".")[0]
@@ -300,37 +302,54 @@ def _bundle_extensions(objs, resources: Resources) -> List[ExtensionEmbed]:
     return bundles
 
 def _all_objs(objs):
-    all_objs = set()
-
-    for obj in objs:
-        if isinstance(obj, Document):
-            for root in obj.roots:
-                all_objs |= root.references()
-        else:
-            all_objs |= obj.references()
+    return collect_all_models(objs)
 
-    return all_objs
+class _Features(NamedTuple):
+    use_gl: bool
+    use_tables: bool
+    use_widgets: bool
 
-def _any(objs, query):
-    ''' Whether any of a collection of objects satisfies a given query predicate
+def _features(all_objs) -> _Features:
+    ''' Determine which optional BokehJS bundles a collection of Bokeh
+    objects needs, in a single pass over the objects.
 
     Args:
-        objs (seq[Model or Document]) :
-
-        query (callable)
+        all_objs (seq[Model]) :
+            All the models to consider, e.g. from ``_all_objs``
 
     Returns:
-        True, if ``query(obj)`` is True for some object in ``objs``, else False
+        _Features
 
     '''
-    for obj in objs:
-        if isinstance(obj, Document):
-            if _any(obj.roots, query):
-                return True
-        else:
-            if any(query(ref) for ref in obj.references()):
-                return True
-    return False
+    from ..models.plots import Plot
+    from ..models.widgets import TableWidget, Widget
+
+    use_gl = use_tables = use_widgets = False
+    ext_names = set()
+
+    for obj in all_objs:
+        if isinstance(obj, Widget):
+            use_widgets = True
+            if isinstance(obj, TableWidget):
+                use_tables = True
+        elif isinstance(obj, Plot) and obj.output_backend == "webgl":
+            use_gl = True
+
+        if not hasattr(obj, "__implementation__"):
+            name = obj.__view_module__.split(".")[0]
+            if name != "bokeh":
+                ext_names.add(name)
+
+    # models of extension packages may depend on the widgets or tables bundles,
+    # even if the objects do not use them directly
+    if ext_names and not (use_widgets and use_tables):
+        prefixes = tuple(ext_names)
+        for model in Model.model_class_reverse_map.values():
+            if model.__module__.startswith(prefixes):
+                use_widgets = use_widgets or issubclass(model, Widget)
+                use_tables = use_tables or issubclass(model, TableWidget)
+
+    return _Features(use_gl, use_tables, use_widgets)
 
 def _use_gl(objs):
     ''' Whether a collection of Bokeh objects contains a plot requesting WebGL
@@ -342,8 +361,7 @@ def _use_gl(objs):
         bool
 
     '''
-    from ..models.plots import Plot
-    return _any(objs, lambda obj: isinstance(obj, Plot) and obj.output_backend == "webgl")
+    return _features(_all_objs(objs)).use_gl
 
 def _use_tables(objs):
     ''' Whether a collection of Bokeh objects contains a TableWidget
@@ -355,8 +373,7 @@ def _use_tables(objs):
         bool
 
     '''
-    from ..models.widgets import TableWidget
-    return _any(objs, lambda obj: isinstance(obj, TableWidget)) or _ext_use_tables(objs)
+    return _features(_all_objs(objs)).use_tables
 
 def _use_widgets(objs):
     ''' Whether a collection of Bokeh objects contains a any Widget
@@ -368,16 +385,7 @@ def _use_widgets(objs):
         bool
 
     '''
-    from ..models.widgets import Widget
-    return _any(objs, lambda obj: isinstance(obj, Widget)) or _ext_use_widgets(objs)
-
-def _ext_use_tables(objs):
-    from ..models.widgets import TableWidget
-    return _query_extensions(objs, lambda cls: issubclass(cls, TableWidget))
-
-def _ext_use_widgets(objs):
-    from ..models.widgets import Widget
-    return _query_extensions(objs, lambda cls: issubclass(cls, Widget))
+    return _features(_all_objs(objs)).use_widgets
 
 #-----------------------------------------------------------------------------
 # Code
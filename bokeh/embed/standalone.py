@@ -19,7 +19,8 @@ log = logging.getLogger(__name__)
 #-----------------------------------------------------------------------------
 
 # Standard library imports
-from typing import Any, Dict, Optional, Sequence, Tuple, Type, Union, cast
+import multiprocessing
+from typing import Any, Dict, List, Optional, Sequence, Tuple, Type, Union, cast
 
 # External imports
 from jinja2 import Template
@@ -30,12 +31,13 @@ from ..document.document import DEFAULT_TITLE, Document
 from ..model import Model
 from ..resources import CSSResources, JSResources, Resources
 from ..themes import Theme
-from .bundle import Script, bundle_for_objs_and_resources
+from .bundle import Script, _bundle_for_models, bundle_for_objs_and_resources
 from .elements import html_page_for_render_items, script_for_render_items
 from .util import (
     FromCurdoc,
     OutputDocumentFor,
     RenderRoot,
+    collect_all_models,
     standalone_docs_json,
     standalone_docs_json_and_render_items,
 )
@@ -47,6 +49,7 @@ from .wrappers import wrap_in_onload
 
 __all__ = (
     'autoload_static',
+    'batch_file_html',
     'components',
     'file_html',
     'json_item',
@@ -292,13 +295,7 @@ def file_html(models: Union[Model, Document, Sequence[Model]],
 
     '''
 
-    models_seq: Sequence[Model] = []
-    if isinstance(models, Model):
-        models_seq = [models]
-    elif isinstance(models, Document):
-        models_seq = models.roots
-    else:
-        models_seq = models
+    models_seq = _models_seq(models)
 
     with OutputDocumentFor(models_seq, apply_theme=theme, always_new=_always_new) as doc:
         (docs_json, render_items) = standalone_docs_json_and_render_items(models_seq, suppress_callback_warning=suppress_callback_warning)
@@ -307,6 +304,104 @@ def file_html(models: Union[Model, Document, Sequence[Model]],
         return html_page_for_render_items(bundle, docs_json, render_items, title=title,
                                           template=template, template_variables=template_variables)
 
+def batch_file_html(items: Sequence[Union[Model, Document, Sequence[Model]]],
+                    resources: Union[Resources, Tuple[JSResources, CSSResources]],
+                    title: Optional[str] = None,
+                    template: Union[Template, str] = FILE,
+                    template_variables: Dict[str, Any] = {},
+                    theme: ThemeLike = FromCurdoc,
+                    suppress_callback_warning: bool = False,
+                    workers: int = 1) -> List[str]:
+    ''' Return an HTML document for each of many Bokeh Model or Document
+    objects.
+
+    This is equivalent to calling :func:`~bokeh.embed.file_html` for every
+    item, except that the JS/CSS resources are collected and rendered only
+    once, for all items together. Every document includes all resources that
+    are needed by any of the items (e.g. the BokehJS widgets bundle, if any
+    item contains a widget).
+
+    With more than one worker, the items are serialized and rendered in a
+    pool of worker processes that are forked from the current process, so
+    that the items do not have to be sent to the workers. This is only
+    possible on platforms that support ``fork``, and should be avoided in
+    processes that run other threads (e.g. a Bokeh server).
+
+    To embed many items in a single HTML document, pass all of them to
+    :func:`~bokeh.embed.components` at once, instead.
+
+    Args:
+        items (seq[Model or Document or seq[Model]]) :
+            Bokeh objects to render, one HTML document for each item
+
+        resources (Resources or tuple(JSResources or None, CSSResources or None)) :
+            A resource configuration for Bokeh JS & CSS assets.
+
+        title (str, optional) :
+            A title for the HTML document ``<title>`` tags or None. (default: None)
+
+            If None, attempt to automatically find the Document title from the
+            objects of each item.
+
+        template (Template, optional) : HTML document template (default: FILE)
+            A Jinja2 Template, see bokeh.core.templates.FILE for the required
+            template parameters
+
+        template_variables (dict, optional) : variables to be used in the Jinja2
+            template. If used, the following variable names will be overwritten:
+            title, bokeh_js, bokeh_css, plot_script, plot_div
+
+        theme (Theme, optional) :
+            Defaults to the ``Theme`` instance in the current document.
+            Setting this to ``None`` uses the default theme or the theme
+            already specified in the document. Any other value must be an
+            instance of the ``Theme`` class.
+
+        suppress_callback_warning (bool, optional) :
+            Normally generating standalone HTML from a Bokeh Document that has
+            Python callbacks will result in a warning stating that the callbacks
+            cannot function. However, this warning can be suppressed by setting
+            this value to True (default: False)
+
+        workers (int, optional) :
+            The number of worker processes to render the items in. (default: 1)
+
+            If 1, the items are rendered in the current process.
+
+    Returns:
+        list[str] : UTF-8 encoded HTML, in the order of ``items``
+
+    '''
+    if workers < 1:
+        raise ValueError("workers must be >= 1")
+    if workers > 1 and "fork" not in multiprocessing.get_all_start_methods():
+        log.warning("Rendering items in the current process, because worker processes can not be forked on this platform")
+        workers = 1
+
+    items_seq = [_models_seq(item) for item in items]
+    options = dict(title=title, template=template, template_variables=template_variables, theme=theme,
+                   suppress_callback_warning=suppress_callback_warning)
+
+    if workers > 1 and len(items_seq) > 1:
+        bundle = _bundle_for_models(collect_all_models([obj for models_seq in items_seq for obj in models_seq]), resources)
+        return _render_batch_in_workers(items_seq, bundle, options, workers)
+
+    # the models of each item are collected from its output document, which
+    # indexes them anyway, so that their references are only traversed once
+    all_models = set()
+    rendered = []
+    for models_seq in items_seq:
+        with OutputDocumentFor(models_seq, apply_theme=theme) as doc:
+            all_models.update(collect_all_models([doc]))
+            (docs_json, render_items) = standalone_docs_json_and_render_items(models_seq, suppress_callback_warning=suppress_callback_warning)
+            rendered.append((docs_json, render_items, _title_from_models(models_seq, title)))
+
+    bundle = _bundle_for_models(all_models, resources)
+
+    return [ html_page_for_render_items(bundle, docs_json, render_items, title=page_title,
+                                        template=template, template_variables=template_variables)
+             for (docs_json, render_items, page_title) in rendered ]
+
 def json_item(model: Model, target: Optional[str] = None, theme: ThemeLike = FromCurdoc) -> Any: # TODO: TypedDict?
     ''' Return a JSON block that can be used to embed standalone Bokeh content.
 
@@ -387,6 +482,28 @@ def json_item(model: Model, target: Optional[str] = None, theme: ThemeLike = Fro
 # Private API
 #-----------------------------------------------------------------------------
 
+# state for the forked workers of batch_file_html, which is inherited by the
+# workers, rather than sent to them
+_batch_state = None
+
+def _render_batch_in_workers(items_seq, bundle, options, workers):
+    global _batch_state
+    _batch_state = (items_seq, bundle, options)
+    try:
+        with multiprocessing.get_context("fork").Pool(workers) as pool:
+            return pool.map(_render_batch_item, range(len(items_seq)))
+    finally:
+        _batch_state = None
+
+def _render_batch_item(index):
+    items_seq, bundle, options = _batch_state
+    models_seq = items_seq[index]
+    with OutputDocumentFor(models_seq, apply_theme=options["theme"]):
+        (docs_json, render_items) = standalone_docs_json_and_render_items(models_seq,
+                                                                          suppress_callback_warning=options["suppress_callback_warning"])
+        return html_page_for_render_items(bundle, docs_json, render_items, title=_title_from_models(models_seq, options["title"]),
+                                          template=options["template"], template_variables=options["template_variables"])
+
 def _check_models_or_docs(models: Union[ModelLike, ModelLikeCollection]) -> ModelLikeCollection:
     '''
 
@@ -413,6 +530,14 @@ def _check_models_or_docs(models: Union[ModelLike, ModelLikeCollection]) -> Mode
 
     return models
 
+def _models_seq(models: Union[Model, Document, Sequence[Model]]) -> Sequence[Model]:
+    if isinstance(models, Model):
+        return [models]
+    elif isinstance(models, Document):
+        return models.roots
+    else:
+        return models
+
 def _title_from_models(models: Sequence[Union[Model, Document]], title: Optional[str]) -> str:
     # use override title
     if title is not None:
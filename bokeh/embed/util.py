@@ -34,6 +34,7 @@ from ..util.serialization import make_globally_unique_id
 #-----------------------------------------------------------------------------
 
 __all__ = (
+    'collect_all_models',
     'FromCurdoc',
     'OutputDocumentFor',
     'RenderItem',
@@ -52,6 +53,42 @@ __all__ = (
 # Dev API
 #-----------------------------------------------------------------------------
 
+def collect_all_models(objs):
+    ''' Collect all models referred to by a collection of Models and Documents.
+
+    The models of a Document, and of Models that include all the roots of
+    their Document, are looked up in the index the Document keeps, rather
+    than by traversing references. In particular, this is the case for the
+    models inside ``OutputDocumentFor``.
+
+    Args:
+        objs (seq[Model or Document]) :
+
+    Returns:
+        set[Model]
+
+    '''
+    all_models = set()
+    by_doc = {}
+    pending = []
+
+    for obj in objs:
+        if isinstance(obj, Document):
+            all_models.update(obj._all_models.values())
+        elif obj.document is not None:
+            by_doc.setdefault(obj.document, []).append(obj)
+        else:
+            pending.append(obj)
+
+    for doc, models in by_doc.items():
+        if doc.roots and set(doc.roots).issubset(models):
+            all_models.update(doc._all_models.values())
+        else:
+            pending.extend(models)
+
+    all_models.update(collect_models(*pending))
+    return all_models
+
 class FromCurdoc(object):
     ''' This class merely provides a non-None default value for ``theme``
     arguments, since ``None`` itself is a meaningful value for users to pass.
@@ -304,7 +341,7 @@ def submodel_has_python_callbacks(models):
 
     '''
     has_python_callback = False
-    for model in collect_models(models):
+    for model in collect_all_models(models):
         if len(model._callbacks) > 0 or len(model._event_callbacks) > 0:
             has_python_callback = True
             break
@@ -338,6 +375,7 @@ def _create_temp_doc(models):
         for ref in m.references():
             doc._all_models[ref.id] = ref
             ref._temp_document = doc
+    doc._models_to_validate.update(doc._all_models.values())
     doc._roots = models
     return doc
 
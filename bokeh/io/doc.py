@@ -18,12 +18,17 @@ log = logging.getLogger(__name__)
 # Imports
 #-----------------------------------------------------------------------------
 
+# Standard library imports
+import threading
+from contextlib import contextmanager
+
 #-----------------------------------------------------------------------------
 # Globals and constants
 #-----------------------------------------------------------------------------
 
 __all__ = (
     'curdoc',
+    'isolated_curdoc',
     'set_curdoc',
 )
 
@@ -38,6 +43,8 @@ def curdoc():
         Document : the current default document object.
 
     '''
+    if getattr(_thread_curdoc, "isolated", False):
+        return _thread_curdoc.document
     from .state import curstate
     return curstate().document
 
@@ -58,13 +65,36 @@ def set_curdoc(doc):
         Calling this function will replace any existing document.
 
     '''
+    if getattr(_thread_curdoc, "isolated", False):
+        _thread_curdoc.document = doc
+        return
     from .state import curstate
     curstate().document = doc
 
+@contextmanager
+def isolated_curdoc():
+    ''' Give the current thread its own current document while the context
+    is active.
+
+    Inside the context, ``curdoc()`` and ``set_curdoc()`` in this thread do
+    not affect, and are not affected by, other threads. This allows e.g. the
+    Bokeh server to run application code in worker threads.
+
+    '''
+    old = getattr(_thread_curdoc, "isolated", False), getattr(_thread_curdoc, "document", None)
+    _thread_curdoc.document = curdoc()
+    _thread_curdoc.isolated = True
+    try:
+        yield
+    finally:
+        _thread_curdoc.isolated, _thread_curdoc.document = old
+
 #-----------------------------------------------------------------------------
 # Private API
 #-----------------------------------------------------------------------------
 
+_thread_curdoc = threading.local()
+
 #-----------------------------------------------------------------------------
 # Code
 #-----------------------------------------------------------------------------
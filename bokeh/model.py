@@ -19,13 +19,13 @@ log = logging.getLogger(__name__)
 #-----------------------------------------------------------------------------
 
 # Standard library imports
+from collections import deque
 from inspect import isclass
-from json import loads
 from operator import itemgetter
 
 # Bokeh imports
 from .core.has_props import HasProps, abstract
-from .core.json_encoder import serialize_json
+from .core.json_encoder import serialize_json, to_json_compatible
 from .core.properties import Any, Dict, Instance, List, String
 from .events import Event
 from .themes import default as default_theme
@@ -75,17 +75,24 @@ def collect_filtered_models(discard, *input_values):
 
     ids = set([])
     collected = []
-    queued = []
+    queued = deque()
 
-    def queue_one(obj):
-        if obj.id not in ids and not (callable(discard) and discard(obj)):
-            queued.append(obj)
+    if callable(discard):
+        def queue_one(obj):
+            if obj.id not in ids and not discard(obj):
+                queued.append(obj)
+    else:
+        def queue_one(obj):
+            if obj.id not in ids:
+                queued.append(obj)
 
     for value in input_values:
         _visit_value_and_its_immediate_references(value, queue_one)
 
+    # a deque keeps the breadth-first order while popping from the front in
+    # constant time, so the traversal is linear in the number of references
     while queued:
-        obj = queued.pop(0)
+        obj = queued.popleft()
         if obj.id not in ids:
             ids.add(obj.id)
             collected.append(obj)
@@ -136,11 +143,16 @@ def get_class(view_model_name):
 
     # in order to look up from the model catalog that Model maintains, it
     # has to be creates first. These imports ensure that all built-in Bokeh
-    # models are represented in the catalog.
+    # models are represented in the catalog. The models are imported lazily,
+    # so all of them are only imported if the name is not found otherwise.
     from . import models; models
     from .plotting import Figure; Figure
 
     d = Model.model_class_reverse_map
+    if view_model_name not in d:
+        for name in models.__all__:
+            getattr(models, name)
+
     if view_model_name in d:
         return d[view_model_name]
     else:
@@ -608,7 +620,11 @@ class Model(HasProps, PropertyCallbackManager, EventCallbackManager):
                 that haven't been changed from the default
 
         '''
-        return loads(self.to_json_string(include_defaults=include_defaults))
+        json_like = self._to_json_like(include_defaults=include_defaults)
+        json_like['id'] = self.id
+        # to_json_compatible converts all types into plain JSON types in the
+        # same way serialize_json does, without a round trip through a string
+        return to_json_compatible(json_like)
 
     def to_json_string(self, include_defaults):
         ''' Returns a JSON string encoding the attributes of this object.
@@ -648,15 +664,8 @@ class Model(HasProps, PropertyCallbackManager, EventCallbackManager):
         # this may need to be further refined in the future, if the
         # assumption does not hold for future hinted events (e.g. the hint
         # could specify explicitly whether to do normal invalidation or not)
-        if hint is None:
-            dirty = { 'count' : 0 }
-            def mark_dirty(obj):
-                dirty['count'] += 1
-            if self._document is not None:
-                _visit_value_and_its_immediate_references(new, mark_dirty)
-                _visit_value_and_its_immediate_references(old, mark_dirty)
-                if dirty['count'] > 0:
-                    self._document._invalidate_all_models()
+        if hint is None and self._document is not None:
+            self._document._update_model_references(old, new)
         # chain up to invoke callbacks
         super().trigger(attr, old, new, hint=hint, setter=setter)
 
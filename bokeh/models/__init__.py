@@ -14,6 +14,10 @@ serialized, and it is this serialized graph that the client library
 BokehJS uses to render the plot. The low-level objects that comprise
 a Bokeh scene graph are called :ref:`Models <bokeh.model>`.
 
+The models are imported from their submodules when they are first accessed,
+so that importing ``bokeh.models`` does not create every model class up
+front.
+
 '''
 # This file is excluded from flake8 checking in setup.cfg
 
@@ -27,41 +31,126 @@ log = logging.getLogger(__name__)
 # Imports
 #-----------------------------------------------------------------------------
 
+# Standard library imports
+import sys
+from importlib import import_module
+
 # Bokeh imports
 from ..core.property.dataspec import expr, field, value  # Legacy API
 from ..model import Model
-from .annotations import *
-from .arrow_heads import *
-from .axes import *
-from .callbacks import *
-from .expressions import *
-from .filters import *
-from .formatters import *
-from .glyphs import *
-from .graphs import *
-from .grids import *
-from .layouts import *
-from .map_plots import *
-from .mappers import *
-from .markers import *
-from .plots import *
-from .ranges import *
-from .renderers import *
-from .scales import *
-from .selections import *
-from .sources import *
-from .textures import *
-from .tickers import *
-from .tiles import *
-from .tools import *
-from .transforms import *
-from .widgets import *  # lgtm [py/polluting-import]
+from . import widgets
 
 #-----------------------------------------------------------------------------
 # Globals and constants
 #-----------------------------------------------------------------------------
 
-# __all__ = include all explicit transitive imports above
+# the public names of each submodule, which must match its __all__
+_MODELS = {
+    'annotations': (
+        'Annotation', 'Arrow', 'Band', 'BoxAnnotation', 'ColorBar', 'Label', 'LabelSet',
+        'Legend', 'LegendItem', 'PolyAnnotation', 'Slope', 'Span', 'TextAnnotation', 'Title',
+        'Tooltip', 'ToolbarPanel', 'Whisker',
+    ),
+    'arrow_heads': (
+        'ArrowHead', 'NormalHead', 'OpenHead', 'TeeHead', 'VeeHead',
+    ),
+    'axes': (
+        'Axis', 'CategoricalAxis', 'ContinuousAxis', 'DatetimeAxis', 'LinearAxis', 'LogAxis',
+        'MercatorAxis',
+    ),
+    'callbacks': (
+        'Callback', 'OpenURL', 'CustomJS',
+    ),
+    'expressions': (
+        'CumSum', 'Expression', 'Stack',
+    ),
+    'filters': (
+        'BooleanFilter', 'CustomJSFilter', 'Filter', 'GroupFilter', 'IndexFilter',
+    ),
+    'formatters': (
+        'TickFormatter', 'BasicTickFormatter', 'MercatorTickFormatter', 'NumeralTickFormatter',
+        'PrintfTickFormatter', 'LogTickFormatter', 'CategoricalTickFormatter',
+        'FuncTickFormatter', 'DatetimeTickFormatter',
+    ),
+    'glyphs': (
+        'AnnularWedge', 'Annulus', 'Arc', 'Bezier', 'ConnectedXYGlyph', 'Ellipse', 'Glyph',
+        'HArea', 'HBar', 'HexTile', 'Image', 'ImageRGBA', 'ImageURL', 'Line', 'MultiLine',
+        'MultiPolygons', 'Oval', 'Patch', 'Patches', 'Quad', 'Quadratic', 'Ray', 'Rect',
+        'Segment', 'Step', 'Text', 'VArea', 'VBar', 'Wedge', 'XYGlyph',
+    ),
+    'graphs': (
+        'EdgesAndLinkedNodes', 'GraphHitTestPolicy', 'LayoutProvider', 'NodesAndLinkedEdges',
+        'NodesOnly', 'StaticLayoutProvider',
+    ),
+    'grids': (
+        'Grid',
+    ),
+    'layouts': (
+        'Box', 'Column', 'GridBox', 'HTMLBox', 'LayoutDOM', 'Panel', 'Row', 'Spacer', 'Tabs',
+        'WidgetBox',
+    ),
+    'map_plots': (
+        'GMapOptions', 'GMapPlot', 'MapOptions', 'MapPlot',
+    ),
+    'mappers': (
+        'Mapper', 'ColorMapper', 'CategoricalMapper', 'CategoricalColorMapper',
+        'CategoricalMarkerMapper', 'CategoricalPatternMapper', 'ContinuousColorMapper',
+        'LinearColorMapper', 'LogColorMapper',
+    ),
+    'markers': (
+        'Asterisk', 'Circle', 'CircleCross', 'CircleX', 'Cross', 'Dash', 'Diamond',
+        'DiamondCross', 'Hex', 'InvertedTriangle', 'Marker', 'Scatter', 'Square', 'SquareCross',
+        'SquareX', 'Triangle', 'X',
+    ),
+    'plots': (
+        'Plot',
+    ),
+    'ranges': (
+        'DataRange', 'DataRange1d', 'FactorRange', 'Range', 'Range1d',
+    ),
+    'renderers': (
+        'DataRenderer', 'GlyphRenderer', 'GraphRenderer', 'GuideRenderer', 'Renderer',
+        'TileRenderer',
+    ),
+    'scales': (
+        'CategoricalScale', 'LinearScale', 'LogScale', 'Scale',
+    ),
+    'selections': (
+        'IntersectRenderers', 'Selection', 'SelectionPolicy', 'UnionRenderers',
+    ),
+    'sources': (
+        'AjaxDataSource', 'CDSView', 'ColumnarDataSource', 'ColumnDataSource', 'DataSource',
+        'GeoJSONDataSource', 'ServerSentDataSource', 'WebSource',
+    ),
+    'textures': (
+        'CanvasTexture', 'ImageURLTexture', 'Texture',
+    ),
+    'tickers': (
+        'Ticker', 'ContinuousTicker', 'FixedTicker', 'AdaptiveTicker', 'CompositeTicker',
+        'SingleIntervalTicker', 'DaysTicker', 'MonthsTicker', 'YearsTicker', 'BasicTicker',
+        'LogTicker', 'MercatorTicker', 'CategoricalTicker', 'DatetimeTicker',
+    ),
+    'tiles': (
+        'TileSource', 'MercatorTileSource', 'TMSTileSource', 'WMTSTileSource',
+        'QUADKEYTileSource', 'BBoxTileSource',
+    ),
+    'tools': (
+        'Action', 'BoxEditTool', 'BoxSelectTool', 'BoxZoomTool', 'CrosshairTool',
+        'CustomAction', 'CustomJSHover', 'Drag', 'EditTool', 'FreehandDrawTool', 'HelpTool',
+        'HoverTool', 'Inspection', 'Gesture', 'LassoSelectTool', 'PanTool', 'PointDrawTool',
+        'PolyDrawTool', 'PolyEditTool', 'PolySelectTool', 'ProxyToolbar', 'RangeTool',
+        'RedoTool', 'ResetTool', 'SaveTool', 'Scroll', 'Tap', 'TapTool', 'Tool', 'Toolbar',
+        'ToolbarBase', 'ToolbarBox', 'UndoTool', 'WheelPanTool', 'WheelZoomTool', 'ZoomInTool',
+        'ZoomOutTool',
+    ),
+    'transforms': (
+        'CustomJSTransform', 'Dodge', 'Interpolator', 'Jitter', 'LinearInterpolator',
+        'StepInterpolator', 'Transform',
+    ),
+    'widgets': widgets.__all__,
+}
+
+__all__ = ('Model', 'expr', 'field', 'value') + tuple(name for names in _MODELS.values() for name in names)
 
 #-----------------------------------------------------------------------------
 # General API
@@ -75,6 +164,28 @@ from .widgets import *  # lgtm [py/polluting-import]
 # Private API
 #-----------------------------------------------------------------------------
 
+_module_for_name = {name: module for module, names in _MODELS.items() for name in names}
+
+_submodules = frozenset(_MODELS) | {'glyph'}
+
+def __getattr__(name):
+    if name in _module_for_name:
+        value = getattr(import_module("." + _module_for_name[name], __name__), name)
+    elif name in _submodules:
+        value = import_module("." + name, __name__)
+    else:
+        raise AttributeError("module %r has no attribute %r" % (__name__, name))
+    globals()[name] = value
+    return value
+
+def __dir__():
+    return sorted(set(globals()) | set(__all__))
+
 #-----------------------------------------------------------------------------
 # Code
 #-----------------------------------------------------------------------------
+
+# module level __getattr__ is only supported by Python 3.7 and later
+if sys.version_info < (3, 7):
+    for _name in __all__:
+        __getattr__(_name)
@@ -396,6 +396,15 @@ class ColumnDataSource(ColumnarDataSource):
         Raises:
             ValueError
 
+        On a Bokeh server, consecutive streams to the same data source that
+        are made while the document is locked (e.g. in a single callback, or
+        inside ``Document.hold("combine")``) are sent to clients as a single
+        update. Streams from separate callbacks are sent separately, and are
+        only combined when a client falls behind, as decided by the
+        ``--send-queue-policy`` option of ``bokeh serve``. The rate of updates
+        is not limited otherwise, so high-frequency producers should stream
+        larger batches less often.
+
         Example:
 
         .. code-block:: python
@@ -4,6 +4,11 @@
 #
 # The full license is in the file LICENSE.txt, distributed with this software.
 #-----------------------------------------------------------------------------
+''' Provide the widget models.
+
+The models are imported from their submodules when they are first accessed.
+
+'''
 # This file is excluded from flake8 checking in setup.cfg
 
 #-----------------------------------------------------------------------------
@@ -16,21 +21,55 @@ log = logging.getLogger(__name__)
 # Imports
 #-----------------------------------------------------------------------------
 
-# Bokeh imports
-from .buttons import *
-from .groups import *
-from .icons import *
-from .inputs import *
-from .markups import *
-from .panels import *
-from .sliders import *
-from .tables import *
-from .widget import *
+# Standard library imports
+import sys
+from importlib import import_module
 
 #-----------------------------------------------------------------------------
 # Globals and constants
 #-----------------------------------------------------------------------------
 
+# the public names of each submodule, which must match its __all__
+_MODELS = {
+    'buttons': (
+        'AbstractButton', 'Button', 'ButtonLike', 'Dropdown', 'Toggle',
+    ),
+    'groups': (
+        'AbstractGroup', 'ButtonGroup', 'CheckboxButtonGroup', 'CheckboxGroup', 'Group',
+        'RadioButtonGroup', 'RadioGroup',
+    ),
+    'icons': (
+        'AbstractIcon',
+    ),
+    'inputs': (
+        'AutocompleteInput', 'ColorPicker', 'DatePicker', 'FileInput', 'InputWidget',
+        'MultiChoice', 'MultiSelect', 'PasswordInput', 'Select', 'Spinner', 'TextInput',
+        'TextAreaInput',
+    ),
+    'markups': (
+        'Div', 'Markup', 'Paragraph', 'PreText',
+    ),
+    'panels': (
+        'Panel', 'Tabs',
+    ),
+    'sliders': (
+        'AbstractSlider', 'Slider', 'RangeSlider', 'DateSlider', 'DateRangeSlider',
+    ),
+    'tables': (
+        'AvgAggregator', 'BooleanFormatter', 'CellFormatter', 'CellEditor', 'CheckboxEditor',
+        'DataCube', 'DataTable', 'DateEditor', 'DateFormatter', 'GroupingInfo',
+        'HTMLTemplateFormatter', 'IntEditor', 'MaxAggregator', 'MinAggregator', 'NumberEditor',
+        'NumberFormatter', 'PercentEditor', 'ScientificFormatter', 'SelectEditor',
+        'StringEditor', 'StringFormatter', 'SumAggregator', 'TableColumn', 'TableWidget',
+        'TextEditor', 'TimeEditor',
+    ),
+    'widget': (
+        'Widget',
+    ),
+}
+
+__all__ = tuple(name for names in _MODELS.values() for name in names)
+
 #-----------------------------------------------------------------------------
 # General API
 #-----------------------------------------------------------------------------
@@ -43,6 +82,26 @@ from .widget import *
 # Private API
 #-----------------------------------------------------------------------------
 
+_module_for_name = {name: module for module, names in _MODELS.items() for name in names}
+
+def __getattr__(name):
+    if name in _module_for_name:
+        value = getattr(import_module("." + _module_for_name[name], __name__), name)
+    elif name in _MODELS:
+        value = import_module("." + name, __name__)
+    else:
+        raise AttributeError("module %r has no attribute %r" % (__name__, name))
+    globals()[name] = value
+    return value
+
+def __dir__():
+    return sorted(set(globals()) | set(__all__))
+
 #-----------------------------------------------------------------------------
 # Code
 #-----------------------------------------------------------------------------
+
+# module level __getattr__ is only supported by Python 3.7 and later
+if sys.version_info < (3, 7):
+    for _name in __all__:
+        __getattr__(_name)
@@ -343,7 +343,6 @@ log = logging.getLogger(__name__)
 
 # Standard library imports
 import math
-from copy import deepcopy
 from typing import Dict, List, Tuple
 
 # External imports
@@ -1204,7 +1203,8 @@ colorblind = {
     "Colorblind" : Colorblind
 }
 
-all_palettes = deepcopy(brewer)
+# the palettes are immutable tuples, so copying the collections is enough
+all_palettes = {name: dict(palettes) for name, palettes in brewer.items()}
 all_palettes.update(d3)
 all_palettes["Colorblind"] = Colorblind
 all_palettes["Magma"]      = Magma
@@ -1214,7 +1214,7 @@ all_palettes["Viridis"]    = Viridis
 all_palettes["Cividis"]    = Cividis
 all_palettes["Turbo"]      = Turbo
 
-small_palettes = deepcopy(all_palettes)
+small_palettes = {name: dict(palettes) for name, palettes in all_palettes.items()}
 del small_palettes["Greys"][256]
 del small_palettes["Magma"][256]
 del small_palettes["Inferno"][256]
@@ -55,12 +55,13 @@ log = logging.getLogger(__name__)
 #-----------------------------------------------------------------------------
 
 # External imports
-from tornado.escape import json_decode, json_encode
+from tornado.escape import json_decode
 
 # Bokeh imports
 import bokeh.util.serialization as bkserial
 
 # Bokeh imports
+from ..core.json_encoder import serialize_json_wire
 from .exceptions import MessageError, ProtocolError
 
 #-----------------------------------------------------------------------------
@@ -302,13 +303,15 @@ class Message(object):
     @property
     def header_json(self):
         if not self._header_json:
-            self._header_json = json_encode(self.header)
+            self._header_json = serialize_json_wire(self.header)
         return self._header_json
 
     # content fragment properties
 
     @property
     def content(self):
+        if self._content is None and self._content_json:
+            self._content = json_decode(self._content_json)
         return self._content
 
     @content.setter
@@ -319,9 +322,22 @@ class Message(object):
     @property
     def content_json(self):
         if not self._content_json:
-            self._content_json = json_encode(self.content)
+            self._content_json = serialize_json_wire(self.content)
         return self._content_json
 
+    @content_json.setter
+    def content_json(self, value):
+        ''' Set the content fragment from an already serialized JSON string.
+
+        The string is sent as-is, and the ``content`` dictionary is only
+        decoded from it if it is actually accessed. This allows messages to
+        avoid a decode and re-encode round trip for content that has been
+        serialized up front (e.g. with ``serialize_json_wire``).
+
+        '''
+        self._content = None
+        self._content_json = value
+
     # metadata fragment properties
 
     @property
@@ -336,7 +352,7 @@ class Message(object):
     @property
     def metadata_json(self):
         if not self._metadata_json:
-            self._metadata_json = json_encode(self.metadata)
+            self._metadata_json = serialize_json_wire(self.metadata)
         return self._metadata_json
 
     # buffer properties
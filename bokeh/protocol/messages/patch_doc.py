@@ -15,11 +15,8 @@ log = logging.getLogger(__name__)
 # Imports
 #-----------------------------------------------------------------------------
 
-# Standard library imports
-from json import loads
-
 # Bokeh imports
-from ...core.json_encoder import serialize_json
+from ...core.json_encoder import serialize_json_wire
 from ...document.util import references_json
 from ..message import Message
 
@@ -81,12 +78,12 @@ class patch_doc(Message):
         if len(docs) != 1:
             raise ValueError("PATCH-DOC message configured with events for more than one document")
 
-        # this roundtrip is fortunate, but is needed because there are type conversions
-        # in BokehJSONEncoder which keep us from easily generating non-string JSON
+        # keep the JSON generated by BokehJSONEncoder (which performs type
+        # conversions) as-is, the content dict is only decoded when accessed
         patch_json, buffers = process_document_events(events, use_buffers)
-        content = loads(patch_json)
 
-        msg = cls(header, metadata, content)
+        msg = cls(header, metadata, None)
+        msg.content_json = patch_json
 
         for (header, payload) in buffers:
             msg.add_buffer(header, payload)
@@ -97,7 +94,7 @@ class patch_doc(Message):
         '''
 
         '''
-        doc._with_self_as_curdoc(lambda: doc.apply_json_patch(self.content, setter))
+        doc._with_self_as_curdoc(lambda: doc.apply_json_patch(self.content, setter, self.buffers))
 
 def process_document_events(events, use_buffers=True):
     ''' Create a JSON string describing a patch to be applied as well as
@@ -126,7 +123,7 @@ def process_document_events(events, use_buffers=True):
         'references' : references_json(references),
     }
 
-    return serialize_json(json), buffers if use_buffers else []
+    return serialize_json_wire(json), buffers if use_buffers else []
 
 #-----------------------------------------------------------------------------
 # Private API
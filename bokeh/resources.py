@@ -34,6 +34,7 @@ log = logging.getLogger(__name__)
 
 # Standard library imports
 import json
+import os
 import re
 from os.path import basename, join, relpath
 
@@ -101,12 +102,7 @@ def get_all_sri_hashes():
     .. _Subresource Integrity: https://developer.mozilla.org/en-US/docs/Web/Security/Subresource_Integrity
 
     """
-    global _SRI_HASHES
-
-    if not _SRI_HASHES:
-        _SRI_HASHES = json.load(open(join(ROOT_DIR, "_sri.json")))
-
-    return dict(_SRI_HASHES)
+    return dict(_sri_hashes())
 
 
 def get_sri_hashes_for_version(version):
@@ -152,8 +148,8 @@ def get_sri_hashes_for_version(version):
     .. _Subresource Integrity: https://developer.mozilla.org/en-US/docs/Web/Security/Subresource_Integrity
 
     """
-    hashes = get_all_sri_hashes()
-    return hashes[version]
+    hashes = _sri_hashes()
+    return dict(hashes[version])
 
 
 def verify_sri_hashes():
@@ -368,11 +364,7 @@ class BaseResources(object):
 
     @staticmethod
     def _inline(path):
-        begin = "/* BEGIN %s */" % basename(path)
-        with open(path, "rb") as f:
-            middle = f.read().decode("utf-8")
-        end = "/* END %s */" % basename(path)
-        return "%s\n%s\n%s" % (begin, middle, end)
+        return _cached_load(path, _load_inline)
 
 
 class JSResources(BaseResources):
@@ -699,6 +691,44 @@ def _get_server_urls(root_url, minified=True, legacy=False, path_versioner=None)
     return {"urls": lambda components, kind: [mk_url(component, kind) for component in components], "messages": []}
 
 
+# (path, loader) -> ((mtime, size), value)
+_file_cache = {}
+
+def _cached_load(path, load):
+    """ Load a file with ``load(path)``, reusing the result for as long as
+    the modification time and size of the file are unchanged.
+
+    """
+    stat = os.stat(path)
+    stamp = (stat.st_mtime_ns, stat.st_size)
+    key = (path, load)
+    cached = _file_cache.get(key)
+    if cached is not None and cached[0] == stamp:
+        return cached[1]
+    value = load(path)
+    _file_cache[key] = (stamp, value)
+    return value
+
+
+def _load_inline(path):
+    begin = "/* BEGIN %s */" % basename(path)
+    with open(path, "rb") as f:
+        middle = f.read().decode("utf-8")
+    end = "/* END %s */" % basename(path)
+    return "%s\n%s\n%s" % (begin, middle, end)
+
+
+def _load_json(path):
+    with open(path) as f:
+        return json.load(f)
+
+
+def _sri_hashes():
+    global _SRI_HASHES
+    _SRI_HASHES = _cached_load(join(ROOT_DIR, "_sri.json"), _load_json)
+    return _SRI_HASHES
+
+
 def _compute_single_hash(path):
     assert path.endswith(".js")
 
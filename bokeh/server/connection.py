@@ -20,11 +20,30 @@ log = logging.getLogger(__name__)
 
 # Standard library imports
 import codecs
+import threading
+from collections import deque
+from copy import copy
+
+# Bokeh imports
+from ..document.document import _combine_document_events
+from ..document.events import ModelChangedEvent
+from .metrics import (
+    PATCH_DOC_BYTES,
+    PATCH_DOC_ENCODE_SECONDS,
+    SEND_QUEUE_DEPTH,
+    SEND_QUEUE_DISCONNECTS,
+    SEND_QUEUE_DROPPED,
+    SEND_QUEUE_MERGED,
+    SEND_QUEUE_MESSAGES,
+)
 
 #-----------------------------------------------------------------------------
 # Globals and constants
 #-----------------------------------------------------------------------------
 
+DEFAULT_SEND_QUEUE_HIGH_WATERMARK = 256
+DEFAULT_SEND_QUEUE_LOW_WATERMARK  = 64
+
 __all__ = (
     'ServerConnection',
 )
@@ -35,9 +54,33 @@ __all__ = (
 
 class ServerConnection(object):
     ''' Wraps a websocket connection to a client.
+
+    Messages to the client are sent in order from a per-connection queue, so
+    that sessions do not have to wait for slow clients. When the queue grows
+    beyond ``send_queue_high_watermark`` messages, the connection becomes
+    congested, and the ``send_queue_policy`` is applied to new PATCH-DOC
+    messages until the queue drains to ``send_queue_low_watermark``:
+
+    ``"merge"``
+        Merge all queued PATCH-DOC messages into a single message, combining
+        consecutive changes, e.g. streams to the same data source.
+
+    ``"drop"``
+        Drop queued property changes that are superseded by a new change to
+        the same property, then merge if the queue is still too long.
+
+    ``"disconnect"``
+        Close the connection. The client may reconnect and pull the current
+        document.
+
     '''
 
-    def __init__(self, protocol, socket, application_context, session):
+    def __init__(self, protocol, socket, application_context, session,
+                 send_queue_high_watermark=DEFAULT_SEND_QUEUE_HIGH_WATERMARK,
+                 send_queue_low_watermark=DEFAULT_SEND_QUEUE_LOW_WATERMARK,
+                 send_queue_policy="merge"):
+        if not 0 <= send_queue_low_watermark <= send_queue_high_watermark:
+            raise ValueError("send queue watermarks must satisfy 0 <= low <= high")
         self._protocol = protocol
         self._socket = socket
         self._application_context = application_context
@@ -45,6 +88,20 @@ class ServerConnection(object):
         self._session.subscribe(self)
         self._ping_count = 0
 
+        self._send_queue_high_watermark = send_queue_high_watermark
+        self._send_queue_low_watermark = send_queue_low_watermark
+        self._send_queue_policy = send_queue_policy
+        # patches may be queued from executor threads, see ServerSession
+        self._send_queue_lock = threading.Lock()
+        self._send_queue = deque()
+        self._send_queue_bytes = 0
+        self._sending = False
+        self._congested = False
+        self._disconnecting = False
+        self._bytes_sent = 0
+        self._messages_dropped = 0
+        self._messages_merged = 0
+
     @property
     def session(self):
         return self._session
@@ -53,8 +110,56 @@ class ServerConnection(object):
     def application_context(self):
         return self._application_context
 
+    @property
+    def send_queue_depth(self):
+        ''' The number of messages waiting to be sent to the client.
+
+        '''
+        return len(self._send_queue)
+
+    @property
+    def send_queue_bytes(self):
+        ''' The size of the messages waiting to be sent to the client.
+
+        '''
+        return self._send_queue_bytes
+
+    @property
+    def bytes_sent(self):
+        ''' The size of all messages sent to the client from the queue.
+
+        '''
+        return self._bytes_sent
+
+    @property
+    def congested(self):
+        ''' Whether the send queue policy is currently in effect.
+
+        '''
+        return self._congested
+
+    @property
+    def messages_dropped(self):
+        ''' The number of superseded PATCH-DOC messages that were dropped.
+
+        '''
+        return self._messages_dropped
+
+    @property
+    def messages_merged(self):
+        ''' The number of PATCH-DOC messages that were merged into others.
+
+        '''
+        return self._messages_merged
+
     def detach_session(self):
-        """Allow the session to be discarded and don't get change notifications from it anymore"""
+        """Allow the session to be discarded and don't get change notifications from it anymore
+
+        Any messages still queued for the client are discarded.
+        """
+        with self._send_queue_lock:
+            self._disconnecting = True
+            self._clear_send_queue()
         if self._session is not None:
             self._session.unsubscribe(self)
             self._session = None
@@ -65,11 +170,31 @@ class ServerConnection(object):
     def error(self, message, text):
         return self.protocol.create('ERROR', message.header['msgid'], text)
 
-    def send_patch_document(self, event):
-        """ Sends a PATCH-DOC message, returning a Future that's completed when it's written out. """
-        msg = self.protocol.create('PATCH-DOC', [event])
-        # yes, *return* the awaitable, it will be awaited when pending writes are processed
-        return self._socket.send_message(msg)
+    def send(self, msg):
+        """ Queue a message to be sent to the client, in order with any
+        queued PATCH-DOC messages.
+
+        The send queue policy never merges or drops these messages.
+        """
+        self._enqueue(_QueuedMessage(msg, None))
+
+    def send_patch_document(self, event, msg=None):
+        """ Queue a PATCH-DOC message to be sent to the client.
+
+        If ``msg`` is supplied, it should be a ``PATCH-DOC`` message already
+        created for ``event``. Its encoded fragments are cached on the message,
+        so a single message may be shared between many connections.
+
+        This must be called with the session document locked, because the
+        message is encoded immediately, and may be re-created from its events
+        if it is merged with others.
+
+        Returns None, since the message is sent in the background.
+        """
+        if msg is None:
+            msg = _create_patch_doc(self.protocol, [event])
+        self._enqueue(_QueuedMessage(msg, [event]))
+        return None
 
     def send_ping(self):
         self._socket.ping(codecs.encode(str(self._ping_count), "utf-8"))
@@ -79,6 +204,110 @@ class ServerConnection(object):
     def protocol(self):
         return self._protocol
 
+    # Private methods ---------------------------------------------------------
+
+    def _enqueue(self, entry):
+        with self._send_queue_lock:
+            if self._disconnecting:
+                return
+            self._send_queue.append(entry)
+            self._send_queue_bytes += entry.nbytes
+            SEND_QUEUE_MESSAGES.inc()
+            SEND_QUEUE_DEPTH.observe(len(self._send_queue))
+
+            if not self._congested and len(self._send_queue) > self._send_queue_high_watermark:
+                log.warning("Client connection is not keeping up, %d messages (%d bytes) queued, applying %r policy",
+                            len(self._send_queue), self._send_queue_bytes, self._send_queue_policy)
+                self._congested = True
+
+            if self._congested and entry.events is not None:
+                if self._send_queue_policy == "disconnect":
+                    self._disconnect()
+                    return
+                if self._send_queue_policy == "drop":
+                    self._drop_superseded(entry)
+                if len(self._send_queue) > self._send_queue_high_watermark:
+                    self._merge_patches()
+
+            if not self._sending:
+                self._sending = True
+                self._application_context.io_loop.spawn_callback(self._send_queued)
+
+    def _patch_tail(self):
+        # only trailing PATCH-DOC messages are merged or dropped, in order to
+        # keep their order relative to other messages
+        tail = []
+        for entry in reversed(self._send_queue):
+            if entry.events is None:
+                break
+            tail.append(entry)
+        tail.reverse()
+        return tail
+
+    def _drop_superseded(self, entry):
+        key = _property_change_key(entry)
+        if key is None:
+            return
+        for old in self._patch_tail()[:-1]:
+            if _property_change_key(old) == key:
+                self._remove(old)
+                self._messages_dropped += 1
+                SEND_QUEUE_DROPPED.inc()
+
+    def _merge_patches(self):
+        tail = self._patch_tail()
+        if len(tail) < 2:
+            return
+        # consecutive changes (e.g. streams to the same source) are combined,
+        # so that the client only has to apply and render them once
+        events = []
+        for old in tail:
+            for event in old.events:
+                _combine_document_events(_copy_event(event), events)
+            self._remove(old)
+        self._messages_merged += len(tail) - 1
+        SEND_QUEUE_MERGED.inc(len(tail) - 1)
+        merged = _QueuedMessage(_create_patch_doc(self.protocol, events), events)
+        self._send_queue.append(merged)
+        self._send_queue_bytes += merged.nbytes
+        SEND_QUEUE_MESSAGES.inc()
+
+    def _remove(self, entry):
+        self._send_queue.remove(entry)
+        self._send_queue_bytes -= entry.nbytes
+        SEND_QUEUE_MESSAGES.dec()
+
+    def _disconnect(self):
+        log.warning("Closing client connection that is not keeping up with %d queued messages (%d bytes)",
+                    len(self._send_queue), self._send_queue_bytes)
+        SEND_QUEUE_DISCONNECTS.inc()
+        self._clear_send_queue()
+        self._disconnecting = True
+        self._application_context.io_loop.add_callback(self._socket.close, 1013, "Client is not keeping up with updates")
+
+    def _clear_send_queue(self):
+        SEND_QUEUE_MESSAGES.dec(len(self._send_queue))
+        self._send_queue.clear()
+        self._send_queue_bytes = 0
+
+    async def _send_queued(self):
+        while True:
+            with self._send_queue_lock:
+                if not self._send_queue:
+                    self._sending = False
+                    return
+                entry = self._send_queue.popleft()
+                self._send_queue_bytes -= entry.nbytes
+                SEND_QUEUE_MESSAGES.dec()
+                if self._congested and len(self._send_queue) <= self._send_queue_low_watermark:
+                    self._congested = False
+            try:
+                await self._socket.send_message(entry.msg)
+            except Exception as e:
+                log.error("Error sending a message to the client %r", e, exc_info=True)
+            else:
+                self._bytes_sent += entry.nbytes
+
 #-----------------------------------------------------------------------------
 # Dev API
 #-----------------------------------------------------------------------------
@@ -87,6 +316,45 @@ class ServerConnection(object):
 # Private API
 #-----------------------------------------------------------------------------
 
+class _QueuedMessage(object):
+    ''' A message in the send queue of a connection, together with the events
+    of a PATCH-DOC message (or None for other messages).
+
+    '''
+
+    __slots__ = ('msg', 'events', 'nbytes')
+
+    def __init__(self, msg, events):
+        self.msg = msg
+        self.events = events
+        self.nbytes = _message_size(msg)
+
+def _copy_event(event):
+    # queued events may be shared with other connections, and events (and
+    # their hints) are modified in place when they are combined
+    event = copy(event)
+    if getattr(event, "hint", None) is not None:
+        event.hint = copy(event.hint)
+    return event
+
+def _create_patch_doc(protocol, events):
+    with PATCH_DOC_ENCODE_SECONDS.time():
+        msg = protocol.create('PATCH-DOC', events)
+    PATCH_DOC_BYTES.observe(_message_size(msg))
+    return msg
+
+def _message_size(msg):
+    return len(msg.header_json) + len(msg.metadata_json) + len(msg.content_json) + \
+        sum(len(header) + len(payload) for header, payload in msg.buffers)
+
+def _property_change_key(entry):
+    if len(entry.events) != 1:
+        return None
+    event = entry.events[0]
+    if type(event) is not ModelChangedEvent or event.hint is not None:
+        return None
+    return event.model.id, event.attr
+
 #-----------------------------------------------------------------------------
 # Code
 #-----------------------------------------------------------------------------
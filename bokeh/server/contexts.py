@@ -18,6 +18,12 @@ log = logging.getLogger(__name__)
 # Imports
 #-----------------------------------------------------------------------------
 
+# Standard library imports
+import asyncio
+import threading
+import time
+from collections import deque
+
 # External imports
 from tornado import gen
 
@@ -27,7 +33,10 @@ from ..document import Document
 from ..protocol.exceptions import ProtocolError
 from ..util.token import get_token_payload
 from ..util.tornado import _CallbackGroup
+from .metrics import SESSION_CREATION_SECONDS, SESSIONS, SESSIONS_CREATED
+from .render_cache import RenderCache
 from .session import ServerSession
+from .util import run_in_executor
 
 #-----------------------------------------------------------------------------
 # Globals and constants
@@ -37,6 +46,7 @@ __all__ = (
     'ApplicationContext',
     'BokehServerContext',
     'BokehSessionContext',
+    'DocumentPool',
 )
 
 #-----------------------------------------------------------------------------
@@ -136,12 +146,15 @@ class ApplicationContext(object):
         data specific to an "instance" of the application.
     '''
 
-    def __init__(self, application, io_loop=None, url=None, logout_url=None):
+    def __init__(self, application, io_loop=None, url=None, logout_url=None, session_pool_size=0, executor=None):
         self._application = application
         self._loop = io_loop
+        self._executor = executor
         self._sessions = dict()
         self._pending_sessions = dict()
         self._session_contexts = dict()
+        self._session_pool = DocumentPool(application, session_pool_size, executor=executor)
+        self._render_cache = RenderCache()
         self._server_context = None
         self._url = url
         self._logout_url = logout_url
@@ -168,6 +181,18 @@ class ApplicationContext(object):
     def sessions(self):
         return self._sessions.values()
 
+    @property
+    def session_pool(self):
+        return self._session_pool
+
+    @property
+    def render_cache(self):
+        ''' A cache of the pages and scripts rendered for sessions of this
+        application.
+
+        '''
+        return self._render_cache
+
     def run_load_hook(self):
         try:
             self._application.on_server_loaded(self.server_context)
@@ -191,8 +216,13 @@ class ApplicationContext(object):
         if session_id not in self._sessions and \
            session_id not in self._pending_sessions:
             future = self._pending_sessions[session_id] = gen.Future()
+            start = time.perf_counter()
 
-            doc = Document()
+            # a document from the pool has already been initialized
+            doc = self._session_pool.claim()
+            initialized = doc is not None
+            if not initialized:
+                doc = Document()
 
             session_context = BokehSessionContext(session_id,
                                                   self.server_context,
@@ -215,17 +245,25 @@ class ApplicationContext(object):
             except Exception as e:
                 log.error("Failed to run session creation hooks %r", e, exc_info=True)
 
-            self._application.initialize_document(doc)
+            if not initialized:
+                await run_in_executor(self._executor, _initialize_document, self._application, doc)
 
-            session = ServerSession(session_id, doc, io_loop=self._loop, token=token)
+            session = ServerSession(session_id, doc, io_loop=self._loop, token=token, executor=self._executor)
             del self._pending_sessions[session_id]
             self._sessions[session_id] = session
             session_context._set_session(session)
             self._session_contexts[session_id] = session_context
 
+            SESSION_CREATION_SECONDS.labels(self._url).observe(time.perf_counter() - start)
+            SESSIONS_CREATED.labels(self._url).inc()
+            SESSIONS.labels(self._url).inc()
+
             # notify anyone waiting on the pending session
             future.set_result(session)
 
+            if self._session_pool.size > 0:
+                self._loop.spawn_callback(self._session_pool.fill)
+
         if session_id in self._pending_sessions:
             # another create_session_if_needed is working on
             # creating this session
@@ -261,6 +299,7 @@ class ApplicationContext(object):
                 session.destroy()
                 del self._sessions[session.id]
                 del self._session_contexts[session.id]
+                SESSIONS.labels(self._url).dec()
                 log.trace("Session %r was successfully discarded", session.id)
             else:
                 log.warning("Session %r was scheduled to discard but came back to life", session.id)
@@ -296,10 +335,126 @@ class ApplicationContext(object):
 
         return None
 
+class DocumentPool(object):
+    ''' A pool of documents that are initialized ahead of time, to be used
+    by new sessions of an application.
+
+    Pooled documents are initialized in the background, before any session
+    (and thus any request or session context) exists for them. The pool is
+    disabled for applications that define ``on_session_created`` hooks, since
+    these are documented to run before the document is initialized. It is
+    also disabled if a handler fails to initialize a pooled document, e.g.
+    because it depends on the session context.
+
+    '''
+
+    def __init__(self, application, size=0, executor=None):
+        if size < 0:
+            raise ValueError("session pool size must be >= 0")
+        if size > 0 and any(h.has_session_created_hook for h in application.handlers):
+            log.warning("Not using a session pool, because the application defines on_session_created hooks")
+            size = 0
+        self._application = application
+        self._size = size
+        self._executor = executor
+        self._documents = deque()
+        self._filling = False
+        self._hits = 0
+        self._misses = 0
+
+    def __len__(self):
+        return len(self._documents)
+
+    @property
+    def size(self):
+        ''' The number of initialized documents the pool tries to keep ready.
+
+        '''
+        return self._size
+
+    @property
+    def hits(self):
+        ''' The number of new sessions that got a document from the pool.
+
+        '''
+        return self._hits
+
+    @property
+    def misses(self):
+        ''' The number of new sessions that found the pool empty, and had
+        to initialize a document themselves.
+
+        '''
+        return self._misses
+
+    def claim(self):
+        ''' Take an initialized document out of the pool.
+
+        Returns:
+            Document or None, if the pool is disabled or empty
+
+        '''
+        if self._size == 0:
+            return None
+        if self._documents:
+            self._hits += 1
+            return self._documents.popleft()
+        self._misses += 1
+        return None
+
+    async def fill(self):
+        ''' Initialize documents until the pool is full.
+
+        Control is returned to the IOLoop between documents, so that other
+        requests can be served while the pool fills.
+
+        '''
+        if self._filling:
+            return
+        self._filling = True
+        try:
+            while len(self._documents) < self._size:
+                await asyncio.sleep(0)
+                doc = Document()
+                try:
+                    failed = await run_in_executor(self._executor, _initialize_document, self._application, doc)
+                except Exception as e:
+                    log.error("Error initializing a document for the session pool %r", e, exc_info=True)
+                    return
+                if failed:
+                    log.warning("Disabling the session pool, because the application failed to initialize a document "
+                                "without a session context")
+                    doc.delete_modules()
+                    self.clear()
+                    self._size = 0
+                    return
+                self._documents.append(doc)
+        finally:
+            self._filling = False
+
+    def clear(self):
+        ''' Discard all initialized documents.
+
+        '''
+        while self._documents:
+            self._documents.popleft().delete_modules()
+
 #-----------------------------------------------------------------------------
 # Private API
 #-----------------------------------------------------------------------------
 
+# application code may change process-wide state (e.g. sys.path or the
+# current directory), so documents are initialized one at a time, even
+# when several executor threads are available
+_initialize_lock = threading.Lock()
+
+def _initialize_document(application, doc):
+    # handlers report errors from their last run, so check them while
+    # holding the lock, returns True if any handler failed
+    with _initialize_lock:
+        application.initialize_document(doc)
+        return any(h.failed for h in application.handlers)
+
 class _RequestProxy(object):
     def __init__(self, request, cookies=None, headers=None):
         self._request = request
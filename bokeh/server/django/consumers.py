@@ -306,9 +306,10 @@ class WSConsumer(AsyncWebsocketConsumer, ConsumerHelper):
 # TODO: remove this when coroutines are dropped
 class AsyncServerConnection(ServerConnection):
 
-    async def send_patch_document(self, event):
+    async def send_patch_document(self, event, msg=None):
         """ Sends a PATCH-DOC message, returning a Future that's completed when it's written out. """
-        msg = self.protocol.create('PATCH-DOC', [event])
+        if msg is None:
+            msg = self.protocol.create('PATCH-DOC', [event])
         await self._socket._send_bokeh_message(msg)
 
 class AttrDict(dict):
@@ -0,0 +1,403 @@
+#-----------------------------------------------------------------------------
+# Copyright (c) 2012 - 2020, Anaconda, Inc., and Bokeh Contributors.
+# All rights reserved.
+#
+# The full license is in the file LICENSE.txt, distributed with this software.
+#-----------------------------------------------------------------------------
+''' Provide counters, gauges and histograms that describe the activity of a
+Bokeh server process.
+
+The metrics are collected in a :class:`MetricsRegistry`, which renders them
+in the Prometheus text exposition format, e.g. for the ``/metrics`` endpoint
+of the Bokeh server (see :class:`~bokeh.server.views.metrics_handler.MetricsHandler`).
+
+The metrics that the Bokeh server itself records are defined in this module,
+in the default ``registry``:
+
+``bokeh_sessions`` (gauge, by ``app``)
+    Current number of sessions
+
+``bokeh_sessions_created_total`` (counter, by ``app``)
+    Number of sessions created
+
+``bokeh_session_creation_seconds`` (histogram, by ``app``)
+    Time taken to create a session, including running the application code
+
+``bokeh_connections`` (gauge)
+    Current number of websocket connections
+
+``bokeh_connections_total`` (counter)
+    Number of websocket connections opened
+
+``bokeh_patch_doc_encode_seconds`` (histogram)
+    Time taken to encode a PATCH-DOC message
+
+``bokeh_patch_doc_bytes`` (histogram)
+    Size of encoded PATCH-DOC messages
+
+``bokeh_send_queue_depth`` (histogram)
+    Number of messages waiting for a client, whenever a message is queued
+
+``bokeh_send_queue_messages`` (gauge)
+    Current number of messages waiting for all clients
+
+``bokeh_send_queue_dropped_total`` (counter)
+    Number of superseded PATCH-DOC messages dropped for slow clients
+
+``bokeh_send_queue_merged_total`` (counter)
+    Number of PATCH-DOC messages merged into others for slow clients
+
+``bokeh_send_queue_disconnects_total`` (counter)
+    Number of slow clients that were disconnected
+
+``bokeh_document_lock_wait_seconds`` (histogram)
+    Time spent waiting to acquire a session document lock
+
+``bokeh_document_lock_hold_seconds`` (histogram)
+    Time spent holding a session document lock
+
+``bokeh_periodic_callback_overruns_total`` (counter)
+    Number of periodic callback invocations that took longer than their period
+
+'''
+
+#-----------------------------------------------------------------------------
+# Boilerplate
+#-----------------------------------------------------------------------------
+import logging # isort:skip
+log = logging.getLogger(__name__)
+
+#-----------------------------------------------------------------------------
+# Imports
+#-----------------------------------------------------------------------------
+
+# Standard library imports
+import math
+import threading
+import time
+from contextlib import contextmanager
+
+#-----------------------------------------------------------------------------
+# Globals and constants
+#-----------------------------------------------------------------------------
+
+CONTENT_TYPE = "text/plain; version=0.0.4; charset=utf-8"
+
+DEFAULT_BUCKETS = (0.001, 0.0025, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0)
+
+BYTES_BUCKETS = tuple(256 * 4**i for i in range(10))
+
+DEPTH_BUCKETS = tuple(2**i for i in range(11))
+
+__all__ = (
+    'CONTENT_TYPE',
+    'Counter',
+    'Gauge',
+    'Histogram',
+    'Metric',
+    'MetricsRegistry',
+    'registry',
+)
+
+#-----------------------------------------------------------------------------
+# General API
+#-----------------------------------------------------------------------------
+
+class MetricsRegistry(object):
+    ''' A collection of named metrics.
+
+    Metrics are created (or looked up, if they already exist) with the
+    ``counter``, ``gauge`` and ``histogram`` methods.
+
+    '''
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._metrics = {}
+
+    def counter(self, name, documentation, labelnames=()):
+        ''' Get or create a :class:`Counter`.
+
+        '''
+        return self._get_or_create(Counter, name, documentation, labelnames)
+
+    def gauge(self, name, documentation, labelnames=()):
+        ''' Get or create a :class:`Gauge`.
+
+        '''
+        return self._get_or_create(Gauge, name, documentation, labelnames)
+
+    def histogram(self, name, documentation, labelnames=(), buckets=DEFAULT_BUCKETS):
+        ''' Get or create a :class:`Histogram`.
+
+        '''
+        return self._get_or_create(Histogram, name, documentation, labelnames, buckets=buckets)
+
+    def render(self):
+        ''' Render all metrics in the Prometheus text exposition format.
+
+        Returns:
+            str
+
+        '''
+        with self._lock:
+            metrics = sorted(self._metrics.values(), key=lambda metric: metric.name)
+        return "".join(metric.render() for metric in metrics)
+
+    def _get_or_create(self, cls, name, documentation, labelnames, **kwargs):
+        with self._lock:
+            metric = self._metrics.get(name)
+            if metric is None:
+                metric = self._metrics[name] = cls(name, documentation, labelnames, **kwargs)
+            elif type(metric) is not cls or metric.labelnames != tuple(labelnames):
+                raise ValueError("metric %r is already registered with a different type or labels" % name)
+        return metric
+
+class Metric(object):
+    ''' Base class for metrics, with one series of values for every
+    combination of label values.
+
+    '''
+
+    _type = None
+
+    def __init__(self, name, documentation, labelnames=()):
+        self.name = name
+        self.documentation = documentation
+        self.labelnames = tuple(labelnames)
+        self._lock = threading.Lock()
+        self._children = {}
+        # metrics without labels have a single series, reported from the start
+        if not self.labelnames:
+            self.labels()
+
+    def labels(self, *values):
+        ''' Get the series of this metric for the given label values.
+
+        '''
+        if len(values) != len(self.labelnames):
+            raise ValueError("metric %r expects %d label values, got %d" % (self.name, len(self.labelnames), len(values)))
+        values = tuple(str(value) for value in values)
+        with self._lock:
+            child = self._children.get(values)
+            if child is None:
+                child = self._children[values] = self._new_child()
+        return child
+
+    def render(self):
+        ''' Render this metric in the Prometheus text exposition format.
+
+        Returns:
+            str
+
+        '''
+        lines = [
+            "# HELP %s %s\n" % (self.name, _escape_help(self.documentation)),
+            "# TYPE %s %s\n" % (self.name, self._type),
+        ]
+        with self._lock:
+            children = sorted(self._children.items())
+        for values, child in children:
+            labels = dict(zip(self.labelnames, values))
+            for suffix, extra, value in child.samples():
+                lines.append("%s%s%s %s\n" % (self.name, suffix, _format_labels(dict(labels, **extra)), _format_value(value)))
+        return "".join(lines)
+
+    def _new_child(self):
+        return _Value()
+
+    def _unlabelled(self):
+        if self.labelnames:
+            raise ValueError("metric %r requires label values" % self.name)
+        return self.labels()
+
+class Counter(Metric):
+    ''' A value that only ever increases, e.g. a number of events.
+
+    '''
+
+    _type = "counter"
+
+    def inc(self, amount=1):
+        self._unlabelled().inc(amount)
+
+class Gauge(Metric):
+    ''' A value that may increase and decrease, e.g. a number of connections.
+
+    '''
+
+    _type = "gauge"
+
+    def inc(self, amount=1):
+        self._unlabelled().inc(amount)
+
+    def dec(self, amount=1):
+        self._unlabelled().dec(amount)
+
+    def set(self, value):
+        self._unlabelled().set(value)
+
+class Histogram(Metric):
+    ''' A distribution of observed values, e.g. durations or sizes, counted
+    in cumulative buckets.
+
+    '''
+
+    _type = "histogram"
+
+    def __init__(self, name, documentation, labelnames=(), buckets=DEFAULT_BUCKETS):
+        self.buckets = tuple(sorted(buckets))
+        super().__init__(name, documentation, labelnames)
+
+    def observe(self, value):
+        self._unlabelled().observe(value)
+
+    def time(self):
+        ''' A context manager that observes the time (in seconds) spent in
+        its block.
+
+        '''
+        return self._unlabelled().time()
+
+    def _new_child(self):
+        return _HistogramValue(self.buckets)
+
+#-----------------------------------------------------------------------------
+# Dev API
+#-----------------------------------------------------------------------------
+
+#-----------------------------------------------------------------------------
+# Private API
+#-----------------------------------------------------------------------------
+
+class _Value(object):
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._value = 0.0
+
+    def inc(self, amount=1):
+        with self._lock:
+            self._value += amount
+
+    def dec(self, amount=1):
+        self.inc(-amount)
+
+    def set(self, value):
+        with self._lock:
+            self._value = float(value)
+
+    def samples(self):
+        return [("", {}, self._value)]
+
+class _HistogramValue(object):
+
+    def __init__(self, buckets):
+        self._lock = threading.Lock()
+        self._buckets = buckets
+        self._counts = [0] * (len(buckets) + 1)
+        self._sum = 0.0
+
+    def observe(self, value):
+        i = 0
+        for bound in self._buckets:
+            if value <= bound:
+                break
+            i += 1
+        with self._lock:
+            self._counts[i] += 1
+            self._sum += value
+
+    @contextmanager
+    def time(self):
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.observe(time.perf_counter() - start)
+
+    def samples(self):
+        with self._lock:
+            counts = list(self._counts)
+            total = self._sum
+        samples = []
+        cumulative = 0
+        for bound, count in zip(self._buckets + (math.inf,), counts):
+            cumulative += count
+            samples.append(("_bucket", dict(le=bound), cumulative))
+        samples.append(("_sum", {}, total))
+        samples.append(("_count", {}, cumulative))
+        return samples
+
+def _escape_help(text):
+    return text.replace("\\", r"\\").replace("\n", r"\n")
+
+def _escape_label(text):
+    return text.replace("\\", r"\\").replace("\n", r"\n").replace('"', r'\"')
+
+def _format_labels(labels):
+    if not labels:
+        return ""
+    items = ('%s="%s"' % (name, _escape_label(value if isinstance(value, str) else _format_value(value)))
+             for name, value in labels.items())
+    return "{%s}" % ",".join(items)
+
+def _format_value(value):
+    if value == math.inf:
+        return "+Inf"
+    if value == -math.inf:
+        return "-Inf"
+    if isinstance(value, float) and value.is_integer():
+        return "%d" % value
+    return repr(value)
+
+#-----------------------------------------------------------------------------
+# Code
+#-----------------------------------------------------------------------------
+
+registry = MetricsRegistry()
+
+SESSIONS = registry.gauge(
+    "bokeh_sessions", "Current number of sessions", ["app"])
+
+SESSIONS_CREATED = registry.counter(
+    "bokeh_sessions_created_total", "Number of sessions created", ["app"])
+
+SESSION_CREATION_SECONDS = registry.histogram(
+    "bokeh_session_creation_seconds", "Time taken to create a session, including running the application code", ["app"])
+
+CONNECTIONS = registry.gauge(
+    "bokeh_connections", "Current number of websocket connections")
+
+CONNECTIONS_OPENED = registry.counter(
+    "bokeh_connections_total", "Number of websocket connections opened")
+
+PATCH_DOC_ENCODE_SECONDS = registry.histogram(
+    "bokeh_patch_doc_encode_seconds", "Time taken to encode a PATCH-DOC message")
+
+PATCH_DOC_BYTES = registry.histogram(
+    "bokeh_patch_doc_bytes", "Size of encoded PATCH-DOC messages", buckets=BYTES_BUCKETS)
+
+SEND_QUEUE_DEPTH = registry.histogram(
+    "bokeh_send_queue_depth", "Number of messages waiting for a client, whenever a message is queued", buckets=DEPTH_BUCKETS)
+
+SEND_QUEUE_MESSAGES = registry.gauge(
+    "bokeh_send_queue_messages", "Current number of messages waiting for all clients")
+
+SEND_QUEUE_DROPPED = registry.counter(
+    "bokeh_send_queue_dropped_total", "Number of superseded PATCH-DOC messages dropped for slow clients")
+
+SEND_QUEUE_MERGED = registry.counter(
+    "bokeh_send_queue_merged_total", "Number of PATCH-DOC messages merged into others for slow clients")
+
+SEND_QUEUE_DISCONNECTS = registry.counter(
+    "bokeh_send_queue_disconnects_total", "Number of slow clients that were disconnected")
+
+DOCUMENT_LOCK_WAIT_SECONDS = registry.histogram(
+    "bokeh_document_lock_wait_seconds", "Time spent waiting to acquire a session document lock")
+
+DOCUMENT_LOCK_HOLD_SECONDS = registry.histogram(
+    "bokeh_document_lock_hold_seconds", "Time spent holding a session document lock")
+
+PERIODIC_CALLBACK_OVERRUNS = registry.counter(
+    "bokeh_periodic_callback_overruns_total", "Number of periodic callback invocations that took longer than their period")
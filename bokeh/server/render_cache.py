@@ -0,0 +1,309 @@
+#-----------------------------------------------------------------------------
+# Copyright (c) 2012 - 2020, Anaconda, Inc., and Bokeh Contributors.
+# All rights reserved.
+#
+# The full license is in the file LICENSE.txt, distributed with this software.
+#-----------------------------------------------------------------------------
+''' Provide a cache of the HTML pages and autoload scripts that a Bokeh server
+renders for the sessions of an application.
+
+Apart from the session token and the IDs of the document roots, these are
+identical for every session with the same title, template, template
+variables and resources. They are rendered once with slots in place of the
+per-session values, which are substituted for every request.
+
+'''
+
+#-----------------------------------------------------------------------------
+# Boilerplate
+#-----------------------------------------------------------------------------
+import logging # isort:skip
+log = logging.getLogger(__name__)
+
+#-----------------------------------------------------------------------------
+# Imports
+#-----------------------------------------------------------------------------
+
+# Standard library imports
+import hashlib
+import re
+import uuid
+from collections import OrderedDict
+
+# Bokeh imports
+from ..core.templates import AUTOLOAD_JS
+from ..embed.bundle import Script, bundle_for_objs_and_resources
+from ..embed.elements import html_page_for_render_items, script_for_render_items
+from ..embed.server import server_html_page_for_session
+from ..embed.util import RenderItem
+from ..model import Model
+
+#-----------------------------------------------------------------------------
+# Globals and constants
+#-----------------------------------------------------------------------------
+
+DEFAULT_RENDER_CACHE_SIZE = 64
+
+__all__ = (
+    'autoload_js_for_session',
+    'CachedRender',
+    'html_page_for_session',
+    'RenderCache',
+)
+
+#-----------------------------------------------------------------------------
+# General API
+#-----------------------------------------------------------------------------
+
+#-----------------------------------------------------------------------------
+# Dev API
+#-----------------------------------------------------------------------------
+
+class RenderCache(object):
+    ''' A bounded, least recently used cache of :class:`CachedRender`.
+
+    '''
+
+    def __init__(self, size=DEFAULT_RENDER_CACHE_SIZE):
+        if size < 1:
+            raise ValueError("size must be >= 1")
+        self._size = size
+        self._entries = OrderedDict()
+        self._nonce = uuid.uuid4().hex
+        self._slot_re = re.compile(r"__bokeh_slot_%s_([a-z]+[0-9]*)__" % self._nonce)
+        self._hits = 0
+        self._misses = 0
+
+    def __len__(self):
+        return len(self._entries)
+
+    @property
+    def hits(self):
+        ''' How many times a cached render was used. '''
+        return self._hits
+
+    @property
+    def misses(self):
+        ''' How many times a render was not cached. '''
+        return self._misses
+
+    def clear(self):
+        ''' Discard all cached renders. '''
+        self._entries.clear()
+
+    def get(self, key, render):
+        ''' Get the cached render for a key, rendering it if necessary.
+
+        Args:
+            key (hashable) :
+                All inputs of the render, other than the slot values
+
+            render (callable) :
+                A callable that accepts a ``slot(name)`` function and renders
+                text, using the strings returned by ``slot`` in place of the
+                per-request values
+
+        Returns:
+            CachedRender, or None if the render can not be cached (e.g.
+            because the slots did not appear verbatim in the text)
+
+        '''
+        if key in self._entries:
+            self._hits += 1
+            self._entries.move_to_end(key)
+            return self._entries[key]
+
+        self._misses += 1
+        text = render(self._slot)
+        parts = self._slot_re.split(text)
+        if any(self._nonce in literal.lower() for literal in parts[::2]):
+            log.debug("Not caching a render that modified its slots")
+            entry = None
+        else:
+            entry = CachedRender(parts)
+
+        self._entries[key] = entry
+        if len(self._entries) > self._size:
+            self._entries.popitem(last=False)
+        return entry
+
+    def _slot(self, name):
+        return "__bokeh_slot_%s_%s__" % (self._nonce, name)
+
+class CachedRender(object):
+    ''' Rendered text with slots for per-request values.
+
+    '''
+
+    def __init__(self, parts):
+        self._parts = parts
+        self._digest = hashlib.sha1("\0".join(parts).encode("utf-8")).hexdigest()[:16]
+
+    def fill(self, values):
+        ''' Substitute values for the slots of the text.
+
+        Args:
+            values (dict[str, str]) : values for all slots, by name
+
+        Returns:
+            str
+
+        '''
+        parts = list(self._parts)
+        parts[1::2] = [values[name] for name in parts[1::2]]
+        return "".join(parts)
+
+    def headers(self, values):
+        ''' HTTP headers for the text filled with the given values.
+
+        The ``Etag`` is computed without hashing the entire text. There is no
+        ``Last-Modified`` header, which would let browsers reuse a page with
+        the session ID and token of an earlier request.
+
+        Returns:
+            dict
+
+        '''
+        filled = "\0".join("%s=%s" % item for item in sorted(values.items()))
+        etag = '"%s-%s"' % (self._digest, hashlib.sha1(filled.encode("utf-8")).hexdigest()[:16])
+        return {"Etag": etag}
+
+def html_page_for_session(cache, session, resources):
+    ''' Render the HTML page for a session, with a cache.
+
+    This is equivalent to ``server_html_page_for_session`` with the title,
+    template and template variables of the session document.
+
+    Args:
+        cache (RenderCache) :
+
+        session (ServerSession) :
+
+        resources (Resources) :
+
+    Returns:
+        tuple(str, dict) : the page, and an ``Etag`` header for it, if it
+        was cached
+
+    '''
+    doc = session.document
+    token = session.token
+    values = dict(token=token)
+    values.update(("root%d" % i, root.id) for i, root in enumerate(doc.roots))
+
+    key = _page_key(doc, resources)
+    if key is not None and _safe_values(values):
+        def render(slot):
+            roots = [_RootSlot(slot("root%d" % i), root.name, root.tags) for i, root in enumerate(doc.roots)]
+            render_item = RenderItem(token=slot("token"), roots=roots, use_for_title=True)
+            bundle = bundle_for_objs_and_resources(None, resources)
+            return html_page_for_render_items(bundle, {}, [render_item], doc.title,
+                template=doc.template, template_variables=doc.template_variables or {})
+        entry = cache.get(key, render)
+        if entry is not None:
+            return entry.fill(values), entry.headers(values)
+
+    page = server_html_page_for_session(session,
+                                        resources=resources,
+                                        title=doc.title,
+                                        template=doc.template,
+                                        template_variables=doc.template_variables)
+    return page, {}
+
+def autoload_js_for_session(cache, session, resources, element_id, app_path, absolute_url):
+    ''' Render the autoload script for a session, with a cache.
+
+    Args:
+        cache (RenderCache) :
+
+        session (ServerSession) :
+
+        resources (Resources or None) :
+
+        element_id (str) :
+
+        app_path (str) :
+
+        absolute_url (str or None) :
+
+    Returns:
+        tuple(str, dict) : the script, and an ``Etag`` header for it, if it
+        was cached
+
+    '''
+    def render(slot):
+        bundle = bundle_for_objs_and_resources(None, resources)
+        render_items = [RenderItem(token=slot("token"), elementid=element_id, use_for_title=False)]
+        bundle.add(Script(script_for_render_items(None, render_items, app_path=app_path, absolute_url=absolute_url)))
+        return AUTOLOAD_JS.render(bundle=bundle, elementid=element_id)
+
+    values = dict(token=session.token)
+    if _safe_values(values):
+        key = ("autoload", _resources_key(resources), element_id, app_path, absolute_url)
+        entry = cache.get(key, render)
+        if entry is not None:
+            return entry.fill(values), entry.headers(values)
+
+    return render(lambda name: values[name]), {}
+
+#-----------------------------------------------------------------------------
+# Private API
+#-----------------------------------------------------------------------------
+
+class _RootSlot(object):
+    ''' Stands in for a document root while rendering with slots. '''
+
+    def __init__(self, id, name, tags):
+        self.id = id
+        self.name = name
+        self.tags = tags
+
+class _Uncacheable(Exception):
+    pass
+
+# slot values are substituted verbatim, so they must not contain anything
+# that rendering would have escaped (session tokens may be supplied by clients)
+_safe_value = re.compile(r"^[A-Za-z0-9_.\-]*$").match
+
+def _safe_values(values):
+    return all(isinstance(value, str) and _safe_value(value) for value in values.values())
+
+def _freeze(value):
+    if value is None or isinstance(value, (bool, int, float, str)):
+        return value
+    if isinstance(value, (list, tuple)):
+        return (type(value).__name__,) + tuple(_freeze(item) for item in value)
+    if isinstance(value, dict):
+        return ("dict",) + tuple(sorted((_freeze(k), _freeze(v)) for k, v in value.items()))
+    raise _Uncacheable()
+
+def _resources_key(resources):
+    if resources is None:
+        return None
+    return (type(resources).__name__, resources.mode, resources.dev, resources.minified, resources.legacy,
+            resources.log_level, resources.version, resources.root_dir, resources.root_url,
+            resources.path_versioner, tuple(resources.components("js")), tuple(resources.components("css")),
+            resources.base_dir, _extension_models_key())
+
+def _extension_models_key():
+    # models defined outside of Bokeh (e.g. by the application code) may add
+    # compiled code, extension bundles or external resources to the page
+    return tuple(sorted(name for name, cls in Model.model_class_reverse_map.items()
+                        if not cls.__module__.startswith("bokeh.")))
+
+def _page_key(doc, resources):
+    template = doc.template
+    try:
+        hash(template)
+        return ("page",
+                _resources_key(resources),
+                _freeze(doc.title),
+                template,
+                _freeze(doc.template_variables),
+                tuple((_freeze(root.name), _freeze(root.tags)) for root in doc.roots))
+    except (_Uncacheable, TypeError):
+        return None
+
+#-----------------------------------------------------------------------------
+# Code
+#-----------------------------------------------------------------------------
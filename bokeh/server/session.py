@@ -20,14 +20,24 @@ log = logging.getLogger(__name__)
 
 # Standard library imports
 import inspect
+import threading
 import time
 
 # External imports
 from tornado import locks
 
 # Bokeh imports
+from ..document.events import ColumnsStreamedEvent, ModelChangedEvent
 from ..util.token import generate_jwt_token
-from .callbacks import _DocumentCallbackGroup
+from .callbacks import PeriodicCallback, _DocumentCallbackGroup
+from .connection import _create_patch_doc
+from .metrics import (
+    DOCUMENT_LOCK_HOLD_SECONDS,
+    DOCUMENT_LOCK_WAIT_SECONDS,
+    PERIODIC_CALLBACK_OVERRUNS,
+)
+from .tracing import trace_lock
+from .util import run_in_executor
 
 #-----------------------------------------------------------------------------
 # Globals and constants
@@ -58,30 +68,74 @@ def _needs_document_lock(func):
             return None
         self.block_expiration()
         try:
+            start = time.perf_counter()
             with await self._lock.acquire():
-                if self._pending_writes is not None:
-                    raise RuntimeError("internal class invariant violated: _pending_writes " + \
-                                       "should be None if lock is not held")
-                self._pending_writes = []
+                acquired = time.perf_counter()
+                wait = acquired - start
+                DOCUMENT_LOCK_WAIT_SECONDS.observe(wait)
                 try:
-                    result = func(self, *args, **kwargs)
-                    if inspect.isawaitable(result):
-                        # Note that this must not be outside of the critical section.
-                        # Otherwise, the async callback will be ran without document locking.
-                        result = await result
+                    if self._pending_writes is not None:
+                        raise RuntimeError("internal class invariant violated: _pending_writes " + \
+                                           "should be None if lock is not held")
+                    self._pending_writes = []
+                    try:
+                        result = func(self, *args, **kwargs)
+                        if inspect.isawaitable(result):
+                            # Note that this must not be outside of the critical section.
+                            # Otherwise, the async callback will be ran without document locking.
+                            result = await result
+                    finally:
+                        self._flush_pending_stream()
+                        # we want to be very sure we reset this or we'll
+                        # keep hitting the RuntimeError above as soon as
+                        # any callback goes wrong
+                        pending_writes = self._pending_writes
+                        self._pending_writes = None
+                    for p in pending_writes:
+                        await p
                 finally:
-                    # we want to be very sure we reset this or we'll
-                    # keep hitting the RuntimeError above as soon as
-                    # any callback goes wrong
-                    pending_writes = self._pending_writes
-                    self._pending_writes = None
-                for p in pending_writes:
-                    await p
+                    hold = time.perf_counter() - acquired
+                    DOCUMENT_LOCK_HOLD_SECONDS.observe(hold)
+                    trace_lock(self.id, _lock_origin(func, args), wait, hold)
             return result
         finally:
             self.unblock_expiration()
     return _needs_document_lock_wrapper
 
+def _lock_origin(func, args):
+    # with_document_locked runs arbitrary functions on behalf of callbacks,
+    # the function it runs is more useful to report than the method itself
+    if func.__name__ == "with_document_locked" and args:
+        return args[0]
+    return func
+
+def _count_overruns(callback, period_milliseconds):
+    ''' Wrap a periodic callback to count the invocations that take longer
+    than its period, including any time spent waiting for the document lock.
+    '''
+    def check(start):
+        if current_time() - start > period_milliseconds:
+            PERIODIC_CALLBACK_OVERRUNS.inc()
+
+    async def finish(result, start):
+        try:
+            return await result
+        finally:
+            check(start)
+
+    def _count_overruns_wrapper(*args, **kwargs):
+        start = current_time()
+        try:
+            result = callback(*args, **kwargs)
+        except Exception:
+            check(start)
+            raise
+        if inspect.isawaitable(result):
+            return finish(result, start)
+        check(start)
+        return result
+    return _count_overruns_wrapper
+
 #-----------------------------------------------------------------------------
 # General API
 #-----------------------------------------------------------------------------
@@ -97,7 +151,7 @@ class ServerSession(object):
 
     '''
 
-    def __init__(self, session_id, document, io_loop=None, token=None):
+    def __init__(self, session_id, document, io_loop=None, token=None, executor=None):
         if session_id is None:
             raise ValueError("Sessions must have an id")
         if document is None:
@@ -106,6 +160,8 @@ class ServerSession(object):
         self._token = token
         self._document = document
         self._loop = io_loop
+        self._loop_thread = threading.get_ident()
+        self._executor = executor
         self._subscribed_connections = set()
         self._last_unsubscribe_time = current_time()
         self._lock = locks.Lock()
@@ -113,6 +169,7 @@ class ServerSession(object):
         self._document.on_change_dispatch_to(self)
         self._callbacks = _DocumentCallbackGroup(io_loop)
         self._pending_writes = None
+        self._pending_stream = None
         self._destroyed = False
         self._expiration_requested = False
         self._expiration_blocked_count = 0
@@ -203,6 +260,8 @@ class ServerSession(object):
 
     def _wrap_session_callback(self, callback):
         wrapped = self._wrap_document_callback(callback.callback)
+        if isinstance(callback, PeriodicCallback):
+            wrapped = _count_overruns(wrapped, callback.period)
         return callback._copy_with_changed_callback(wrapped)
 
     def _wrap_session_callbacks(self, callbacks):
@@ -217,26 +276,75 @@ class ServerSession(object):
         if self._pending_writes is None:
             raise RuntimeError("_pending_writes should be non-None when we have a document lock, and we should have the lock when the document changes")
 
+        skip_connection = self._current_patch_connection if may_suppress else None
+
+        # consecutive streams to the same data source are combined, and only
+        # sent once the document lock is released, or another event is sent.
+        # streams from separate locked sections are only combined by the send
+        # queue of a connection that falls behind (see ServerConnection)
+        if self._pending_stream is not None:
+            pending, pending_skip_connection = self._pending_stream
+            if skip_connection is pending_skip_connection and pending.combine(event):
+                return
+            self._flush_pending_stream()
+
+        if isinstance(event, ModelChangedEvent) and isinstance(event.hint, ColumnsStreamedEvent):
+            self._pending_stream = (event, skip_connection)
+        else:
+            self._send_patch_document(event, skip_connection)
+
+    def _flush_pending_stream(self):
+        if self._pending_stream is not None:
+            event, skip_connection = self._pending_stream
+            self._pending_stream = None
+            self._send_patch_document(event, skip_connection)
+
+    def _send_patch_document(self, event, skip_connection):
         # TODO (havocp): our "change sync" protocol is flawed because if both
         # sides change the same attribute at the same time, they will each end
         # up with the state of the other and their final states will differ.
+        msg = None
         for connection in self._subscribed_connections:
-            if may_suppress and connection is self._current_patch_connection:
+            if connection is skip_connection:
                 log.trace("Not sending notification back to client %r for a change it requested", connection)
             else:
-                self._pending_writes.append(connection.send_patch_document(event))
+                # create (and encode) the message only once, and share it with
+                # every subscribed connection, rather than re-serializing the
+                # same event for each of them
+                if msg is None:
+                    msg = _create_patch_doc(connection.protocol, [event])
+                # connections with a send queue return None, there is nothing
+                # to wait for before the document lock is released
+                write = connection.send_patch_document(event, msg)
+                if write is not None:
+                    self._pending_writes.append(write)
 
     @_needs_document_lock
-    def _handle_pull(self, message, connection):
+    async def _handle_pull(self, message, connection):
         log.debug("Sending pull-doc-reply from session %r", self.id)
-        return connection.protocol.create('PULL-DOC-REPLY', message.header['msgid'], self.document)
+        return await run_in_executor(self._executor, self._create_pull_doc_reply, message, connection)
+
+    def _create_pull_doc_reply(self, message, connection):
+        msg = connection.protocol.create('PULL-DOC-REPLY', message.header['msgid'], self.document)
+        # encode the content now, which may be expensive for large documents,
+        # rather than later on the IOLoop when the message is sent
+        msg.content_json
+        return msg
 
     def _session_callback_added(self, event):
         wrapped = self._wrap_session_callback(event.callback)
-        self._callbacks.add_session_callback(wrapped)
+        self._call_on_loop(self._callbacks.add_session_callback, wrapped)
 
     def _session_callback_removed(self, event):
-        self._callbacks.remove_session_callback(event.callback)
+        self._call_on_loop(self._callbacks.remove_session_callback, event.callback)
+
+    def _call_on_loop(self, func, *args):
+        # document changes applied in the executor may add or remove session
+        # callbacks, but these must be scheduled on the IOLoop thread
+        if self._executor is None or threading.get_ident() == self._loop_thread:
+            func(*args)
+        else:
+            self._loop.add_callback(func, *args)
 
     @classmethod
     def pull(cls, message, connection):
@@ -255,10 +363,10 @@ class ServerSession(object):
         return connection.session._handle_push(message, connection)
 
     @_needs_document_lock
-    def _handle_patch(self, message, connection):
+    async def _handle_patch(self, message, connection):
         self._current_patch_connection = connection
         try:
-            message.apply_to_document(self.document, self)
+            await run_in_executor(self._executor, message.apply_to_document, self.document, self)
         finally:
             self._current_patch_connection = None
 
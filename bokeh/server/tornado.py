@@ -21,6 +21,7 @@ log = logging.getLogger(__name__)
 # Standard library imports
 import os
 import sys
+from concurrent.futures import ThreadPoolExecutor
 from pprint import pformat
 from urllib.parse import urljoin
 
@@ -31,14 +32,21 @@ from tornado.web import StaticFileHandler
 
 # Bokeh imports
 from ..application import Application
+from ..core.enums import SendQueuePolicy
 from ..resources import Resources
 from ..settings import settings
 from ..util.dependencies import import_optional
-from ..util.string import format_docstring
+from ..util.string import format_docstring, nice_join
 from .auth_provider import NullAuth
-from .connection import ServerConnection
+from .connection import (
+    DEFAULT_SEND_QUEUE_HIGH_WATERMARK,
+    DEFAULT_SEND_QUEUE_LOW_WATERMARK,
+    ServerConnection,
+)
 from .contexts import ApplicationContext
+from .metrics import CONNECTIONS, CONNECTIONS_OPENED
 from .urls import per_app_patterns, toplevel_patterns
+from .views.metrics_handler import MetricsHandler
 from .views.root_handler import RootHandler
 from .views.static_handler import StaticHandler
 
@@ -132,6 +140,37 @@ class BokehTornado(TornadoApplication):
             Number of milliseconds for unused session lifetime
             (default: {DEFAULT_UNUSED_LIFETIME_MS})
 
+        session_pool_size (int, optional) :
+            Number of initialized documents to keep ready for new sessions of
+            each application (default: 0)
+
+            Pooled documents are initialized in the background, before there
+            is a session context for them. Set to 0 to disable the pool. The
+            pool is always disabled for applications that define
+            ``on_session_created`` hooks.
+
+        session_executor_threads (int, optional) :
+            Number of worker threads used to initialize session documents,
+            apply patches from clients, and serialize documents for clients
+            (default: 0)
+
+            This keeps slow application code from blocking the IOLoop. Set
+            to 0 to do all of this on the IOLoop.
+
+        send_queue_high_watermark (int, optional) :
+            Number of queued messages for a client, beyond which the
+            ``send_queue_policy`` is applied
+            (default: {DEFAULT_SEND_QUEUE_HIGH_WATERMARK})
+
+        send_queue_low_watermark (int, optional) :
+            Number of queued messages for a client, at which the
+            ``send_queue_policy`` stops being applied
+            (default: {DEFAULT_SEND_QUEUE_LOW_WATERMARK})
+
+        send_queue_policy (SendQueuePolicy, optional) :
+            What to do with updates for clients that can not keep up,
+            see ``ServerConnection`` (default: "merge")
+
         stats_log_frequency_milliseconds (int, optional) :
             Number of milliseconds between logging stats
             (default: {DEFAULT_STATS_LOG_FREQ_MS})
@@ -160,6 +199,12 @@ class BokehTornado(TornadoApplication):
             If there are multiple Bokeh applications configured, this option
             has no effect.
 
+        use_metrics (bool, optional) :
+            Whether to export server metrics on the ``/metrics`` path, in the
+            Prometheus text exposition format (default: False)
+
+            See :mod:`bokeh.server.metrics` for the available metrics.
+
         websocket_max_message_size_bytes (int, optional):
             Set the Tornado ``websocket_max_message_size`` value.
             (default: {DEFAULT_WEBSOCKET_MAX_MESSAGE_SIZE_BYTES})
@@ -206,10 +251,16 @@ class BokehTornado(TornadoApplication):
                  keep_alive_milliseconds=DEFAULT_KEEP_ALIVE_MS,
                  check_unused_sessions_milliseconds=DEFAULT_CHECK_UNUSED_MS,
                  unused_session_lifetime_milliseconds=DEFAULT_UNUSED_LIFETIME_MS,
+                 session_pool_size=0,
+                 session_executor_threads=0,
+                 send_queue_high_watermark=DEFAULT_SEND_QUEUE_HIGH_WATERMARK,
+                 send_queue_low_watermark=DEFAULT_SEND_QUEUE_LOW_WATERMARK,
+                 send_queue_policy="merge",
                  stats_log_frequency_milliseconds=DEFAULT_STATS_LOG_FREQ_MS,
                  mem_log_frequency_milliseconds=DEFAULT_MEM_LOG_FREQ_MS,
                  use_index=True,
                  redirect_root=True,
+                 use_metrics=False,
                  websocket_max_message_size_bytes=DEFAULT_WEBSOCKET_MAX_MESSAGE_SIZE_BYTES,
                  index=None,
                  auth_provider=NullAuth(),
@@ -259,6 +310,28 @@ class BokehTornado(TornadoApplication):
             log.info("Unused sessions last for %d milliseconds", unused_session_lifetime_milliseconds)
         self._unused_session_lifetime_milliseconds = unused_session_lifetime_milliseconds
 
+        if session_pool_size < 0:
+            raise ValueError("session_pool_size must be >= 0")
+        elif session_pool_size > 0:
+            log.info("Keep %d documents ready for new sessions", session_pool_size)
+
+        if session_executor_threads < 0:
+            raise ValueError("session_executor_threads must be >= 0")
+        elif session_executor_threads > 0:
+            log.info("Run blocking session work in %d executor threads", session_executor_threads)
+            self._executor = ThreadPoolExecutor(max_workers=session_executor_threads,
+                                                thread_name_prefix="bokeh-session")
+        else:
+            self._executor = None
+
+        if not 0 <= send_queue_low_watermark <= send_queue_high_watermark:
+            raise ValueError("send queue watermarks must satisfy 0 <= send_queue_low_watermark <= send_queue_high_watermark")
+        if send_queue_policy not in SendQueuePolicy:
+            raise ValueError("send_queue_policy must be one of %s" % nice_join(SendQueuePolicy))
+        self._send_queue_options = dict(send_queue_high_watermark=send_queue_high_watermark,
+                                        send_queue_low_watermark=send_queue_low_watermark,
+                                        send_queue_policy=send_queue_policy)
+
         if stats_log_frequency_milliseconds <= 0:
             raise ValueError("stats_log_frequency_milliseconds must be > 0")
         elif stats_log_frequency_milliseconds != DEFAULT_STATS_LOG_FREQ_MS:
@@ -324,7 +397,9 @@ class BokehTornado(TornadoApplication):
         # Wrap applications in ApplicationContext
         self._applications = dict()
         for k,v in applications.items():
-            self._applications[k] = ApplicationContext(v, url=k, logout_url=self.auth_provider.logout_url)
+            self._applications[k] = ApplicationContext(v, url=k, logout_url=self.auth_provider.logout_url,
+                                                       session_pool_size=session_pool_size,
+                                                       executor=self._executor)
 
         extra_patterns = extra_patterns or []
         extra_patterns.extend(self.auth_provider.endpoints)
@@ -369,6 +444,10 @@ class BokehTornado(TornadoApplication):
                             "use_redirect": redirect_root}
                     prefixed_pat = (self._prefix + p[0],) + p[1:] + (data,)
                     all_patterns.append(prefixed_pat)
+            elif p[1] == MetricsHandler:
+                if use_metrics:
+                    prefixed_pat = (self._prefix + p[0],) + p[1:]
+                    all_patterns.append(prefixed_pat)
             else:
                 prefixed_pat = (self._prefix + p[0],) + p[1:]
                 all_patterns.append(prefixed_pat)
@@ -546,6 +625,8 @@ class BokehTornado(TornadoApplication):
 
         for context in self._applications.values():
             self._loop.spawn_callback(context.run_load_hook)
+            if context.session_pool.size > 0:
+                self._loop.spawn_callback(context.session_pool.fill)
 
     def stop(self, wait=True):
         ''' Stop the Bokeh Server application.
@@ -561,6 +642,7 @@ class BokehTornado(TornadoApplication):
         # TODO should probably close all connections and shut down all sessions here
         for context in self._applications.values():
             context.run_unload_hook()
+            context.session_pool.clear()
 
         self._stats_job.stop()
         if self._mem_job is not None:
@@ -571,13 +653,20 @@ class BokehTornado(TornadoApplication):
 
         self._clients.clear()
 
+        if self._executor is not None:
+            self._executor.shutdown(wait=wait)
+
     def new_connection(self, protocol, socket, application_context, session):
-        connection = ServerConnection(protocol, socket, application_context, session)
+        connection = ServerConnection(protocol, socket, application_context, session, **self._send_queue_options)
         self._clients.add(connection)
+        CONNECTIONS.inc()
+        CONNECTIONS_OPENED.inc()
         return connection
 
     def client_lost(self, connection):
-        self._clients.discard(connection)
+        if connection in self._clients:
+            self._clients.discard(connection)
+            CONNECTIONS.dec()
         connection.detach_session()
 
     def get_session(self, app_path, session_id):
@@ -639,6 +728,10 @@ class BokehTornado(TornadoApplication):
                     unused_count += 1
             log.debug("[pid %d]   %s has %d sessions with %d unused",
                       os.getpid(), app_path, len(sessions), unused_count)
+            pool = app.session_pool
+            if pool.size > 0:
+                log.debug("[pid %d]   %s has %d pooled documents ready, %d hits and %d misses",
+                          os.getpid(), app_path, len(pool), pool.hits, pool.misses)
 
     def _log_mem(self):
         import psutil
@@ -684,6 +777,8 @@ BokehTornado.__doc__ = format_docstring(
     DEFAULT_UNUSED_LIFETIME_MS=DEFAULT_UNUSED_LIFETIME_MS,
     DEFAULT_WEBSOCKET_MAX_MESSAGE_SIZE_BYTES=DEFAULT_WEBSOCKET_MAX_MESSAGE_SIZE_BYTES,
     DEFAULT_SESSION_TOKEN_EXPIRATION=DEFAULT_SESSION_TOKEN_EXPIRATION,
+    DEFAULT_SEND_QUEUE_HIGH_WATERMARK=DEFAULT_SEND_QUEUE_HIGH_WATERMARK,
+    DEFAULT_SEND_QUEUE_LOW_WATERMARK=DEFAULT_SEND_QUEUE_LOW_WATERMARK,
 )
 
 # See https://github.com/bokeh/bokeh/issues/9507
@@ -0,0 +1,229 @@
+#-----------------------------------------------------------------------------
+# Copyright (c) 2012 - 2020, Anaconda, Inc., and Bokeh Contributors.
+# All rights reserved.
+#
+# The full license is in the file LICENSE.txt, distributed with this software.
+#-----------------------------------------------------------------------------
+''' Provide hooks to trace the sections of code that run with the document
+of a session locked.
+
+All work on the document of a session (callbacks, patches from clients,
+pulls, etc.) is serialized by a lock, so a slow callback delays everything
+else in its session. Every time the lock is released, all tracers added with
+:func:`add_lock_tracer` are called with a :class:`LockTrace` that records
+how long the lock was waited for and held, and what held it:
+
+.. code-block:: python
+
+    from bokeh.server.tracing import add_lock_tracer
+
+    def tracer(trace):
+        if trace.hold > 0.1:
+            print("%s held the lock of session %s for %0.3fs" % (trace.origin, trace.session_id, trace.hold))
+
+    add_lock_tracer(tracer)
+
+A :class:`LockProfiler` is a tracer that summarizes the traces by origin,
+e.g. for ``bokeh serve --profile-locks``.
+
+'''
+
+#-----------------------------------------------------------------------------
+# Boilerplate
+#-----------------------------------------------------------------------------
+import logging # isort:skip
+log = logging.getLogger(__name__)
+
+#-----------------------------------------------------------------------------
+# Imports
+#-----------------------------------------------------------------------------
+
+# Standard library imports
+from collections import namedtuple
+from functools import partial
+
+#-----------------------------------------------------------------------------
+# Globals and constants
+#-----------------------------------------------------------------------------
+
+__all__ = (
+    'add_lock_tracer',
+    'LockProfiler',
+    'LockTrace',
+    'remove_lock_tracer',
+)
+
+#-----------------------------------------------------------------------------
+# General API
+#-----------------------------------------------------------------------------
+
+LockTrace = namedtuple("LockTrace", ["session_id", "origin", "wait", "hold"])
+LockTrace.__doc__ = ''' A record of one section of code that held the document
+lock of a session.
+
+Attributes:
+    session_id (str) : the ID of the session
+    origin (str) : the qualified name of the callable that held the lock
+    wait (float) : the time (in seconds) spent waiting for the lock
+    hold (float) : the time (in seconds) the lock was held
+
+'''
+
+def add_lock_tracer(tracer):
+    ''' Add a callable to be called with a :class:`LockTrace` every time the
+    document lock of a session is released.
+
+    Tracers are called on the ``IOLoop``, and should return quickly.
+
+    Args:
+        tracer (callable) : a callable that accepts a ``LockTrace``
+
+    Returns:
+        None
+
+    '''
+    _tracers.append(tracer)
+
+def remove_lock_tracer(tracer):
+    ''' Remove a callable previously added with :func:`add_lock_tracer`.
+
+    Args:
+        tracer (callable) : the callable to remove
+
+    Returns:
+        None
+
+    Raises:
+        ValueError, if the tracer was not added
+
+    '''
+    _tracers.remove(tracer)
+
+class LockProfiler(object):
+    ''' A lock tracer that aggregates wait and hold times by origin.
+
+    .. code-block:: python
+
+        profiler = LockProfiler()
+        add_lock_tracer(profiler)
+        ...
+        print(profiler.summary())
+
+    '''
+
+    def __init__(self):
+        self._stats = {}
+
+    def __call__(self, trace):
+        stats = self._stats.get(trace.origin)
+        if stats is None:
+            stats = self._stats[trace.origin] = _LockStats()
+        stats.add(trace)
+
+    def reset(self):
+        ''' Discard all collected statistics.
+
+        '''
+        self._stats.clear()
+
+    def stats(self):
+        ''' The collected statistics, ordered by total hold time.
+
+        Returns:
+            list[dict] : with keys ``origin``, ``count``, ``wait_total``,
+            ``wait_max``, ``hold_total`` and ``hold_max`` (times in seconds)
+
+        '''
+        result = [dict(origin=origin, **stats.to_dict()) for origin, stats in self._stats.items()]
+        return sorted(result, key=lambda item: item["hold_total"], reverse=True)
+
+    def summary(self, limit=20):
+        ''' A table of the origins that held document locks the longest.
+
+        Args:
+            limit (int or None, optional) :
+                The number of origins to include, or None to include all
+                (default: 20)
+
+        Returns:
+            str
+
+        '''
+        stats = self.stats()
+        if not stats:
+            return "No document locks were held"
+        if limit is not None:
+            stats = stats[:limit]
+        header = ("count", "hold total", "hold max", "wait total", "wait max", "origin")
+        rows = [("%d" % s["count"],
+                 "%0.3fs" % s["hold_total"], "%0.3fs" % s["hold_max"],
+                 "%0.3fs" % s["wait_total"], "%0.3fs" % s["wait_max"],
+                 s["origin"]) for s in stats]
+        widths = [max(len(row[i]) for row in [header] + rows) for i in range(len(header) - 1)]
+        lines = []
+        for row in [header] + rows:
+            cells = [cell.rjust(width) for cell, width in zip(row, widths)]
+            lines.append("  ".join(cells + [row[-1]]))
+        return "\n".join(lines)
+
+#-----------------------------------------------------------------------------
+# Dev API
+#-----------------------------------------------------------------------------
+
+def trace_lock(session_id, origin, wait, hold):
+    ''' Call all lock tracers with a new :class:`LockTrace`.
+
+    The ``origin`` callable is only named if there are any tracers. Errors
+    raised by tracers are logged and otherwise ignored.
+
+    '''
+    if not _tracers:
+        return
+    trace = LockTrace(session_id, callable_name(origin), wait, hold)
+    for tracer in list(_tracers):
+        try:
+            tracer(trace)
+        except Exception as e:
+            log.error("Error running document lock tracer %r: %r", tracer, e, exc_info=True)
+
+def callable_name(func):
+    ''' A readable, qualified name for a callable, to identify the origin
+    of a locked section.
+
+    '''
+    while isinstance(func, partial):
+        func = func.func
+    qualname = getattr(func, "__qualname__", None)
+    if qualname is None:
+        return repr(func)
+    module = getattr(func, "__module__", None)
+    return qualname if module is None else "%s.%s" % (module, qualname)
+
+#-----------------------------------------------------------------------------
+# Private API
+#-----------------------------------------------------------------------------
+
+_tracers = []
+
+class _LockStats(object):
+
+    __slots__ = ('count', 'wait_total', 'wait_max', 'hold_total', 'hold_max')
+
+    def __init__(self):
+        self.count = 0
+        self.wait_total = self.wait_max = 0.0
+        self.hold_total = self.hold_max = 0.0
+
+    def add(self, trace):
+        self.count += 1
+        self.wait_total += trace.wait
+        self.wait_max = max(self.wait_max, trace.wait)
+        self.hold_total += trace.hold
+        self.hold_max = max(self.hold_max, trace.hold)
+
+    def to_dict(self):
+        return {name: getattr(self, name) for name in self.__slots__}
+
+#-----------------------------------------------------------------------------
+# Code
+#-----------------------------------------------------------------------------
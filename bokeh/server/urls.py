@@ -20,8 +20,9 @@ built-in ``HTTPServer``.
     .. code-block:: python
 
         [
-            ( r'/?',           RootHandler   ), # <prefix>/
-            ( r'/static/(.*)', StaticHandler ), # <prefix>/static/
+            ( r'/?',           RootHandler    ), # <prefix>/
+            ( r'/static/(.*)', StaticHandler  ), # <prefix>/static/
+            ( r'/metrics',     MetricsHandler ), # <prefix>/metrics (if enabled)
         ]
 
 .. data:: per_app_patterns
@@ -57,6 +58,7 @@ from ..embed.bundle import extension_dirs
 from .views.autoload_js_handler import AutoloadJsHandler
 from .views.doc_handler import DocHandler
 from .views.metadata_handler import MetadataHandler
+from .views.metrics_handler import MetricsHandler
 from .views.multi_root_static_handler import MultiRootStaticHandler
 from .views.root_handler import RootHandler
 from .views.static_handler import StaticHandler
@@ -83,6 +85,7 @@ toplevel_patterns = [
     (r'/?', RootHandler),
     (r'/static/extensions/(.*)', MultiRootStaticHandler, dict(root=extension_dirs)),
     (r'/static/(.*)', StaticHandler),
+    (r'/metrics', MetricsHandler),
 ]
 
 per_app_patterns = [
@@ -21,6 +21,10 @@ log = logging.getLogger(__name__)
 
 # External imports
 from tornado import netutil
+from tornado.ioloop import IOLoop
+
+# Bokeh imports
+from ..io.doc import isolated_curdoc
 
 #-----------------------------------------------------------------------------
 # Globals and constants
@@ -31,6 +35,7 @@ __all__ = (
     'check_whitelist',
     'create_hosts_whitelist',
     'match_host',
+    'run_in_executor',
 )
 
 #-----------------------------------------------------------------------------
@@ -237,10 +242,41 @@ def match_host(host, pattern):
 # Dev API
 #-----------------------------------------------------------------------------
 
+async def run_in_executor(executor, func, *args):
+    ''' Run a blocking function in an executor without blocking the IOLoop.
+
+    The function runs with its own current document (see
+    ``bokeh.io.doc.isolated_curdoc``), so that it does not interfere with
+    code running on the IOLoop thread.
+
+    Args:
+        executor (concurrent.futures.Executor or None) :
+            A thread pool executor to run ``func`` in.
+
+            If None, ``func`` is called directly on the current thread.
+
+        func (callable) :
+            A function to call
+
+        args :
+            Positional arguments to pass to ``func``
+
+    Returns:
+        The return value of ``func``
+
+    '''
+    if executor is None:
+        return func(*args)
+    return await IOLoop.current().run_in_executor(executor, _call_with_isolated_curdoc, func, args)
+
 #-----------------------------------------------------------------------------
 # Private API
 #-----------------------------------------------------------------------------
 
+def _call_with_isolated_curdoc(func, args):
+    with isolated_curdoc():
+        return func(*args)
+
 #-----------------------------------------------------------------------------
 # Code
 #-----------------------------------------------------------------------------
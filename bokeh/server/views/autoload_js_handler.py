@@ -22,12 +22,7 @@ log = logging.getLogger(__name__)
 from urllib.parse import urlparse
 
 # Bokeh imports
-from bokeh.core.templates import AUTOLOAD_JS
-from bokeh.embed.bundle import Script, bundle_for_objs_and_resources
-from bokeh.embed.elements import script_for_render_items
-from bokeh.embed.util import RenderItem
-
-# Bokeh imports
+from ..render_cache import autoload_js_for_session
 from .session_handler import SessionHandler
 
 #-----------------------------------------------------------------------------
@@ -74,14 +69,13 @@ class AutoloadJsHandler(SessionHandler):
 
         resources_param = self.get_argument("resources", "default")
         resources = self.application.resources(server_url) if resources_param != "none" else None
-        bundle = bundle_for_objs_and_resources(None, resources)
-
-        render_items = [RenderItem(token=session.token, elementid=element_id, use_for_title=False)]
-        bundle.add(Script(script_for_render_items(None, render_items, app_path=app_path, absolute_url=absolute_url)))
 
-        js = AUTOLOAD_JS.render(bundle=bundle, elementid=element_id)
+        js, headers = autoload_js_for_session(self.application_context.render_cache,
+                                              session, resources, element_id, app_path, absolute_url)
 
         self.set_header("Content-Type", 'application/javascript')
+        for name, value in headers.items():
+            self.set_header(name, value)
         self.write(js)
 
     async def options(self, *args, **kwargs):
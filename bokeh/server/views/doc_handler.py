@@ -22,9 +22,7 @@ log = logging.getLogger(__name__)
 from tornado.web import authenticated
 
 # Bokeh imports
-from bokeh.embed.server import server_html_page_for_session
-
-# Bokeh imports
+from ..render_cache import html_page_for_session
 from .session_handler import SessionHandler
 
 #-----------------------------------------------------------------------------
@@ -51,13 +49,13 @@ class DocHandler(SessionHandler):
     async def get(self, *args, **kwargs):
         session = await self.get_session()
 
-        page = server_html_page_for_session(session,
-                                            resources=self.application.resources(),
-                                            title=session.document.title,
-                                            template=session.document.template,
-                                            template_variables=session.document.template_variables)
+        page, headers = html_page_for_session(self.application_context.render_cache,
+                                              session,
+                                              resources=self.application.resources())
 
         self.set_header("Content-Type", 'text/html')
+        for name, value in headers.items():
+            self.set_header(name, value)
         self.write(page)
 
 #-----------------------------------------------------------------------------
@@ -0,0 +1,61 @@
+#-----------------------------------------------------------------------------
+# Copyright (c) 2012 - 2020, Anaconda, Inc., and Bokeh Contributors.
+# All rights reserved.
+#
+# The full license is in the file LICENSE.txt, distributed with this software.
+#-----------------------------------------------------------------------------
+''' Provide a request handler that exports the metrics of the Bokeh server
+in the Prometheus text exposition format.
+
+'''
+
+#-----------------------------------------------------------------------------
+# Boilerplate
+#-----------------------------------------------------------------------------
+import logging # isort:skip
+log = logging.getLogger(__name__)
+
+#-----------------------------------------------------------------------------
+# Imports
+#-----------------------------------------------------------------------------
+
+# External imports
+from tornado.web import RequestHandler, authenticated
+
+# Bokeh imports
+from ..metrics import CONTENT_TYPE, registry
+from .auth_mixin import AuthMixin
+
+#-----------------------------------------------------------------------------
+# Globals and constants
+#-----------------------------------------------------------------------------
+
+__all__ = (
+    'MetricsHandler',
+)
+
+#-----------------------------------------------------------------------------
+# General API
+#-----------------------------------------------------------------------------
+
+#-----------------------------------------------------------------------------
+# Dev API
+#-----------------------------------------------------------------------------
+
+class MetricsHandler(AuthMixin, RequestHandler):
+    ''' Implements a custom Tornado handler for scraping server metrics
+
+    '''
+
+    @authenticated
+    async def get(self, *args, **kwargs):
+        self.set_header("Content-Type", CONTENT_TYPE)
+        self.write(registry.render())
+
+#-----------------------------------------------------------------------------
+# Private API
+#-----------------------------------------------------------------------------
+
+#-----------------------------------------------------------------------------
+# Code
+#-----------------------------------------------------------------------------
@@ -303,7 +303,8 @@ class WSHandler(WebSocketHandler):
 
     async def _schedule(self, work):
         if isinstance(work, Message):
-            await self.send_message(work)
+            # queue replies in order with any PATCH-DOC messages for this client
+            self.connection.send(work)
         else:
             self._internal_error("expected a Message not " + repr(work))
 
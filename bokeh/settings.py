@@ -286,10 +286,17 @@ class PrioritizedSetting(object):
         self._name = name
         self._parent = None
         self._user_value = _Unset
+        self._cached = None
 
     def __call__(self, value=None, default=_Unset):
         '''Return the setting value according to the standard precedence.
 
+        The value is cached when no immediate value or local default is
+        given. The cached value is used until the setting is set or unset,
+        the config files of the settings change (see ``Settings.load_config``
+        and ``Settings.refresh``), or the environment variables for the
+        setting (or ``BOKEH_DEV``, for settings with a dev default) change.
+
         Args:
             value (any, optional):
                 An optional immediate value. If not None, the value will
@@ -310,39 +317,18 @@ class PrioritizedSetting(object):
         if value is not None:
             return self._convert(value)
 
-        # 6. previously user-set value
-        if self._user_value is not _Unset:
-            return self._convert(self._user_value)
-
-        # 5. user-named config file
-        if self._parent and self._name in self._parent.config_override:
-            return self._convert(self._parent.config_override[self._name])
-
-        # 4. environment variable
-        if self._env_var and self._env_var in os.environ:
-            return self._convert(os.environ[self._env_var])
-
-        # 3. local config file
-        if self._parent and self._name in self._parent.config_user:
-            return self._convert(self._parent.config_user[self._name])
-
-        # 2. global config file
-        if self._parent and self._name in self._parent.config_system:
-            return self._convert(self._parent.config_system[self._name])
-
-        # 1.5 (undocumented) dev defaults take precedence over other defaults
-        if is_dev() and self._dev_default is not _Unset:
-            return self._convert(self._dev_default)
-
-        # 1. local defaults
         if default is not _Unset:
-            return self._convert(default)
+            return self._resolve(default)
 
-        # 0. global defaults
-        if self._default is not _Unset:
-            return self._convert(self._default)
+        key = self._cache_key()
+        cached = self._cached
+        if cached is not None and cached[0] == key:
+            return cached[1]
 
-        raise RuntimeError("No configured value found for setting %r" % self._name)
+        result = self._resolve(default)
+        if key is not None:
+            self._cached = (key, result)  # lgtm [py/mutable-descriptor]
+        return result
 
     def __get__(self, instance, owner):
         return self
@@ -368,12 +354,14 @@ class PrioritizedSetting(object):
         # data directly on them. But in our case we only ever have one single
         # instance of a Settings object.
         self._user_value = value  # lgtm [py/mutable-descriptor]
+        self._cached = None  # lgtm [py/mutable-descriptor]
 
     def unset_value(self):
         ''' Unset the previous user value such that the priority is reset.
 
         '''
         self._user_value = _Unset
+        self._cached = None
 
     @property
     def env_var(self):
@@ -402,6 +390,55 @@ class PrioritizedSetting(object):
         if self._convert is convert_logging: return "Log Level"
         if self._convert is convert_str_seq: return "List[String]"
 
+    def _cache_key(self):
+        # settings can only detect changes to the config files of a Settings
+        # object, so never cache values for other kinds of parents
+        if self._parent is None:
+            generation = None
+        else:
+            generation = getattr(self._parent, "_generation", None)
+            if generation is None:
+                return None
+        env_value = os.environ.get(self._env_var) if self._env_var else None
+        if self._dev_default is _Unset:
+            return (generation, env_value)
+        return (generation, env_value, os.environ.get("BOKEH_DEV"))
+
+    def _resolve(self, default):
+        # 6. previously user-set value
+        if self._user_value is not _Unset:
+            return self._convert(self._user_value)
+
+        # 5. user-named config file
+        if self._parent and self._name in self._parent.config_override:
+            return self._convert(self._parent.config_override[self._name])
+
+        # 4. environment variable
+        if self._env_var and self._env_var in os.environ:
+            return self._convert(os.environ[self._env_var])
+
+        # 3. local config file
+        if self._parent and self._name in self._parent.config_user:
+            return self._convert(self._parent.config_user[self._name])
+
+        # 2. global config file
+        if self._parent and self._name in self._parent.config_system:
+            return self._convert(self._parent.config_system[self._name])
+
+        # 1.5 (undocumented) dev defaults take precedence over other defaults
+        if is_dev() and self._dev_default is not _Unset:
+            return self._convert(self._dev_default)
+
+        # 1. local defaults
+        if default is not _Unset:
+            return self._convert(default)
+
+        # 0. global defaults
+        if self._default is not _Unset:
+            return self._convert(self._default)
+
+        raise RuntimeError("No configured value found for setting %r" % self._name)
+
 _config_user_locations = (
     join(expanduser("~"), ".bokeh", "bokeh.yaml"),
 )
@@ -418,6 +455,10 @@ class Settings(object):
         self._config_user = self._try_load_config(_config_user_locations)
         self._config_system = {} # TODO (bev)
 
+        # incremented whenever the config files change, to invalidate the
+        # values cached by the settings
+        self._generation = 0
+
         for x in self.__class__.__dict__.values():
             if isinstance(x, PrioritizedSetting):
                 x._parent = self
@@ -466,6 +507,25 @@ class Settings(object):
     See the :class:`~bokeh.resources.Resources` class reference for full details.
     """)
 
+    compact_ids = PrioritizedSetting("compact_ids", "BOKEH_COMPACT_IDS", default=False, convert=convert_bool, help="""
+    Whether simple model IDs should be formatted in base 36 (e.g. "rs" instead
+    of "1000"), to reduce the size of serialized documents with many models.
+
+    This setting has no effect if ``simple_ids`` is False. It should not be
+    changed while documents are being created, since IDs created before and
+    after the change may collide.
+    """)
+
+    compiler_cache_dir = PrioritizedSetting("compiler_cache_dir", "BOKEH_COMPILER_CACHE_DIR", default=None, help="""
+    A directory to cache the compiled implementations of custom models in.
+
+    Compiled implementations are stored by a hash of their source code,
+    language, npm dependencies and the Bokeh version, so that new processes
+    (e.g. every worker of ``bokeh serve --num-procs``) do not have to compile
+    them again with Node.js. The directory may be shared between processes.
+    By default, nothing is cached on disk.
+    """)
+
     cookie_secret = PrioritizedSetting("cookie_secret", "BOKEH_COOKIE_SECRET", default=None, help="""
     Configure the ``cookie_secret`` setting in Tornado. This value is required
     if you use ``get_secure_cookie`` or ``set_secure_cookie``.  It should be a
@@ -506,6 +566,16 @@ class Settings(object):
     Whether to ignore the current script filename when saving Bokeh content.
     """)
 
+    json_backend = PrioritizedSetting("json_backend", "BOKEH_JSON_BACKEND", default="json", help="""
+    Which JSON encoder to use for messages sent to BokehJS over the wire.
+
+    Valid values are ``"json"`` (the standard library), ``"orjson"`` or
+    ``"auto"``, which uses ``orjson`` when it is installed and the standard
+    library otherwise. Both backends reject NaN and infinite float values.
+    Output that has to be reproducible, e.g. standalone HTML or the
+    ``bokeh json`` command, always uses the standard library.
+    """)
+
     log_level = PrioritizedSetting("log_level", "BOKEH_LOG_LEVEL", default="info", dev_default="debug", help="""
     Set the log level for JavaScript BokehJS code.
 
@@ -578,6 +648,16 @@ class Settings(object):
     A long, cryptographically-random secret unique to a Bokeh deployment.
     """)
 
+    session_template = PrioritizedSetting("session_template", "BOKEH_SESSION_TEMPLATE", default=False, convert=convert_bool, help="""
+    Whether Bokeh server applications should build a template document once,
+    and give each new session a copy of it, instead of running the application
+    code for every session.
+
+    This only works for applications that do not depend on per-session state
+    (e.g. request arguments) and do not add Python callbacks. Applications that
+    do are detected, and fall back to running the application code.
+    """)
+
     sign_sessions = PrioritizedSetting("sign_sessions", "BOKEH_SIGN_SESSIONS", default=False, help="""
     Whether the Boeh server should only allow sessions signed with a secret key.
 
@@ -658,6 +738,21 @@ class Settings(object):
             self._config_override = yaml.load(open(abspath(location)), Loader=yaml.SafeLoader)
         except Exception:
             raise RuntimeError("Could not load Bokeh config file: {}".format(location))
+        self._generation += 1
+
+    def refresh(self):
+        ''' Reload the local user config file, and discard all cached setting
+        values.
+
+        Setting values are cached, and only looked up again when they are set
+        or unset, when a config file is loaded with ``load_config``, or when
+        the environment variables for the setting (or ``BOKEH_DEV``) change.
+        Call this method if anything else may have changed, e.g. the contents
+        of ``${HOME}/.bokeh/bokeh.yaml``.
+
+        '''
+        self._config_user = self._try_load_config(_config_user_locations)
+        self._generation += 1
 
     def secret_key_bytes(self) -> Optional[bytes]:
         ''' Return the secret_key, converted to bytes and cached.
@@ -25,6 +25,7 @@ import json
 import os
 import re
 import sys
+import tempfile
 from collections import OrderedDict
 from os.path import abspath, dirname, exists, isabs, join
 from subprocess import PIPE, Popen
@@ -33,6 +34,7 @@ from subprocess import PIPE, Popen
 from ..model import Model
 from ..settings import settings
 from .string import snakify
+from .version import __version__
 
 #-----------------------------------------------------------------------------
 # Globals and constants
@@ -466,32 +468,96 @@ def _get_custom_models(models):
         return None
     return custom_models
 
-def _compile_models(custom_models):
+def _compile_models(custom_models, compiler):
     """Returns the compiled implementation of supplied `models`. """
     ordered_models = sorted(custom_models.values(), key=lambda model: model.full_name)
     custom_impls = {}
 
-    dependencies = []
-    for model in ordered_models:
-        dependencies.extend(list(model.dependencies.items()))
-
-    if dependencies:
-        dependencies = sorted(dependencies, key=lambda name_version: name_version[0])
-        _run_npmjs(["install", "--no-progress"] + [ name + "@" + version for (name, version) in dependencies ])
-
     for model in ordered_models:
         impl = model.implementation
         compiled = _CACHING_IMPLEMENTATION(model, impl)
         if compiled is None:
-            compiled = nodejs_compile(impl.code, lang=impl.lang, file=impl.file)
-
-        if "error" in compiled:
+            compiled = compiler(impl)
+        elif "error" in compiled:
             raise CompilationError(compiled.error)
 
         custom_impls[model.full_name] = compiled
 
     return custom_impls
 
+def _model_dependencies(custom_models):
+    """Returns the npm dependencies of supplied `models`, sorted by name. """
+    dependencies = []
+    for model in custom_models.values():
+        dependencies.extend(list(model.dependencies.items()))
+    return sorted(dependencies)
+
+class _Compiler(object):
+    """Compiles implementations with nodejs, using the compiled cache.
+
+    The npm dependencies are only installed if some implementation actually
+    has to be compiled.
+
+    """
+
+    def __init__(self, dependencies):
+        self.dependencies = dependencies
+        self.installed = False
+
+    def __call__(self, impl):
+        key = _compiled_cache_key(impl, self.dependencies)
+        compiled = _compiled_cache_get(key)
+        if compiled is None:
+            if self.dependencies and not self.installed:
+                _run_npmjs(["install", "--no-progress"] + [ name + "@" + version for (name, version) in self.dependencies ])
+                self.installed = True
+
+            compiled = nodejs_compile(impl.code, lang=impl.lang, file=impl.file)
+            if "error" in compiled:
+                raise CompilationError(compiled.error)
+
+            _compiled_cache_set(key, compiled)
+        return compiled
+
+def _compiled_cache_key(impl, dependencies):
+    """Returns a key for the compiled `impl`, derived from everything the
+    compiler output depends on. """
+    data = json.dumps([__version__, impl.code, impl.lang, impl.file, dependencies])
+    return hashlib.sha256(data.encode("utf-8")).hexdigest()
+
+def _compiled_cache_get(key):
+    """Returns the compiled implementation stored for `key`, or None. """
+    cache_dir = settings.compiler_cache_dir()
+    if cache_dir is None:
+        return None
+    try:
+        with io.open(join(cache_dir, key + ".json"), encoding="utf-8") as f:
+            return AttrDict(json.loads(f.read()))
+    except (OSError, ValueError):
+        return None
+
+def _compiled_cache_set(key, compiled):
+    """Stores a compiled implementation for `key`.
+
+    The file is written under a temporary name and renamed into place, so that
+    concurrent processes never read a partially written file.
+
+    """
+    cache_dir = settings.compiler_cache_dir()
+    if cache_dir is None:
+        return
+    path = None
+    try:
+        os.makedirs(cache_dir, exist_ok=True)
+        fd, path = tempfile.mkstemp(prefix=key, suffix=".tmp", dir=cache_dir)
+        with io.open(fd, "w", encoding="utf-8") as f:
+            f.write(json.dumps(compiled))
+        os.replace(path, join(cache_dir, key + ".json"))
+    except OSError as e:
+        log.warning("Unable to cache a compiled implementation in %r: %s", cache_dir, e)
+        if path is not None and exists(path):
+            os.remove(path)
+
 def _bundle_models(custom_models):
     """ Create a JavaScript bundle with selected `models`. """
     exports = []
@@ -506,7 +572,8 @@ def _bundle_models(custom_models):
         if canonical is not None:
             known_modules.add(canonical)
 
-    custom_impls = _compile_models(custom_models)
+    compiler = _Compiler(_model_dependencies(custom_models))
+    custom_impls = _compile_models(custom_models, compiler)
 
     extra_modules = {}
 
@@ -530,10 +597,7 @@ def _bundle_models(custom_models):
                         raise RuntimeError("no such module: %s" % module)
 
                 impl = FromFile(path)
-                compiled = nodejs_compile(impl.code, lang=impl.lang, file=impl.file)
-
-                if "error" in compiled:
-                    raise CompilationError(compiled.error)
+                compiled = compiler(impl)
 
                 if impl.lang == "less":
                     code = _style_template % dict(css=json.dumps(compiled.code))
@@ -28,10 +28,11 @@ log = logging.getLogger(__name__)
 # Standard library imports
 import base64
 import datetime as dt
+import json
 import sys
 import uuid
-from math import isinf, isnan
-from threading import Lock
+from itertools import count
+from math import isfinite, isinf, isnan
 
 # External imports
 import numpy as np
@@ -88,8 +89,11 @@ __all__ = (
     'convert_datetime_type',
     'convert_timedelta_type',
     'decode_base64_dict',
+    'decode_binary_dict',
+    'decode_ragged_dict',
     'encode_binary_dict',
     'encode_base64_dict',
+    'encode_ragged_dict',
     'is_datetime_type',
     'is_timedelta_type',
     'make_globally_unique_id',
@@ -244,16 +248,18 @@ def make_id():
     if it is desirable to have globally unique for every object, this behavior
     can be overridden by setting the environment variable ``BOKEH_SIMPLE_IDS=no``.
 
+    Simple IDs are formatted in base 36 (e.g. ``"rs"`` instead of ``"1000"``)
+    if the environment variable ``BOKEH_COMPACT_IDS=yes`` is set, which makes
+    the JSON of documents with many models noticeably smaller.
+
     Returns:
         str
 
     '''
-    global _simple_id
-
     if settings.simple_ids():
-        with _simple_id_lock:
-            _simple_id += 1
-            return str(_simple_id)
+        # next() on an itertools counter is atomic, so no lock is needed
+        id = next(_simple_ids)
+        return _base36(id) if settings.compact_ids() else str(id)
     else:
         return make_globally_unique_id()
 
@@ -431,6 +437,12 @@ def traverse_data(obj, buffers=None):
     '''
     if all(isinstance(el, np.ndarray) for el in obj):
         return [transform_array(el, buffers=buffers) for el in obj]
+    if set(map(type, obj)) <= _numeric_types:
+        # homogeneous lists of numbers are checked in bulk
+        try:
+            return _transform_numeric_list(obj)
+        except OverflowError:
+            pass
     obj_copy = []
     for item in obj:
         # Check the base/common case first for performance reasons
@@ -482,7 +494,11 @@ def transform_column_source_data(data, buffers=None, cols=None):
         elif isinstance(data[key], np.ndarray):
             data_copy[key] = transform_array(data[key], buffers=buffers)
         else:
-            data_copy[key] = traverse_data(data[key], buffers=buffers)
+            arrays = _ragged_arrays(data[key])
+            if arrays is not None:
+                data_copy[key] = encode_ragged_dict(arrays, buffers=buffers)
+            else:
+                data_copy[key] = traverse_data(data[key], buffers=buffers)
 
     return data_copy
 
@@ -551,6 +567,53 @@ def encode_base64_dict(array):
         'dtype'        : array.dtype.name
     }
 
+def encode_ragged_dict(arrays, buffers=None):
+    ''' Encode a list of NumPy arrays of the same dtype as one concatenated
+    array, plus an array of the offsets of each array in it.
+
+    The encoded format is a dict with the following structure:
+
+    .. code:: python
+
+        {
+            '__ragged__' : << the concatenated array, as an encoded array dict >>,
+            'offsets'    : << int32 offsets, as an encoded array dict >>,
+            'shapes'     : << list of the shapes of the arrays >>,
+        }
+
+    The offsets array has one more item than there are arrays, so that
+    array ``i`` holds the items from ``offsets[i]`` up to ``offsets[i+1]``.
+
+    Args:
+        arrays (list[np.ndarray]) : arrays to encode, all with the same dtype
+
+        buffers (list, optional) :
+            If a list is provided, the concatenated array and the offsets
+            are added to it as binary buffers, otherwise they are encoded
+            with base64 (default: None)
+
+            **This is an "out" parameter**. The values it contains will be
+            modified in-place.
+
+    Returns:
+        dict
+
+    '''
+    offsets = np.zeros(len(arrays) + 1, dtype=np.int32)
+    np.cumsum([array.size for array in arrays], out=offsets[1:])
+    concatenated = np.concatenate([array.ravel() for array in arrays])
+
+    if buffers is None:
+        encode = encode_base64_dict
+    else:
+        encode = lambda array: encode_binary_dict(array, buffers)
+
+    return {
+        '__ragged__' : encode(concatenated),
+        'offsets'    : encode(offsets),
+        'shapes'     : [array.shape for array in arrays],
+    }
+
 def decode_base64_dict(data):
     ''' Decode a base64 encoded array into a NumPy array.
 
@@ -569,6 +632,64 @@ def decode_base64_dict(data):
         array = array.reshape(data['shape'])
     return array
 
+def decode_binary_dict(data, buffers):
+    ''' Decode a binary encoded array into a NumPy array.
+
+    Args:
+        data (dict) : encoded array data to decode
+
+        buffers (list) : buffer headers and payloads of a message, the
+            headers may be dicts, or JSON strings as received from the wire
+
+    Data should have the format encoded by :func:`encode_binary_dict`.
+
+    Returns:
+        np.ndarray
+
+    Raises:
+        ValueError
+
+    '''
+    buffer_id = data['__buffer__']
+    for header, payload in buffers:
+        if isinstance(header, str):
+            header = json.loads(header)
+        if header['id'] == buffer_id:
+            break
+    else:
+        raise ValueError("No buffer with id %r found" % buffer_id)
+
+    array = np.copy(np.frombuffer(payload, dtype=data['dtype']))
+    if data['order'] != sys.byteorder:
+        array = array.byteswap()
+    if len(data['shape']) > 1:
+        array = array.reshape(data['shape'])
+    return array
+
+def decode_ragged_dict(data, buffers=None):
+    ''' Decode a list of arrays encoded with :func:`encode_ragged_dict`.
+
+    Args:
+        data (dict) : encoded arrays to decode
+
+        buffers (list, optional) : buffer headers and payloads of a message,
+            needed if the arrays were encoded as binary buffers (default: None)
+
+    Returns:
+        list[np.ndarray]
+
+    '''
+    def decode(array_data):
+        if '__buffer__' in array_data:
+            return decode_binary_dict(array_data, buffers or [])
+        return decode_base64_dict(array_data)
+
+    concatenated = decode(data['__ragged__'])
+    offsets = decode(data['offsets'])
+
+    return [ concatenated[start:end].reshape(shape)
+             for start, end, shape in zip(offsets[:-1], offsets[1:], data['shapes']) ]
+
 #-----------------------------------------------------------------------------
 # Dev API
 #-----------------------------------------------------------------------------
@@ -577,8 +698,58 @@ def decode_base64_dict(data):
 # Private API
 #-----------------------------------------------------------------------------
 
-_simple_id = 999
-_simple_id_lock = Lock()
+_numeric_types = {int, float}
+
+def _transform_numeric_list(obj):
+    ''' Replace non-finite values in a list of ints and floats with strings.
+
+    Raises OverflowError if some integer does not fit a float.
+
+    '''
+    obj_copy = list(obj)
+    # a finite sum can only come from finite values
+    if isfinite(sum(obj_copy)):
+        return obj_copy
+    array = np.array(obj_copy, dtype=np.float64)
+    for i in np.flatnonzero(~np.isfinite(array)):
+        value = array[i]
+        if isnan(value):
+            obj_copy[i] = 'NaN'
+        elif value > 0:
+            obj_copy[i] = 'Infinity'
+        else:
+            obj_copy[i] = '-Infinity'
+    return obj_copy
+
+def _ragged_arrays(column):
+    ''' Return the arrays in a list column of plain NumPy arrays, if they all
+    can be packed with ``encode_ragged_dict``, otherwise None.
+
+    '''
+    if not isinstance(column, (list, tuple)) or len(column) == 0:
+        return None
+    if not all(type(el) is np.ndarray for el in column):
+        return None
+
+    arrays = [convert_datetime_array(el) for el in column]
+    dtype = arrays[0].dtype
+    if array_encoding_disabled(arrays[0]) or any(array.dtype != dtype for array in arrays):
+        return None
+    if sum(array.size for array in arrays) > np.iinfo(np.int32).max:
+        return None
+    return arrays
+
+_simple_ids = count(1000)
+
+_BASE36_DIGITS = "0123456789abcdefghijklmnopqrstuvwxyz"
+
+def _base36(n):
+    digits = []
+    while True:
+        n, digit = divmod(n, 36)
+        digits.append(_BASE36_DIGITS[digit])
+        if n == 0:
+            return "".join(reversed(digits))
 
 _dt_tuple = tuple(DATETIME_TYPES)
 
@@ -171,7 +171,10 @@ export function decode_base64(input: NDArray): [TypedArray, Shape] {
 }
 
 export function encode_base64(array: TypedArray, shape?: Shape): NDArray {
-  const b64 = arrayBufferToBase64(array.buffer)
+  // arrays may be views into a larger buffer (e.g. decoded ragged arrays)
+  const {buffer, byteOffset, byteLength} = array
+  const whole = byteOffset == 0 && byteLength == buffer.byteLength
+  const b64 = arrayBufferToBase64(whole ? buffer : buffer.slice(byteOffset, byteOffset + byteLength))
   const name = arrayName(array)
 
   let dtype: DType
@@ -188,9 +191,26 @@ export function encode_base64(array: TypedArray, shape?: Shape): NDArray {
   return data
 }
 
+export interface RaggedArray {
+  __ragged__: NDArray | BufferSpec
+  offsets: NDArray | BufferSpec
+  shapes: Shape[]
+}
+
+export function decode_ragged(obj: RaggedArray, buffers: [any, any][]): [TypedArray[], Shape[]] {
+  const [array] = process_array(obj.__ragged__, buffers) as [TypedArray, Shape]
+  const [offsets] = process_array(obj.offsets, buffers)
+
+  const arrays: TypedArray[] = []
+  for (let i = 0, end = obj.shapes.length; i < end; i++) {
+    arrays.push(array.subarray(offsets[i], offsets[i + 1]))
+  }
+  return [arrays, obj.shapes]
+}
+
 export type Shapes = {[key: string]: Shape | Shape[] | Shape[][] | Shape[][][]}
 
-export type EncodedData = {[key: string]: NDArray | Arrayable}
+export type EncodedData = {[key: string]: NDArray | RaggedArray | Arrayable}
 
 function decode_traverse_data(v: any, buffers: [any, any][]): [Arrayable, any] {
   // v is just a regular array of scalars
@@ -231,9 +251,15 @@ export function decode_column_data(data: EncodedData, buffers: [any, any][] = []
       new_data[k] = arrays
       new_shapes[k] = shapes
 
+    // ragged array of arrays, packed into a single array
+    } else if (isObject(v) && '__ragged__' in v) {
+      const [arrays, shapes] = decode_ragged(v as RaggedArray, buffers)
+      new_data[k] = arrays
+      new_shapes[k] = shapes
+
     // must be object or array (single array case)
     } else {
-      const [arr, shape] = process_array(v, buffers)
+      const [arr, shape] = process_array(v as NDArray | Arrayable, buffers)
       new_data[k] = arr
       new_shapes[k] = shape
     }
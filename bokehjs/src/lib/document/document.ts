@@ -6,7 +6,7 @@ import {HasProps} from "core/has_props"
 import {Attrs} from "core/types"
 import {Signal0} from "core/signaling"
 import {Struct, is_ref} from "core/util/refs"
-import {decode_column_data} from "core/util/serialization"
+import {BufferSpec, decode_column_data, process_array} from "core/util/serialization"
 import {MultiDict, Set as OurSet} from "core/util/data_structures"
 import {difference, intersection, copy, includes} from "core/util/array"
 import {values} from "core/util/object"
@@ -773,7 +773,7 @@ export class Document {
           if (!(column_source instanceof ColumnDataSource)) {
             throw new Error("Cannot stream to non-ColumnDataSource")
           }
-          const data = event_json.data
+          const [data] = decode_column_data(event_json.data, buffers)
           const rollover = event_json.rollover
           column_source.stream(data, rollover, setter_id)
           break
@@ -788,6 +788,16 @@ export class Document {
             throw new Error("Cannot patch non-ColumnDataSource")
           }
           const patches = event_json.patches
+          for (const k in patches) {
+            for (const patch of patches[k] as [unknown, unknown][]) {
+              // binary encoded values (e.g. for slices) arrive as buffers
+              const value = patch[1]
+              if (isPlainObject(value) && "__buffer__" in value) {
+                const [array] = process_array(value as BufferSpec, buffers)
+                patch[1] = array
+              }
+            }
+          }
           column_source.patch(patches, setter_id)
           break
         }
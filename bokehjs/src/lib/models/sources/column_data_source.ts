@@ -13,7 +13,8 @@ import {ColumnsPatchedEvent, ColumnsStreamedEvent} from "document/events"
 //exported for testing
 export function stream_to_column(col: Arrayable, new_col: Arrayable, rollover?: number): Arrayable {
   if (isArray(col)) {
-    const result = col.concat(new_col)
+    // new data may be a typed array, if it was sent as a binary buffer
+    const result = col.concat(isTypedArray(new_col) ? Array.from(new_col) : new_col)
 
     if (rollover != null && result.length > rollover)
       return result.slice(-rollover)
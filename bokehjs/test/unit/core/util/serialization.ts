@@ -146,6 +146,17 @@ describe("serialization module", () => {
         expect(shape).to.be.deep.equal(s)
       })
     }
+
+    for (const typ of GOOD_TYPES) {
+      it(`should encode only the data of ${typ.name} subarrays`, () => {
+        const array = new typ([1, 2, 3, 4]).subarray(1, 3)
+        const e = ser.encode_base64(array, [2])
+        expect(e).to.be.deep.equal(ser.encode_base64(new typ([2, 3]), [2]))
+
+        const [d] = ser.decode_base64(e)
+        expect(d).to.be.deep.equal(new typ([2, 3]))
+      })
+    }
   })
 
   describe("decode_column_data", () => {
@@ -222,6 +233,38 @@ describe("serialization module", () => {
       expect(shapes).to.be.deep.equal(s)
     })
 
+    it("should decode packed ragged column data source", () => {
+      const e = {
+        x: {
+          __ragged__: ser.encode_base64(new Float64Array([1, 2, 3, 4, 5]), [5]),
+          offsets: ser.encode_base64(new Int32Array([0, 3, 3, 5]), [4]),
+          shapes: [[3], [0], [2]],
+        },
+      }
+      const [d, s] = ser.decode_column_data(e)
+      expect(d.x).to.be.deep.equal([new Float64Array([1, 2, 3]), new Float64Array([]), new Float64Array([4, 5])])
+      expect(s.x).to.be.deep.equal([[3], [0], [2]])
+    })
+
+    it("should round trip packed ragged column data source", () => {
+      const e = {
+        x: {
+          __ragged__: ser.encode_base64(new Float64Array([1, 2, 3, 4, 5]), [5]),
+          offsets: ser.encode_base64(new Int32Array([0, 3, 3, 5]), [4]),
+          shapes: [[3], [0], [2]],
+        },
+      }
+      const [d, s] = ser.decode_column_data(e)
+      const enc = ser.encode_column_data(d, s)
+      expect(enc.x).to.be.deep.equal([
+        ser.encode_base64(new Float64Array([1, 2, 3]), [3]),
+        ser.encode_base64(new Float64Array([]), [0]),
+        ser.encode_base64(new Float64Array([4, 5]), [2]),
+      ])
+      const [d2] = ser.decode_column_data(enc)
+      expect(d2.x).to.be.deep.equal(d.x)
+    })
+
   })
 
   describe("encode_column_data", () => {
@@ -0,0 +1,59 @@
+''' Benchmark Bokeh model graph traversal.
+
+Times ``collect_models`` (which backs ``Model.references()`` and the
+``Document`` all-models index) on a plot with an increasing number of glyph
+renderers, and on a long chain of models.
+
+usage: python scripts/benchmarks/collect_models.py [N ...]
+
+'''
+import sys
+from timeit import default_timer as timer
+
+from bokeh.model import collect_models
+from bokeh.models import Column, ColumnDataSource, GlyphRenderer, Plot, Scatter
+
+DEFAULT_SIZES = (1000, 10000, 100000)
+
+
+def make_plot(n):
+    ''' Make a plot with roughly ``n`` models.
+
+    Each renderer brings six models: itself, the glyph, the data source with its
+    selection and selection policy, and a default view.
+
+    '''
+    plot = Plot()
+    renderers = []
+    for _ in range(n // 6):
+        source = ColumnDataSource(data=dict(x=[1], y=[1]))
+        renderers.append(GlyphRenderer(data_source=source, glyph=Scatter(x="x", y="y")))
+    plot.renderers = renderers
+    return plot
+
+
+def make_chain(n):
+    ''' Make a chain of ``n`` nested models. '''
+    root = Column()
+    for _ in range(n - 1):
+        root = Column(children=[root])
+    return root
+
+
+def bench(label, root, repeat=3):
+    best = float("inf")
+    for _ in range(repeat):
+        start = timer()
+        models = collect_models(root)
+        best = min(best, timer() - start)
+    print(f"{label:>16} {len(models):>8} models  {best * 1000:10.1f} ms")
+
+
+if __name__ == "__main__":
+    sizes = [int(arg) for arg in sys.argv[1:]] or DEFAULT_SIZES
+
+    for n in sizes:
+        bench(f"plot {n}", make_plot(n))
+
+    for n in sizes:
+        bench(f"chain {n}", make_chain(n))
@@ -0,0 +1,83 @@
+#-----------------------------------------------------------------------------
+# Copyright (c) 2012 - 2020, Anaconda, Inc., and Bokeh Contributors.
+# All rights reserved.
+#
+# The full license is in the file LICENSE.txt, distributed with this software.
+#-----------------------------------------------------------------------------
+
+#-----------------------------------------------------------------------------
+# Boilerplate
+#-----------------------------------------------------------------------------
+import pytest ; pytest
+
+#-----------------------------------------------------------------------------
+# Imports
+#-----------------------------------------------------------------------------
+
+# Standard library imports
+from subprocess import PIPE, Popen
+from sys import executable
+
+# Bokeh imports
+import bokeh.models as bm
+import bokeh.models.widgets as bmw
+
+#-----------------------------------------------------------------------------
+# Tests
+#-----------------------------------------------------------------------------
+
+# importing bokeh.models lazily must take at most this fraction of the time
+# it takes to import every model, generous enough for noisy CI machines
+LAZY_IMPORT_RATIO = 0.9
+
+MODEL_MODULES = ["bokeh.models." + module for module in bm._MODELS if module != "widgets"]
+
+WIDGET_MODULES = ["bokeh.models.widgets." + module for module in bmw._MODELS]
+
+def _import_time(code):
+    ''' The best of three times to run some import code in a fresh process,
+    without the time to import third party dependencies.
+
+    '''
+    code = "import time, numpy; t = time.perf_counter(); %s; print(time.perf_counter() - t)" % code
+    times = []
+    for _ in range(3):
+        proc = Popen([executable, "-c", code], stdout=PIPE)
+        out, _ = proc.communicate()
+        assert proc.returncode == 0
+        times.append(float(out))
+    return min(times)
+
+def _imported_modules(module, modules):
+    ''' The modules among ``modules`` that are imported along with ``module``
+    in a fresh process.
+
+    '''
+    code = "import sys; import %s; print(' '.join(x for x in %r if x in sys.modules))" % (module, modules)
+    proc = Popen([executable, "-c", code], stdout=PIPE)
+    out, _ = proc.communicate()
+    assert proc.returncode == 0
+    return out.decode("utf-8").split()
+
+def test_models_imported_lazily() -> None:
+    ''' Importing bokeh.models should not result in any of the model
+    submodules being imported.
+
+    '''
+    assert _imported_modules("bokeh.models", MODEL_MODULES + WIDGET_MODULES) == []
+
+def test_widgets_imported_lazily() -> None:
+    ''' Basic usage of Bokeh should not result in the widget models being
+    imported.
+
+    '''
+    assert _imported_modules("bokeh.plotting", WIDGET_MODULES) == []
+
+def test_import_time() -> None:
+    ''' Importing bokeh.models should take noticeably less time than the
+    baseline of importing all models with a star import.
+
+    '''
+    lazy = _import_time("import bokeh.models")
+    eager = _import_time("from bokeh.models import *")
+    assert lazy < LAZY_IMPORT_RATIO * eager, "import bokeh.models took %0.3fs, importing all models took %0.3fs" % (lazy, eager)
@@ -81,8 +81,10 @@ class Test_DirectoryHandler(object):
 
     def test_directory_empty_mainpy(self) -> None:
         doc = Document()
+        result = {}
         def load(filename):
             handler = bahd.DirectoryHandler(filename=filename)
+            result['handler'] = handler
             handler.modify_document(doc)
             if handler.failed:
                 raise RuntimeError(handler.error)
@@ -92,6 +94,7 @@ class Test_DirectoryHandler(object):
         }, load)
 
         assert not doc.roots
+        assert not result['handler'].has_session_created_hook
 
     def test_directory_initpy(self) -> None:
         doc = Document()
@@ -267,6 +270,7 @@ some.foo = 57
         assert "on_server_unloaded" == handler.on_server_unloaded(None)
         assert "on_session_created" == await handler.on_session_created(None)
         assert "on_session_destroyed" == await handler.on_session_destroyed(None)
+        assert handler.has_session_created_hook
 
     async def test_directory_with_app_hooks(self) -> None:
         doc = Document()
@@ -57,6 +57,13 @@ class Test_Handler(object):
         assert await h.on_session_created("context") is None
         assert await h.on_session_destroyed("context") is None
 
+    def test_has_session_created_hook(self) -> None:
+        class Custom(bahh.Handler):
+            async def on_session_created(self, session_context):
+                pass
+        assert not bahh.Handler().has_session_created_hook
+        assert Custom().has_session_created_hook
+
     def test_static_path(self) -> None:
         h = bahh.Handler()
         assert h.static_path() is None
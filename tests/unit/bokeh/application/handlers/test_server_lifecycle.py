@@ -64,6 +64,7 @@ class Test_ServerLifecycleHandler(object):
         if handler.failed:
             raise RuntimeError(handler.error)
         assert not doc.roots
+        assert not handler.has_session_created_hook
 
     def test_lifecycle_bad_syntax(self) -> None:
         result = {}
@@ -162,6 +163,7 @@ def on_session_destroyed(a,b):
         assert "on_server_unloaded" == handler.on_server_unloaded(None)
         assert "on_session_created" == await handler.on_session_created(None)
         assert "on_session_destroyed" == await handler.on_session_destroyed(None)
+        assert handler.has_session_created_hook
 
     def test_missing_filename_raises(self) -> None:
         with pytest.raises(ValueError):
@@ -142,6 +142,55 @@ class Test_Application(object):
             a.initialize_document(d)
             assert len(caplog.records) == 1
 
+    def test_template_document_default(self, monkeypatch) -> None:
+        assert not baa.Application().template_document
+        monkeypatch.setenv("BOKEH_SESSION_TEMPLATE", "yes")
+        assert baa.Application().template_document
+        assert not baa.Application(template_document=False).template_document
+
+    def test_template_document(self) -> None:
+        calls = []
+        def add_roots(doc):
+            calls.append(doc)
+            doc.title = "template"
+            doc.add_root(SomeModelInTestApplication(child=AnotherModelInTestApplication(baar=10)))
+        a = baa.Application(FunctionHandler(add_roots), template_document=True)
+        d1 = a.create_document()
+        d2 = a.create_document()
+        assert len(calls) == 1
+        assert calls[0] not in (d1, d2)
+        for d in (d1, d2):
+            assert d.title == "template"
+            assert len(d.roots) == 1
+            assert d.roots[0].child.baar == 10
+            assert d.roots[0].id != calls[0].roots[0].id
+        assert d1.roots[0].id != d2.roots[0].id
+        d1.roots[0].child.baar = 20
+        assert d2.roots[0].child.baar == 10
+
+    def test_template_document_with_python_callbacks(self, caplog) -> None:
+        calls = []
+        def add_roots(doc):
+            calls.append(doc)
+            model = SomeModelInTestApplication()
+            model.on_change('foo', lambda attr, old, new: None)
+            doc.add_root(model)
+        a = baa.Application(FunctionHandler(add_roots), template_document=True)
+        with caplog.at_level(logging.WARNING):
+            d1 = a.create_document()
+            d2 = a.create_document()
+            assert len(caplog.records) == 1
+        assert calls[1:] == [d1, d2]
+        assert len(d2.roots[0]._callbacks['foo']) == 1
+
+    def test_template_document_with_failed_handler(self, caplog) -> None:
+        a = baa.Application(CodeHandler(filename="junk", source="bad("), template_document=True)
+        d = Document()
+        with caplog.at_level(logging.WARNING):
+            a.initialize_document(d)
+            assert "template document" in caplog.records[0].message
+        assert not d.roots
+
     def test_no_static_path(self) -> None:
         a = baa.Application()
         def add_roots(doc):
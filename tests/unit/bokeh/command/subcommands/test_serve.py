@@ -182,6 +182,42 @@ def test_args() -> None:
             default = None,
         )),
 
+        ('--session-pool-size', dict(
+            metavar = 'N',
+            type    = int,
+            help    = "How many initialized documents to keep ready for new sessions",
+            default = None,
+        )),
+
+        ('--session-executor-threads', dict(
+            metavar = 'N',
+            type    = int,
+            help    = "How many threads to use for blocking session work, 0 to use the IOLoop",
+            default = None,
+        )),
+
+        ('--send-queue-high-watermark', dict(
+            metavar = 'N',
+            type    = int,
+            help    = "How many messages may be queued for a client before the send queue policy applies",
+            default = None,
+        )),
+
+        ('--send-queue-low-watermark', dict(
+            metavar = 'N',
+            type    = int,
+            help    = "How many messages may be queued for a client when the send queue policy stops applying",
+            default = None,
+        )),
+
+        ('--send-queue-policy', dict(
+            metavar = 'POLICY',
+            action  = 'store',
+            default = None,
+            choices = scserve.SEND_QUEUE_POLICIES,
+            help    = "What to do with updates for clients that can not keep up",
+        )),
+
         ('--stats-log-frequency', dict(
             metavar = 'MILLISECONDS',
             type    = int,
@@ -196,6 +232,16 @@ def test_args() -> None:
             default = None,
         )),
 
+        ('--enable-metrics', dict(
+            action = 'store_true',
+            help   = "Export server metrics on the /metrics path",
+        )),
+
+        ('--profile-locks', dict(
+            action = 'store_true',
+            help   = "Log a summary of the time spent holding session document locks on shutdown",
+        )),
+
         ('--use-xheaders', dict(
             action = 'store_true',
             help   = "Prefer X-headers for IP/protocol information",
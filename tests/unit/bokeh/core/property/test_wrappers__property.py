@@ -271,6 +271,51 @@ def test_PropertyValueColumnData__stream_array_with_rollover(mock_notify) -> Non
     assert mock_notify.call_args[1]['hint'].setter == 'setter'
     assert mock_notify.call_args[1]['hint'].rollover == 3
 
+def test_PropertyValueColumnData__stream_array_with_rollover_buffered() -> None:
+    import numpy as np
+
+    source = ColumnDataSource(data=dict(foo=np.array([10., 20., 30.])))
+    pvcd = bcpw.PropertyValueColumnData(source.data)
+
+    expected = np.array([10., 20., 30.])
+    olds = []
+    for i in range(20):
+        new = np.arange(i % 4, dtype=float) + 100*i
+        olds.append((pvcd['foo'], pvcd['foo'].copy()))
+        pvcd._stream("doc", source, dict(foo=new), rollover=5)
+        expected = np.append(expected, new)[-5:]
+        assert np.array_equal(pvcd['foo'], expected)
+        assert pvcd['foo'].base is pvcd._stream_buffers['foo']._array
+
+    # previous column values are never modified by later updates
+    for old, saved in olds:
+        assert np.array_equal(old, saved)
+
+def test_PropertyValueColumnData__stream_array_with_rollover_buffered_dtype_change() -> None:
+    import numpy as np
+
+    source = ColumnDataSource(data=dict(foo=np.array([10, 20, 30])))
+    pvcd = bcpw.PropertyValueColumnData(source.data)
+
+    pvcd._stream("doc", source, dict(foo=[40]), rollover=3)
+    assert pvcd['foo'].dtype == np.array([1]).dtype
+    pvcd._stream("doc", source, dict(foo=[50.5]), rollover=3)
+    assert pvcd['foo'].dtype == np.float64
+    assert np.array_equal(pvcd['foo'], [30, 40, 50.5])
+
+def test_PropertyValueColumnData__stream_array_with_rollover_buffered_replaced_column() -> None:
+    import numpy as np
+
+    source = ColumnDataSource(data=dict(foo=np.array([10, 20, 30])))
+    pvcd = bcpw.PropertyValueColumnData(source.data)
+
+    pvcd._stream("doc", source, dict(foo=[40]), rollover=3)
+    assert 'foo' in pvcd._stream_buffers
+    pvcd.update(foo=np.array([1, 2]))
+    assert 'foo' not in pvcd._stream_buffers
+    pvcd._stream("doc", source, dict(foo=[3]), rollover=3)
+    assert np.array_equal(pvcd['foo'], [1, 2, 3])
+
 @patch('bokeh.core.property.wrappers.PropertyValueContainer._notify_owners')
 def test_PropertyValueColumnData__patch_with_simple_indices(mock_notify) -> None:
     from bokeh.document.events import ColumnsPatchedEvent
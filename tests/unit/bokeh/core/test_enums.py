@@ -65,6 +65,7 @@ ALL  = (
     'RenderMode',
     'ResetPolicy',
     'RoundingFunction',
+    'SendQueuePolicy',
     'SizingMode',
     'SizingPolicy',
     'SortDirection',
@@ -258,6 +259,9 @@ class Test_bce(object):
     def test_RoundingFunction(self) -> None:
         assert tuple(bce.RoundingFunction) == ("round", "nearest", "floor", "rounddown", "ceil", "roundup")
 
+    def test_SendQueuePolicy(self) -> None:
+        assert tuple(bce.SendQueuePolicy) == ("merge", "drop", "disconnect")
+
     def test_SizingMode(self) -> None:
         assert tuple(bce.SizingMode) == ("stretch_width", "stretch_height", "stretch_both", "scale_width", "scale_height", "scale_both", "fixed")
 
@@ -337,6 +341,7 @@ def test_enums_contents() -> None:
         'RenderMode',
         'ResetPolicy',
         'RoundingFunction',
+        'SendQueuePolicy',
         'SizingMode',
         'SizingPolicy',
         'SortDirection',
@@ -23,6 +23,7 @@ from bokeh.core.property.descriptors import (
     BasicPropertyDescriptor,
     DataSpecPropertyDescriptor,
 )
+from bokeh.core.validation import error, warning
 
 # Module under test
 import bokeh.core.has_props as hp # isort:skip
@@ -383,6 +384,30 @@ def test_HasProps_apply_theme_func_default() -> None:
     c.foo = 50
     assert c.foo == 50
 
+class ValidatedParent(hp.HasProps):
+    @warning("W1")
+    def _check_one(self):
+        pass
+
+    @warning("W2")
+    def _check_two(self):
+        pass
+
+    def _check_not_a_validator(self):
+        pass
+
+class ValidatedChild(ValidatedParent):
+    _check_two = None
+
+    @error("E1")
+    def _check_three(self):
+        pass
+
+def test_HasProps_validators() -> None:
+    assert Parent.__validators__ == ()
+    assert ValidatedParent.__validators__ == ("_check_one", "_check_two")
+    assert ValidatedChild.__validators__ == ("_check_one", "_check_three")
+
 #-----------------------------------------------------------------------------
 # Private API
 #-----------------------------------------------------------------------------
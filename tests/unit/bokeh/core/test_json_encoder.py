@@ -276,6 +276,114 @@ class TestSerializeJson(object):
         with pytest.raises(ValueError):
             self.serialize([1], sort_keys=False)
 
+class TestJSONBackends(object):
+
+    def setup_method(self, test_method):
+        import bokeh.core.json_encoder as bcj
+        self.bcj = bcj
+
+    def teardown_method(self, test_method):
+        from bokeh.settings import settings
+        settings.json_backend.unset_value()
+
+    @pytest.mark.parametrize('name', ["json", "orjson"])
+    def test_dumps(self, name) -> None:
+        from json import loads
+        if name == "orjson":
+            pytest.importorskip("orjson")
+        backend = self.bcj.get_json_backend(name)
+        assert backend.name == name
+        value = {"b": [1, 2.5, "x", None, True], "a": np.arange(3), "c": np.datetime64('2017-01-01'),
+                 "d": dt.date(2017, 1, 1), "e": {1: np.float64(1.5)}, "f": Range1d(), "g": 2**70}
+        assert loads(backend.dumps(value)) == self.bcj.to_json_compatible(value)
+
+    @pytest.mark.parametrize('name', ["json", "orjson"])
+    @pytest.mark.parametrize('value', [float("nan"), float("inf"), -float("inf"), np.float64("nan")])
+    def test_dumps_rejects_non_finite(self, name, value) -> None:
+        if name == "orjson":
+            pytest.importorskip("orjson")
+        backend = self.bcj.get_json_backend(name)
+        with pytest.raises(ValueError):
+            backend.dumps({"a": [1.0, value]})
+
+    def test_dumps_does_not_sort(self) -> None:
+        backend = self.bcj.get_json_backend("json")
+        assert backend.dumps(dict(b=1, a=2)) == '{"b":1,"a":2}'
+
+    def test_auto(self) -> None:
+        try:
+            import orjson ; orjson
+            expected = "orjson"
+        except ImportError:
+            expected = "json"
+        assert self.bcj.get_json_backend("auto").name == expected
+
+    def test_default(self) -> None:
+        assert self.bcj.get_json_backend().name == "json"
+
+    def test_setting(self) -> None:
+        from bokeh.settings import settings
+        settings.json_backend.set_value("json")
+        assert self.bcj.get_json_backend().name == "json"
+        assert self.bcj.serialize_json_wire(dict(b=1, a=2)) == '{"b":1,"a":2}'
+
+    def test_unknown(self) -> None:
+        with pytest.raises(ValueError):
+            self.bcj.get_json_backend("foo")
+
+    @pytest.mark.parametrize('name', ["json", "orjson"])
+    def test_serialize_json_unaffected(self, name) -> None:
+        from bokeh.settings import settings
+        settings.json_backend.set_value(name)
+        assert self.bcj.serialize_json({"b": "\u00e9", "a": 1e-7}) == '{"a":1e-07,"b":"\\u00e9"}'
+
+class TestToJsonCompatible(object):
+
+    def setup_method(self, test_method):
+        from bokeh.core.json_encoder import serialize_json, to_json_compatible
+        from json import loads
+        self.convert = to_json_compatible
+        self.roundtrip = lambda obj: loads(serialize_json(obj))
+
+    @pytest.mark.parametrize('value', [
+        None, True, 1, 1.5, "str", [1, "a", None], (1, 2), {"a": {"b": [1, 2]}},
+        {2: "int", 2.5: "float", False: "bool"}, {None: "none"},
+        np.arange(5), np.array([np.nan, np.inf, -np.inf, 0]), np.float64(1.5), np.bool_(True),
+        dt.date(2017, 1, 1), dt.datetime(2017, 1, 1), np.datetime64('2017-01-01'), dt.timedelta(seconds=3),
+        decimal.Decimal(1.5), deque([0, 1, 2]), slice(0, 10, 2), rd.relativedelta(days=2), RGB(255, 0, 0),
+    ])
+    def test_matches_serialize_json(self, value) -> None:
+        assert self.convert(value) == self.roundtrip(value)
+        assert self.convert([value]) == self.roundtrip([value])
+
+    def test_pd_series(self, pd) -> None:
+        s = pd.Series(pd.date_range('2001-1-1', '2001-1-5'))
+        assert self.convert(dict(s=s)) == self.roundtrip(dict(s=s))
+
+    def test_model(self) -> None:
+        rg = Range1d()
+        assert self.convert(dict(range=rg)) == self.roundtrip(dict(range=rg)) == dict(range=rg.ref)
+
+    def test_hasprops(self) -> None:
+        hp = HP(foo=10)
+        assert self.convert(hp) == self.roundtrip(hp)
+
+    def test_plain_types(self) -> None:
+        result = self.convert(dict(a=np.arange(3), b=(np.float64(1.5),)))
+        assert type(result["a"]) is list
+        assert [type(x) for x in result["a"]] == [int, int, int]
+        assert type(result["b"][0]) is float
+
+    @pytest.mark.parametrize('value', [float("nan"), float("inf"), {float("nan"): 1}])
+    def test_nans_and_infs(self, value) -> None:
+        with pytest.raises(ValueError):
+            self.convert(value)
+
+    @pytest.mark.parametrize('value', [object(), {(1, 2): 1}])
+    def test_fail(self, value) -> None:
+        with pytest.raises(TypeError):
+            self.convert(value)
+
 #-----------------------------------------------------------------------------
 # Private API
 #-----------------------------------------------------------------------------
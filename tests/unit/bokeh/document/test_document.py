@@ -19,6 +19,7 @@ import logging
 from copy import copy
 
 # External imports
+import numpy as np
 from mock import patch
 
 # Bokeh imports
@@ -113,6 +114,38 @@ class TestDocumentHold(object):
         assert mock_trigger.call_args[0] == (3,)
         assert mock_trigger.call_args[1] == {}
 
+    def test_hold_combines_streams(self) -> None:
+        d = document.Document()
+        source = ColumnDataSource(data=dict(a=[10]))
+        d.add_root(source)
+        events = []
+        d.on_change(events.append)
+
+        d.hold('combine')
+        source.stream(dict(a=[11]))
+        source.stream(dict(a=[12, 13]))
+        d.unhold()
+
+        assert len(events) == 1
+        assert isinstance(events[0].hint, ColumnsStreamedEvent)
+        assert events[0].hint.data == dict(a=[11, 12, 13])
+        assert source.data == dict(a=[10, 11, 12, 13])
+
+    def test_hold_does_not_combine_streams_across_patches(self) -> None:
+        d = document.Document()
+        source = ColumnDataSource(data=dict(a=[10]))
+        d.add_root(source)
+        events = []
+        d.on_change(events.append)
+
+        d.hold('combine')
+        source.stream(dict(a=[11]))
+        source.patch(dict(a=[(0, 20)]))
+        source.stream(dict(a=[12]))
+        d.unhold()
+
+        assert [type(e.hint) for e in events] == [ColumnsStreamedEvent, ColumnsPatchedEvent, ColumnsStreamedEvent]
+
 extra = []
 
 class Test_Document_delete_modules(object):
@@ -423,6 +456,48 @@ class TestDocument(object):
         d.remove_root(root2)
         assert len(d._all_models) == 0
 
+    def test_all_models_detaches_unreachable_cycle(self) -> None:
+        d = document.Document()
+        root = SomeModelInTestDocument()
+        child1 = SomeModelInTestDocument()
+        child2 = SomeModelInTestDocument()
+        child1.child = child2
+        child2.child = child1
+        root.child = child1
+        d.add_root(root)
+        assert set(d._all_models) == {root.id, child1.id, child2.id}
+        root.child = None
+        assert set(d._all_models) == {root.id}
+        assert child1.document is None
+        assert child2.document is None
+        assert d._all_models_refcounts == {root.id: 1}
+
+    def test_all_models_keeps_moved_model(self) -> None:
+        d = document.Document()
+        root = SomeModelInTestDocument()
+        child1 = SomeModelInTestDocument()
+        child2 = AnotherModelInTestDocument()
+        root.child = child1
+        child1.child = child2
+        d.add_root(root)
+        root.child = child2
+        assert set(d._all_models) == {root.id, child2.id}
+        assert child2.document is d
+        assert child1.document is None
+        assert d._all_models_refcounts == {root.id: 1, child2.id: 1}
+
+    def test_all_models_recomputed_when_stale(self) -> None:
+        d = document.Document()
+        root = SomeModelInTestDocument()
+        child = AnotherModelInTestDocument()
+        d.add_root(root)
+        # simulate a change the index was never told about
+        root._property_values['child'] = child
+        root.child = None
+        assert set(d._all_models) == {root.id}
+        assert d._all_models_refcounts == {root.id: 1}
+        assert not d._all_models_stale
+
     def test_change_notification(self) -> None:
         d = document.Document()
         assert not d.roots
@@ -733,6 +808,42 @@ class TestDocument(object):
         assert not d._all_models
         assert d.title == "Foo" # do not reset title
 
+    def test_copy_to(self) -> None:
+        d = document.Document(title="Foo")
+        child = AnotherModelInTestDocument(bar=10)
+        d.add_root(SomeModelInTestDocument(child=child))
+        d.add_root(SomeModelInTestDocument(foo=3, child=child))
+        d.template_variables["x"] = 1
+        d2 = document.Document()
+        d._copy_to(d2)
+        assert d2.title == "Foo"
+        assert d2.template_variables == dict(x=1)
+        assert len(d2.roots) == 2
+        assert len(d2._all_models) == 3
+        assert not set(d2._all_models) & set(d._all_models)
+        r1, r2 = d2.roots
+        assert r1.child is r2.child
+        assert r1.child.bar == 10
+        assert r2.foo == 3
+        r1.child.bar = 20
+        assert child.bar == 10
+
+    def test_copy_to_shares_arrays(self) -> None:
+        d = document.Document()
+        x = np.arange(5)
+        d.add_root(ColumnDataSource(data=dict(x=x, y=[1, 2, 3, 4, 5])))
+        d2 = document.Document()
+        d._copy_to(d2)
+        source = d2.roots[0]
+        assert np.shares_memory(source.data["x"], x)
+        assert not source.data["x"].flags.writeable
+        assert source.data["y"] == [1, 2, 3, 4, 5]
+        source.patch(dict(x=[(0, 10)], y=[(0, 10)]))
+        assert list(source.data["x"]) == [10, 1, 2, 3, 4]
+        assert source.data["y"] == [10, 2, 3, 4, 5]
+        assert list(x) == [0, 1, 2, 3, 4]
+        assert d.roots[0].data["y"] == [1, 2, 3, 4, 5]
+
     def test_serialization_one_model(self) -> None:
         d = document.Document()
         assert not d.roots
@@ -779,6 +890,26 @@ class TestDocument(object):
         json = d.to_json()
         assert json['version'] == __version__
 
+    def test_to_json_matches_to_json_string(self) -> None:
+        from json import loads
+        d = document.Document()
+        root = SomeModelInTestDocument(foo=42, child=ModelWithSpecInTestDocument(foo=np.float64(3.5)))
+        d.add_root(root)
+        d.add_root(ColumnDataSource(data=dict(a=np.arange(3), b=np.array([np.nan, 1.0, np.inf]))))
+        assert d.to_json() == loads(d.to_json_string())
+        assert root.to_json(True) == loads(root.to_json_string(True))
+        assert root.to_json(False) == loads(root.to_json_string(False))
+
+    def test_serialization_ragged_arrays(self) -> None:
+        d = document.Document()
+        xs = [np.arange(3.), np.arange(2.)]
+        cds = ColumnDataSource(data=dict(xs=xs))
+        d.add_root(cds)
+        copy = document.Document.from_json_string(d.to_json_string())
+        copy_xs = copy.get_model_by_id(cds.id).data['xs']
+        assert len(copy_xs) == 2
+        assert all(np.array_equal(a, b) for a, b in zip(xs, copy_xs))
+
     def test_patch_integer_property(self) -> None:
         d = document.Document()
         assert not d.roots
@@ -959,6 +1090,67 @@ class TestDocument(object):
         except RuntimeError:
             pytest.fail("apply_json_event probably did not copy models before modifying")
 
+    @patch('bokeh.document.document.check_integrity')
+    def test_validate_incremental(self, check_integrity) -> None:
+        d = document.Document()
+        m1 = SomeModelInTestDocument()
+        m2 = AnotherModelInTestDocument()
+        d.add_root(m1)
+        d.add_root(m2)
+
+        d.validate()
+        assert check_integrity.call_count == 1
+        assert set(check_integrity.call_args[0][0]) == {m1, m2}
+
+        d.validate()
+        assert check_integrity.call_count == 1
+
+        m1.foo = 42
+        d.validate()
+        assert check_integrity.call_count == 2
+        assert check_integrity.call_args[0][0] == [m1]
+
+    @patch('bokeh.document.document.check_integrity')
+    def test_validate_skips_removed_models(self, check_integrity) -> None:
+        d = document.Document()
+        m1 = SomeModelInTestDocument()
+        m2 = SomeModelInTestDocument()
+        d.add_root(m1)
+        d.add_root(m2)
+        d.remove_root(m2)
+        d.validate()
+        assert check_integrity.call_args[0][0] == [m1]
+        assert not d._models_to_validate
+
+    @patch('bokeh.document.document.check_integrity')
+    def test_validate_referring_models(self, check_integrity) -> None:
+        d = document.Document()
+        m3 = AnotherModelInTestDocument()
+        m2 = SomeModelInTestDocument(child=m3)
+        m1 = SomeModelInTestDocument(child=m2)
+        other = SomeModelInTestDocument()
+        d.add_root(m1)
+        d.add_root(other)
+        d.validate()
+
+        m3.bar = 42
+        d.validate()
+        assert set(check_integrity.call_args[0][0]) == {m1, m2, m3}
+
+    def test_validate_after_referenced_model_changes(self) -> None:
+        from bokeh.models import Circle, GlyphRenderer
+        d = document.Document()
+        source = ColumnDataSource(data=dict(x=[1], y=[1]))
+        d.add_root(GlyphRenderer(data_source=source, glyph=Circle(x="x", y="y")))
+        with patch('bokeh.core.validation.check.log') as mock_log:
+            d.validate()
+            assert mock_log.error.call_count == 0
+
+            source.data = dict(a=[1])
+            d.validate()
+            assert mock_log.error.call_count == 1
+            assert "BAD_COLUMN_NAME" in mock_log.error.call_args[0][0]
+
     # TODO test serialize/deserialize with list-and-dict-valued properties
 
     # TODO test replace_with_json
@@ -276,6 +276,20 @@ class TestColumnsStreamedEvent(object):
         assert refs == dict(foo=10)
         assert bufs == set()
 
+    def test_generate_with_buffers(self) -> None:
+        import numpy as np
+        m = FakeModel()
+        data = dict(foo=np.array([1., 2.]), bar=[1, 2], baz=np.array([1, 2], dtype=np.int64))
+        e = bde.ColumnsStreamedEvent("doc", m, data, 200, "setter", "invoker")
+        bufs = []
+        r = e.generate(dict(), bufs)
+        assert len(bufs) == 1
+        assert bufs[0][1] == data['foo'].tobytes()
+        assert r['data']['foo']['__buffer__'] == bufs[0][0]['id']
+        assert r['data']['bar'] == [1, 2]
+        assert r['data']['baz'] is data['baz']
+        assert e.data is data
+
     def test_dispatch(self) -> None:
         m = FakeModel()
         e = bde.ColumnsStreamedEvent("doc", m, dict(foo=1), 200, "setter", "invoker")
@@ -293,6 +307,45 @@ class TestColumnsStreamedEvent(object):
         assert e.data == dict(foo=1)
         assert e.rollover == 200
 
+    def test_combine_lists(self) -> None:
+        m = FakeModel()
+        e = bde.ColumnsStreamedEvent("doc", m, dict(foo=[1, 2]), None, "setter", "invoker")
+        e2 = bde.ColumnsStreamedEvent("doc", m, dict(foo=[3]), None, "setter", "invoker2")
+        assert e.combine(e2) == True
+        assert e.data == dict(foo=[1, 2, 3])
+        assert e.rollover == None
+        assert e.callback_invoker == "invoker2"
+
+    def test_combine_arrays_with_rollover(self) -> None:
+        import numpy as np
+        m = FakeModel()
+        e = bde.ColumnsStreamedEvent("doc", m, dict(foo=np.array([1, 2])), 4, "setter", "invoker")
+        e2 = bde.ColumnsStreamedEvent("doc", m, dict(foo=[3, 4, 5]), 3, "setter", "invoker")
+        assert e.combine(e2) == True
+        assert list(e.data['foo']) == [3, 4, 5]
+        assert e.rollover == 3
+
+    def test_combine_rollover_to_none(self) -> None:
+        m = FakeModel()
+        e = bde.ColumnsStreamedEvent("doc", m, dict(foo=[1]), None, "setter", "invoker")
+        e2 = bde.ColumnsStreamedEvent("doc", m, dict(foo=[2]), 10, "setter", "invoker")
+        assert e.combine(e2) == True
+        assert e.data == dict(foo=[1, 2])
+        assert e.rollover == 10
+
+        e3 = bde.ColumnsStreamedEvent("doc", m, dict(foo=[3]), None, "setter", "invoker")
+        assert e.combine(e3) == False
+        assert e.data == dict(foo=[1, 2])
+
+    def test_combine_ignores_different_source_setter_or_doc(self) -> None:
+        m, m2 = FakeModel(), FakeModel()
+        e = bde.ColumnsStreamedEvent("doc", m, dict(foo=[1]), None, "setter", "invoker")
+        assert e.combine(bde.ColumnsStreamedEvent("doc", m2, dict(foo=[2]), None, "setter", "invoker")) == False
+        assert e.combine(bde.ColumnsStreamedEvent("doc", m, dict(foo=[2]), None, "setter2", "invoker")) == False
+        assert e.combine(bde.ColumnsStreamedEvent("doc2", m, dict(foo=[2]), None, "setter", "invoker")) == False
+        assert e.combine(bde.ColumnsPatchedEvent("doc", m, dict(foo=[(0, 2)]), "setter", "invoker")) == False
+        assert e.data == dict(foo=[1])
+
     def test_pandas_data(self, pd) -> None:
         m = FakeModel()
         df = pd.DataFrame({'x': [1, 2, 3], 'y': [4, 5, 6]})
@@ -323,6 +376,20 @@ class TestColumnsPatchedEvent(object):
         assert refs == dict(foo=10)
         assert bufs == set()
 
+    def test_generate_with_buffers(self) -> None:
+        import numpy as np
+        m = FakeModel()
+        patches = dict(foo=[(0, 10), (slice(1, 3), np.array([1., 2.]))])
+        e = bde.ColumnsPatchedEvent("doc", m, patches, "setter", "invoker")
+        bufs = []
+        r = e.generate(dict(), bufs)
+        assert len(bufs) == 1
+        assert bufs[0][1] == np.array([1., 2.]).tobytes()
+        (ind1, value1), (ind2, value2) = r['patches']['foo']
+        assert (ind1, value1) == (0, 10)
+        assert ind2 == slice(1, 3)
+        assert value2['__buffer__'] == bufs[0][0]['id']
+
     def test_dispatch(self) -> None:
         m = FakeModel()
         e = bde.ColumnsPatchedEvent("doc", m, [1, 2], "setter", "invoker")
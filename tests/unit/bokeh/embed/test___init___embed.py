@@ -26,6 +26,7 @@ import bokeh.embed as be # isort:skip
 
 ALL = (
     'autoload_static',
+    'batch_file_html',
     'components',
     'file_html',
     'json_item',
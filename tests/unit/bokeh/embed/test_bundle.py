@@ -87,26 +87,34 @@ class Test_bundle_for_objs_and_resources(object):
         # this is a cheap test that a BokehJS file is NOT inline
         assert all(len(x) < 5000 for x in b.js_raw)
 
+    def test_inline_rendered_once(self, test_plot) -> None:
+        js1, css1 = beb.bundle_for_objs_and_resources([test_plot], INLINE)
+        js2, css2 = beb.bundle_for_objs_and_resources([test_plot], INLINE)
+        assert js1 is js2
+        assert css1 is css2
+
+        js3, _ = beb.bundle_for_objs_and_resources(None, INLINE)
+        assert js3 is not js1
+        assert len(js3) > len(js1)
+
 
 #-----------------------------------------------------------------------------
 # Private API
 #-----------------------------------------------------------------------------
 
-class Test__any(object):
+class Test__features(object):
 
-    def test_with_models(self, test_plot, test_table) -> None:
-        from bokeh.models import Button
-        assert beb._any([test_plot, test_table], lambda x: isinstance(x, object)) is True
-        assert beb._any([test_plot, test_table], lambda x: isinstance(x, Button)) is False
+    def test_single_pass(self, test_plot, test_glplot, test_table, test_widget) -> None:
+        assert beb._features(beb._all_objs([test_plot])) == (False, False, False)
+        assert beb._features(beb._all_objs([test_glplot, test_widget])) == (True, False, True)
+        assert beb._features(beb._all_objs([test_plot, test_table])) == (False, True, True)
 
-    def test_with_doc(self, test_plot, test_table) -> None:
-        from bokeh.models import Button
+    def test_document(self, test_plot, test_glplot, test_table) -> None:
         d = Document()
         d.add_root(test_plot)
+        d.add_root(test_glplot)
         d.add_root(test_table)
-        assert beb._any([d], lambda x: isinstance(x, object)) is True
-        assert beb._any([d], lambda x: isinstance(x, Button)) is False
-
+        assert beb._features(beb._all_objs([d])) == (True, True, True)
 
 class Test__use_gl(object):
 
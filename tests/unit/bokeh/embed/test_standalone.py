@@ -15,6 +15,7 @@ import pytest ; pytest
 #-----------------------------------------------------------------------------
 
 # Standard library imports
+import sys
 from collections import OrderedDict
 
 # External imports
@@ -348,6 +349,68 @@ class Test_file_html(object):
         # this is a very coarse test but it will do
         assert "bokeh-widgets" not in out
 
+class Test_batch_file_html(object):
+
+    def test_return_type(self, test_plot) -> None:
+        fig = figure()
+        fig.x([0], [0])
+        r = bes.batch_file_html([test_plot, fig], CDN, "title")
+        assert isinstance(r, list)
+        assert len(r) == 2
+        assert all(isinstance(page, str) for page in r)
+        assert test_plot.id in r[0] and fig.id not in r[0]
+        assert fig.id in r[1] and test_plot.id not in r[1]
+
+    def test_items(self, test_plot) -> None:
+        fig = figure()
+        fig.x([0], [0])
+        d = Document(title="doc title")
+        d.add_root(fig)
+        r = bes.batch_file_html([[test_plot], d], CDN)
+        assert "<title>doc title</title>" in r[1]
+
+    @patch('bokeh.embed.standalone._bundle_for_models')
+    def test_bundle_shared(self, mock_bundle, test_plot) -> None:
+        from bokeh.models import Button
+        mock_bundle.return_value = ("", "")
+        button = Button()
+        bes.batch_file_html([test_plot, button], CDN)
+        mock_bundle.assert_called_once()
+        all_models, res = mock_bundle.call_args[0]
+        assert all_models == test_plot.references() | {button}
+        assert res is CDN
+
+    @patch('bokeh.embed.util.collect_models')
+    def test_models_collected_from_document(self, mock_collect, test_plot) -> None:
+        mock_collect.return_value = set()
+        bes.batch_file_html([test_plot], CDN)
+        # models are looked up in the document, nothing is left to traverse
+        assert all(args == () for args, kwargs in mock_collect.call_args_list)
+
+    def test_resources_union(self, test_plot) -> None:
+        from bokeh.models import Button
+        r = bes.batch_file_html([test_plot, Button()], CDN)
+        assert all("bokeh-widgets" in page for page in r)
+
+    def test_bad_workers(self, test_plot) -> None:
+        with pytest.raises(ValueError):
+            bes.batch_file_html([test_plot], CDN, workers=0)
+
+    @pytest.mark.skipif(sys.platform == "win32", reason="worker processes are forked")
+    def test_workers(self, test_plot) -> None:
+        from bokeh.models import Button
+        fig = figure()
+        fig.x([0], [0])
+        button = Button()
+        r = bes.batch_file_html([test_plot, fig, button], CDN, "title", workers=2)
+        assert len(r) == 3
+        assert test_plot.id in r[0] and fig.id not in r[0]
+        assert fig.id in r[1] and test_plot.id not in r[1]
+        assert button.id in r[2]
+        assert all("bokeh-widgets" in page for page in r)
+        assert all("<title>title</title>" in page for page in r)
+        assert bes._batch_state is None
+
 class Test_json_item(object):
 
     def test_with_target_id(self, test_plot) -> None:
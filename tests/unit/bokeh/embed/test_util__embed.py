@@ -102,6 +102,34 @@ class EmbedTestUtilModel(Model):
 # Dev API
 #-----------------------------------------------------------------------------
 
+class Test_collect_all_models(object):
+
+    def test_without_document(self) -> None:
+        m1, m2 = SomeModel(), SomeModel()
+        p = OtherModel(child=m1)
+        assert beu.collect_all_models([p, m2]) == {p, m1, m2}
+
+    @patch('bokeh.embed.util.collect_models')
+    def test_document_index_used(self, mock_collect) -> None:
+        mock_collect.return_value = []
+        m1, m2 = SomeModel(), SomeModel()
+        p = OtherModel(child=m1)
+        d = Document()
+        d.add_root(p)
+        d.add_root(m2)
+        assert beu.collect_all_models([d]) == {p, m1, m2}
+        assert beu.collect_all_models([p, m2]) == {p, m1, m2}
+        for call in mock_collect.call_args_list:
+            assert call[0] == ()
+
+    def test_document_subset(self) -> None:
+        m1, m2 = SomeModel(), SomeModel()
+        p = OtherModel(child=m1)
+        d = Document()
+        d.add_root(p)
+        d.add_root(m2)
+        assert beu.collect_all_models([p]) == {p, m1}
+
 class Test_FromCurdoc(object):
 
     def test_type(self) -> None:
@@ -14,6 +14,9 @@ import pytest ; pytest
 # Imports
 #-----------------------------------------------------------------------------
 
+# Standard library imports
+import threading
+
 # Bokeh imports
 from bokeh.document import Document
 from bokeh.io.state import curstate
@@ -41,6 +44,27 @@ def test_set_curdoc_sets_curstate() -> None:
     bid.set_curdoc(d)
     assert curstate().document is d
 
+def test_isolated_curdoc() -> None:
+    d1, d2, d3 = Document(), Document(), Document()
+    bid.set_curdoc(d1)
+    seen = []
+    def other_thread():
+        with bid.isolated_curdoc():
+            seen.append(bid.curdoc())
+            bid.set_curdoc(d3)
+            seen.append(bid.curdoc())
+        seen.append(bid.curdoc())
+    with bid.isolated_curdoc():
+        bid.set_curdoc(d2)
+        assert bid.curdoc() is d2
+        assert curstate().document is d1
+        t = threading.Thread(target=other_thread)
+        t.start()
+        t.join()
+        assert bid.curdoc() is d2
+    assert seen == [d1, d3, d1]
+    assert bid.curdoc() is d1
+
 #-----------------------------------------------------------------------------
 # Private API
 #-----------------------------------------------------------------------------
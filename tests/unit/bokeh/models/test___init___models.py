@@ -0,0 +1,72 @@
+#-----------------------------------------------------------------------------
+# Copyright (c) 2012 - 2020, Anaconda, Inc., and Bokeh Contributors.
+# All rights reserved.
+#
+# The full license is in the file LICENSE.txt, distributed with this software.
+#-----------------------------------------------------------------------------
+
+#-----------------------------------------------------------------------------
+# Boilerplate
+#-----------------------------------------------------------------------------
+import pytest ; pytest
+
+#-----------------------------------------------------------------------------
+# Imports
+#-----------------------------------------------------------------------------
+
+# Standard library imports
+from importlib import import_module
+from pkgutil import iter_modules
+
+# Bokeh imports
+from bokeh.model import Model
+
+# Module under test
+import bokeh.models as bm # isort:skip
+
+#-----------------------------------------------------------------------------
+# Setup
+#-----------------------------------------------------------------------------
+
+#-----------------------------------------------------------------------------
+# General API
+#-----------------------------------------------------------------------------
+
+@pytest.mark.parametrize("module", sorted(bm._MODELS))
+def test_submodule_names(module) -> None:
+    names = import_module("bokeh.models." + module).__all__
+    assert tuple(bm._MODELS[module]) == names, "bokeh.models._MODELS[%r] does not match bokeh.models.%s.__all__" % (module, module)
+
+def test_submodules_listed() -> None:
+    # glyph only has base classes that glyphs re-exports
+    modules = {name for _, name, _ in iter_modules(bm.__path__)} - {"glyph"}
+    assert set(bm._MODELS) == modules
+
+def test_getattr() -> None:
+    from bokeh.models.plots import Plot
+    from bokeh.models.widgets.buttons import Button
+    assert bm.Plot is Plot
+    assert bm.Button is Button
+    assert bm.glyph is import_module("bokeh.models.glyph")
+    with pytest.raises(AttributeError):
+        bm.NotAModel
+
+def test_dir() -> None:
+    assert set(bm.__all__) <= set(dir(bm))
+
+def test_all_names() -> None:
+    for name in bm.__all__:
+        assert getattr(bm, name) is not None
+    assert bm.Model is Model
+
+#-----------------------------------------------------------------------------
+# Dev API
+#-----------------------------------------------------------------------------
+
+#-----------------------------------------------------------------------------
+# Private API
+#-----------------------------------------------------------------------------
+
+#-----------------------------------------------------------------------------
+# Code
+#-----------------------------------------------------------------------------
@@ -0,0 +1,57 @@
+#-----------------------------------------------------------------------------
+# Copyright (c) 2012 - 2020, Anaconda, Inc., and Bokeh Contributors.
+# All rights reserved.
+#
+# The full license is in the file LICENSE.txt, distributed with this software.
+#-----------------------------------------------------------------------------
+
+#-----------------------------------------------------------------------------
+# Boilerplate
+#-----------------------------------------------------------------------------
+import pytest ; pytest
+
+#-----------------------------------------------------------------------------
+# Imports
+#-----------------------------------------------------------------------------
+
+# Standard library imports
+from importlib import import_module
+from pkgutil import iter_modules
+
+# Module under test
+import bokeh.models.widgets as bmw # isort:skip
+
+#-----------------------------------------------------------------------------
+# Setup
+#-----------------------------------------------------------------------------
+
+#-----------------------------------------------------------------------------
+# General API
+#-----------------------------------------------------------------------------
+
+@pytest.mark.parametrize("module", sorted(bmw._MODELS))
+def test_submodule_names(module) -> None:
+    names = import_module("bokeh.models.widgets." + module).__all__
+    assert bmw._MODELS[module] == names, "bokeh.models.widgets._MODELS[%r] does not match bokeh.models.widgets.%s.__all__" % (module, module)
+
+def test_submodules_listed() -> None:
+    assert set(bmw._MODELS) == {name for _, name, _ in iter_modules(bmw.__path__)}
+
+def test_getattr() -> None:
+    from bokeh.models.widgets.tables import DataTable
+    assert bmw.DataTable is DataTable
+    assert bmw.tables is import_module("bokeh.models.widgets.tables")
+    with pytest.raises(AttributeError):
+        bmw.NotAWidget
+
+#-----------------------------------------------------------------------------
+# Dev API
+#-----------------------------------------------------------------------------
+
+#-----------------------------------------------------------------------------
+# Private API
+#-----------------------------------------------------------------------------
+
+#-----------------------------------------------------------------------------
+# Code
+#-----------------------------------------------------------------------------
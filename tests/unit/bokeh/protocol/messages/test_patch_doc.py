@@ -85,6 +85,15 @@ class TestPatchDocument(object):
         event = ModelChangedEvent(sample, obj, 'foo', obj.foo, 42, 42)
         proto.create("PATCH-DOC", [event])
 
+    def test_create_keeps_serialized_content(self) -> None:
+        sample = self._sample_doc()
+        obj = next(iter(sample.roots))
+        event = ModelChangedEvent(sample, obj, 'foo', obj.foo, 42, 42)
+        msg = proto.create("PATCH-DOC", [event])
+        patch_json, _ = process_document_events([event])
+        assert msg.content_json == patch_json
+        assert msg.content == loads(patch_json)
+
     def test_create_then_apply_model_changed(self) -> None:
         sample = self._sample_doc()
 
@@ -185,6 +194,27 @@ class TestPatchDocument(object):
         # value in local object would have been already mutated.
         assert buf[1] == np.array([11., 1., 2., 3]).tobytes()
 
+    def test_create_then_apply_binary_stream_and_patch(self) -> None:
+        sample = self._sample_doc()
+        cds = ColumnDataSource(data={'a': np.array([0., 1., 2.])})
+        sample.add_root(cds)
+        copy = document.Document.from_json_string(sample.to_json_string())
+        copy_cds = copy.get_model_by_id(cds.id)
+
+        event = ModelChangedEvent(sample, cds, 'data', 10, None, None,
+                                  hint=ColumnsStreamedEvent(sample, cds, {"a": np.array([3., 4.])}, None))
+        msg = proto.create("PATCH-DOC", [event])
+        assert len(msg.buffers) == 1
+        msg.apply_to_document(copy)
+        assert np.array_equal(copy_cds.data['a'], [0., 1., 2., 3., 4.])
+
+        event = ModelChangedEvent(sample, cds, 'data', 10, None, None,
+                                  hint=ColumnsPatchedEvent(sample, cds, {"a": [(slice(0, 2), np.array([10., 11.]))]}))
+        msg = proto.create("PATCH-DOC", [event])
+        assert len(msg.buffers) == 1
+        msg.apply_to_document(copy)
+        assert np.array_equal(copy_cds.data['a'], [10., 11., 2., 3., 4.])
+
 class _Event(object):
     def __init__(self, refs, bufs):
         self.refs=refs
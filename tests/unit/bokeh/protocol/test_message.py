@@ -34,6 +34,20 @@ def test_create_header(monkeypatch) -> None:
     assert header['msgid'] == 'msgid'
     assert header['reqid'] == 'bar'
 
+def test_content_json_setter() -> None:
+    msg = message.Message({}, {}, None)
+    msg.content_json = '{"foo":[1,2]}'
+    assert msg._content is None
+    assert msg.content_json == '{"foo":[1,2]}'
+    assert msg.content == {"foo": [1, 2]}
+    assert msg.content_json == '{"foo":[1,2]}'
+
+def test_content_setter_resets_content_json() -> None:
+    msg = message.Message({}, {}, None)
+    msg.content_json = '{"foo":[1,2]}'
+    msg.content = {"bar": 10}
+    assert msg.content_json == '{"bar":10}'
+
 #-----------------------------------------------------------------------------
 # Dev API
 #-----------------------------------------------------------------------------
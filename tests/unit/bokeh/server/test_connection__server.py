@@ -0,0 +1,197 @@
+#-----------------------------------------------------------------------------
+# Copyright (c) 2012 - 2020, Anaconda, Inc., and Bokeh Contributors.
+# All rights reserved.
+#
+# The full license is in the file LICENSE.txt, distributed with this software.
+#-----------------------------------------------------------------------------
+
+#-----------------------------------------------------------------------------
+# Boilerplate
+#-----------------------------------------------------------------------------
+import pytest ; pytest
+
+#-----------------------------------------------------------------------------
+# Imports
+#-----------------------------------------------------------------------------
+
+# External imports
+from mock import MagicMock
+
+# Bokeh imports
+from bokeh.document import Document
+from bokeh.document.events import ColumnsStreamedEvent, ModelChangedEvent
+from bokeh.models import ColumnDataSource
+from bokeh.protocol import Protocol
+
+# Module under test
+import bokeh.server.connection as bsc # isort:skip
+
+#-----------------------------------------------------------------------------
+# Setup
+#-----------------------------------------------------------------------------
+
+class _Socket(object):
+    def __init__(self):
+        self.sent = []
+    async def send_message(self, msg):
+        self.sent.append(msg)
+    def close(self, code=None, reason=None):
+        pass
+
+def _connection(**kw):
+    context = MagicMock()
+    socket = _Socket()
+    return bsc.ServerConnection(Protocol(), socket, context, MagicMock(), **kw)
+
+def _change(doc, source, value):
+    return ModelChangedEvent(doc, source, 'data', None, dict(a=[value]), dict(a=[value]))
+
+def _stream(doc, source, values, rollover):
+    hint = ColumnsStreamedEvent(doc, source, dict(a=values), rollover)
+    return ModelChangedEvent(doc, source, 'data', None, None, None, hint=hint)
+
+def _source():
+    doc = Document()
+    source = ColumnDataSource(data=dict(a=[0]))
+    doc.add_root(source)
+    return doc, source
+
+#-----------------------------------------------------------------------------
+# General API
+#-----------------------------------------------------------------------------
+
+class TestServerConnection(object):
+
+    def test_bad_watermarks(self) -> None:
+        with pytest.raises(ValueError):
+            _connection(send_queue_high_watermark=2, send_queue_low_watermark=3)
+        with pytest.raises(ValueError):
+            _connection(send_queue_high_watermark=2, send_queue_low_watermark=-1)
+
+    def test_send_patch_document_queues(self) -> None:
+        doc, source = _source()
+        c = _connection()
+        assert c.send_patch_document(_change(doc, source, 1)) is None
+        assert c.send_queue_depth == 1
+        assert c.send_queue_bytes > 0
+        c.application_context.io_loop.spawn_callback.assert_called_once_with(c._send_queued)
+
+        c.send_patch_document(_change(doc, source, 2))
+        assert c.send_queue_depth == 2
+        c.application_context.io_loop.spawn_callback.assert_called_once()
+
+    async def test_send_queued_in_order(self) -> None:
+        doc, source = _source()
+        c = _connection()
+        event = _change(doc, source, 1)
+        patch = c.protocol.create('PATCH-DOC', [event])
+        reply = c.protocol.create('ACK')
+        c.send_patch_document(event, patch)
+        c.send(reply)
+        nbytes = c.send_queue_bytes
+
+        await c._send_queued()
+        assert c._socket.sent == [patch, reply]
+        assert c.send_queue_depth == 0
+        assert c.send_queue_bytes == 0
+        assert c.bytes_sent == nbytes
+
+    def test_merge_policy(self) -> None:
+        doc, source = _source()
+        c = _connection(send_queue_high_watermark=2, send_queue_low_watermark=1, send_queue_policy="merge")
+        for i in range(3):
+            c.send_patch_document(_change(doc, source, i))
+        assert c.congested
+        assert c.send_queue_depth == 1
+        assert c.messages_merged == 2
+        # changes to the same property are combined
+        assert len(c._send_queue[0].events) == 1
+        assert c._send_queue[0].events[0].new == dict(a=[2])
+
+    def test_merge_policy_combines_streams(self) -> None:
+        doc, source = _source()
+        c = _connection(send_queue_high_watermark=2, send_queue_low_watermark=1, send_queue_policy="merge")
+        events = [_stream(doc, source, [i, i + 10], 3) for i in range(3)]
+        for event in events:
+            c.send_patch_document(event)
+        assert c.send_queue_depth == 1
+        assert c.messages_merged == 2
+        msg = c._send_queue[0].msg
+        assert [e['kind'] for e in msg.content['events']] == ['ColumnsStreamed']
+        assert msg.content['events'][0]['data'] == dict(a=[11, 2, 12])
+        assert msg.content['events'][0]['rollover'] == 3
+        # the queued events are not modified, they may be shared
+        assert [e.hint.data for e in events] == [dict(a=[0, 10]), dict(a=[1, 11]), dict(a=[2, 12])]
+
+    def test_merge_policy_keeps_barriers(self) -> None:
+        doc, source = _source()
+        c = _connection(send_queue_high_watermark=2, send_queue_low_watermark=1, send_queue_policy="merge")
+        c.send_patch_document(_change(doc, source, 0))
+        reply = c.protocol.create('ACK')
+        c.send(reply)
+        c.send_patch_document(_change(doc, source, 1))
+        c.send_patch_document(_change(doc, source, 2))
+        assert [len(e.events) if e.events else None for e in c._send_queue] == [1, None, 1]
+        assert c._send_queue[2].events[0].new == dict(a=[2])
+
+    def test_drop_policy(self) -> None:
+        doc, source = _source()
+        c = _connection(send_queue_high_watermark=2, send_queue_low_watermark=1, send_queue_policy="drop")
+        for i in range(3):
+            c.send_patch_document(_change(doc, source, i))
+        assert c.congested
+        assert c.send_queue_depth == 1
+        assert c.messages_dropped == 2
+        assert c._send_queue[0].events[0].new == dict(a=[2])
+
+    def test_disconnect_policy(self) -> None:
+        doc, source = _source()
+        c = _connection(send_queue_high_watermark=2, send_queue_low_watermark=1, send_queue_policy="disconnect")
+        for i in range(3):
+            c.send_patch_document(_change(doc, source, i))
+        assert c.send_queue_depth == 0
+        c.application_context.io_loop.add_callback.assert_called_once()
+        assert c.application_context.io_loop.add_callback.call_args[0][:2] == (c._socket.close, 1013)
+
+        c.send_patch_document(_change(doc, source, 4))
+        assert c.send_queue_depth == 0
+
+    async def test_detach_session_clears_queue(self) -> None:
+        doc, source = _source()
+        c = _connection()
+        session = c.session
+        for i in range(3):
+            c.send_patch_document(_change(doc, source, i))
+        c.detach_session()
+        assert c.session is None
+        session.unsubscribe.assert_called_once_with(c)
+        assert c.send_queue_depth == 0
+        assert c.send_queue_bytes == 0
+
+        c.send(c.protocol.create('ACK'))
+        assert c.send_queue_depth == 0
+        await c._send_queued()
+        assert c._socket.sent == []
+
+    async def test_congestion_clears_at_low_watermark(self) -> None:
+        doc, source = _source()
+        c = _connection(send_queue_high_watermark=2, send_queue_low_watermark=1, send_queue_policy="merge")
+        c.send(c.protocol.create('ACK'))
+        c.send(c.protocol.create('ACK'))
+        c.send(c.protocol.create('ACK'))
+        assert c.congested
+        await c._send_queued()
+        assert not c.congested
+        assert len(c._socket.sent) == 3
+
+#-----------------------------------------------------------------------------
+# Dev API
+#-----------------------------------------------------------------------------
+
+#-----------------------------------------------------------------------------
+# Private API
+#-----------------------------------------------------------------------------
+
+#-----------------------------------------------------------------------------
+# Code
+#-----------------------------------------------------------------------------
@@ -16,12 +16,15 @@ import pytest ; pytest
 
 # Standard library imports
 import asyncio
+import threading
+from concurrent.futures import ThreadPoolExecutor
 
 # External imports
 from tornado.ioloop import IOLoop
 
 # Bokeh imports
 from bokeh.application import Application
+from bokeh.application.handlers import FunctionHandler, Handler
 
 # Module under test
 import bokeh.server.contexts as bsc # isort:skip
@@ -138,6 +141,27 @@ class TestApplicationContext(object):
         assert session == s
         assert c._session_contexts[session.id].logout_url == "/logout"
 
+    async def test_create_session_if_needed_from_pool(self) -> None:
+        calls = []
+        app = Application(FunctionHandler(calls.append))
+        c = bsc.ApplicationContext(app, io_loop=IOLoop.current(), session_pool_size=1)
+        await c.session_pool.fill()
+        assert len(calls) == 1
+        s = await c.create_session_if_needed("foo")
+        assert s.document is calls[0]
+        assert s.document.session_context.id == "foo"
+        assert c.session_pool.hits == 1
+        assert c.session_pool.misses == 0
+
+    async def test_create_session_if_needed_in_executor(self) -> None:
+        threads = []
+        app = Application(FunctionHandler(lambda doc: threads.append(threading.get_ident())))
+        with ThreadPoolExecutor(max_workers=1) as executor:
+            c = bsc.ApplicationContext(app, io_loop=IOLoop.current(), executor=executor)
+            s = await c.create_session_if_needed("foo")
+        assert c.get_session("foo") == s
+        assert threads[0] != threading.get_ident()
+
     async def test_async_next_tick_callback_is_called(self) -> None:
         app = Application()
         c = bsc.ApplicationContext(app, io_loop=IOLoop.current())
@@ -162,6 +186,61 @@ class TestApplicationContext(object):
 # Dev API
 #-----------------------------------------------------------------------------
 
+class TestDocumentPool(object):
+
+    def test_init(self) -> None:
+        p = bsc.DocumentPool(Application(), 2)
+        assert p.size == 2
+        assert len(p) == 0
+        assert p.hits == 0
+        assert p.misses == 0
+
+    def test_bad_size(self) -> None:
+        with pytest.raises(ValueError):
+            bsc.DocumentPool(Application(), -1)
+
+    def test_disabled(self) -> None:
+        p = bsc.DocumentPool(Application())
+        assert p.claim() is None
+        assert p.misses == 0
+
+    async def test_fill_and_claim(self) -> None:
+        p = bsc.DocumentPool(Application(), 2)
+        assert p.claim() is None
+        assert p.misses == 1
+        await p.fill()
+        assert len(p) == 2
+        d1 = p.claim()
+        d2 = p.claim()
+        assert d1 is not None and d2 is not None and d1 is not d2
+        assert p.claim() is None
+        assert p.hits == 2
+        assert p.misses == 2
+
+    def test_disabled_by_session_created_hooks(self, caplog) -> None:
+        class Hooks(Handler):
+            async def on_session_created(self, session_context):
+                pass
+        p = bsc.DocumentPool(Application(Hooks()), 2)
+        assert p.size == 0
+        assert "on_session_created" in caplog.text
+
+    async def test_disabled_by_failed_handler(self, caplog) -> None:
+        def modify(doc):
+            doc.session_context.request.arguments
+        p = bsc.DocumentPool(Application(FunctionHandler(modify, trap_exceptions=True)), 2)
+        await p.fill()
+        assert len(p) == 0
+        assert p.size == 0
+        assert p.claim() is None
+        assert "Disabling the session pool" in caplog.text
+
+    async def test_clear(self) -> None:
+        p = bsc.DocumentPool(Application(), 2)
+        await p.fill()
+        p.clear()
+        assert len(p) == 0
+
 #-----------------------------------------------------------------------------
 # Private API
 #-----------------------------------------------------------------------------
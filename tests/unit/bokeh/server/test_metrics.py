@@ -0,0 +1,123 @@
+#-----------------------------------------------------------------------------
+# Copyright (c) 2012 - 2020, Anaconda, Inc., and Bokeh Contributors.
+# All rights reserved.
+#
+# The full license is in the file LICENSE.txt, distributed with this software.
+#-----------------------------------------------------------------------------
+
+#-----------------------------------------------------------------------------
+# Boilerplate
+#-----------------------------------------------------------------------------
+import pytest ; pytest
+
+#-----------------------------------------------------------------------------
+# Imports
+#-----------------------------------------------------------------------------
+
+# Module under test
+import bokeh.server.metrics as bsm # isort:skip
+
+#-----------------------------------------------------------------------------
+# Setup
+#-----------------------------------------------------------------------------
+
+#-----------------------------------------------------------------------------
+# General API
+#-----------------------------------------------------------------------------
+
+class TestMetricsRegistry(object):
+
+    def test_get_or_create(self) -> None:
+        r = bsm.MetricsRegistry()
+        c = r.counter("c_total", "A counter")
+        assert r.counter("c_total", "A counter") is c
+        with pytest.raises(ValueError):
+            r.gauge("c_total", "A gauge")
+        with pytest.raises(ValueError):
+            r.counter("c_total", "A counter", ["app"])
+
+    def test_render_sorted(self) -> None:
+        r = bsm.MetricsRegistry()
+        r.gauge("b", "B")
+        r.counter("a_total", "A")
+        assert r.render() == (
+            "# HELP a_total A\n"
+            "# TYPE a_total counter\n"
+            "a_total 0\n"
+            "# HELP b B\n"
+            "# TYPE b gauge\n"
+            "b 0\n"
+        )
+
+class TestCounter(object):
+
+    def test_inc(self) -> None:
+        c = bsm.Counter("c_total", "A counter")
+        c.inc()
+        c.inc(2)
+        assert c.render().splitlines()[-1] == "c_total 3"
+
+    def test_labels(self) -> None:
+        c = bsm.Counter("c_total", "A counter", ["app"])
+        c.labels("/b").inc()
+        c.labels("/a").inc(0.5)
+        assert c.render().splitlines()[2:] == ['c_total{app="/a"} 0.5', 'c_total{app="/b"} 1']
+
+    def test_labels_required(self) -> None:
+        c = bsm.Counter("c_total", "A counter", ["app"])
+        with pytest.raises(ValueError):
+            c.inc()
+        with pytest.raises(ValueError):
+            c.labels("/a", "/b")
+
+    def test_escaping(self) -> None:
+        c = bsm.Counter("c_total", "A\ncounter", ["app"])
+        c.labels('a"b\\c').inc()
+        assert c.render().splitlines() == [
+            '# HELP c_total A\\ncounter',
+            '# TYPE c_total counter',
+            'c_total{app="a\\"b\\\\c"} 1',
+        ]
+
+class TestGauge(object):
+
+    def test_inc_dec_set(self) -> None:
+        g = bsm.Gauge("g", "A gauge")
+        g.inc(3)
+        g.dec()
+        assert g.render().splitlines()[-1] == "g 2"
+        g.set(10)
+        assert g.render().splitlines()[-1] == "g 10"
+
+class TestHistogram(object):
+
+    def test_observe(self) -> None:
+        h = bsm.Histogram("h", "A histogram", buckets=(1, 0.1))
+        h.observe(0.05)
+        h.observe(0.5)
+        h.observe(5)
+        assert h.render().splitlines()[2:] == [
+            'h_bucket{le="0.1"} 1',
+            'h_bucket{le="1"} 2',
+            'h_bucket{le="+Inf"} 3',
+            'h_sum 5.55',
+            'h_count 3',
+        ]
+
+    def test_time(self) -> None:
+        h = bsm.Histogram("h", "A histogram", ["app"])
+        with h.labels("/a").time():
+            pass
+        assert h.render().splitlines()[-1] == 'h_count{app="/a"} 1'
+
+#-----------------------------------------------------------------------------
+# Dev API
+#-----------------------------------------------------------------------------
+
+#-----------------------------------------------------------------------------
+# Private API
+#-----------------------------------------------------------------------------
+
+#-----------------------------------------------------------------------------
+# Code
+#-----------------------------------------------------------------------------
@@ -0,0 +1,156 @@
+#-----------------------------------------------------------------------------
+# Copyright (c) 2012 - 2020, Anaconda, Inc., and Bokeh Contributors.
+# All rights reserved.
+#
+# The full license is in the file LICENSE.txt, distributed with this software.
+#-----------------------------------------------------------------------------
+
+#-----------------------------------------------------------------------------
+# Boilerplate
+#-----------------------------------------------------------------------------
+import pytest ; pytest
+
+#-----------------------------------------------------------------------------
+# Imports
+#-----------------------------------------------------------------------------
+
+# Standard library imports
+from types import SimpleNamespace
+
+# Bokeh imports
+from bokeh.document import Document
+from bokeh.models import Plot
+from bokeh.resources import Resources
+
+# Module under test
+import bokeh.server.render_cache as bsr # isort:skip
+
+#-----------------------------------------------------------------------------
+# Setup
+#-----------------------------------------------------------------------------
+
+def _session(token, title="Title"):
+    doc = Document(title=title)
+    doc.add_root(Plot(name="plot"))
+    return SimpleNamespace(token=token, document=doc)
+
+#-----------------------------------------------------------------------------
+# General API
+#-----------------------------------------------------------------------------
+
+#-----------------------------------------------------------------------------
+# Dev API
+#-----------------------------------------------------------------------------
+
+class TestRenderCache(object):
+
+    def test_bad_size(self) -> None:
+        with pytest.raises(ValueError):
+            bsr.RenderCache(size=0)
+
+    def test_get(self) -> None:
+        c = bsr.RenderCache()
+        renders = []
+        def render(slot):
+            renders.append(1)
+            return "a %s b %s c %s" % (slot("token"), slot("root0"), slot("token"))
+        entry = c.get("key", render)
+        assert entry.fill(dict(token="T", root0="R")) == "a T b R c T"
+        assert c.get("key", render) is entry
+        assert len(renders) == 1
+        assert (c.hits, c.misses, len(c)) == (1, 1, 1)
+
+    def test_get_modified_slot(self) -> None:
+        c = bsr.RenderCache()
+        assert c.get("key1", lambda slot: slot("token").upper()) is None
+        assert c.get("key2", lambda slot: slot("token").replace("_", "-")) is None
+        assert c.get("key2", lambda slot: slot("token")) is None
+
+    def test_lru(self) -> None:
+        c = bsr.RenderCache(size=2)
+        c.get(1, lambda slot: "1")
+        c.get(2, lambda slot: "2")
+        c.get(1, lambda slot: "1")
+        c.get(3, lambda slot: "3")
+        assert list(c._entries) == [1, 3]
+        c.clear()
+        assert len(c) == 0
+
+class TestCachedRender(object):
+
+    def test_headers(self) -> None:
+        c = bsr.RenderCache()
+        entry = c.get("key", lambda slot: "x %s" % slot("token"))
+        h1 = entry.headers(dict(token="a"))
+        h2 = entry.headers(dict(token="b"))
+        assert h1["Etag"] != h2["Etag"]
+        assert h1["Etag"] == entry.headers(dict(token="a"))["Etag"]
+        assert "Last-Modified" not in h1
+
+def test_html_page_for_session() -> None:
+    c = bsr.RenderCache()
+    resources = Resources(mode="cdn")
+    s1, s2 = _session("token-1"), _session("token-2")
+
+    page1, headers1 = bsr.html_page_for_session(c, s1, resources)
+    page2, headers2 = bsr.html_page_for_session(c, s2, resources)
+    assert (c.hits, c.misses) == (1, 1)
+    assert "token-1" in page1 and "token-2" not in page1
+    assert "token-2" in page2 and "token-1" not in page2
+    assert s1.document.roots[0].id in page1
+    assert s2.document.roots[0].id in page2
+    assert "<title>Title</title>" in page2
+    assert headers1["Etag"] != headers2["Etag"]
+
+    page3, _ = bsr.html_page_for_session(c, _session("token-3", title="Other"), resources)
+    assert "<title>Other</title>" in page3
+    assert (c.hits, c.misses) == (1, 2)
+
+def test_html_page_for_session_unsafe_token() -> None:
+    c = bsr.RenderCache()
+    page, headers = bsr.html_page_for_session(c, _session("</script>"), Resources(mode="cdn"))
+    assert headers == {}
+    assert len(c) == 0
+
+def test_html_page_for_session_uncacheable_variables() -> None:
+    c = bsr.RenderCache()
+    s = _session("token")
+    s.document.template_variables["obj"] = object()
+    page, headers = bsr.html_page_for_session(c, s, Resources(mode="cdn"))
+    assert "token" in page
+    assert headers == {}
+    assert len(c) == 0
+
+def test_autoload_js_for_session() -> None:
+    c = bsr.RenderCache()
+    s1, s2 = _session("token-1"), _session("token-2")
+    js1, _ = bsr.autoload_js_for_session(c, s1, None, "elt", "/app", None)
+    js2, headers = bsr.autoload_js_for_session(c, s2, None, "elt", "/app", None)
+    assert (c.hits, c.misses) == (1, 1)
+    assert "token-1" in js1
+    assert "token-2" in js2 and "token-1" not in js2
+    assert "Etag" in headers
+
+    bsr.autoload_js_for_session(c, s2, None, "other", "/app", None)
+    assert (c.hits, c.misses) == (1, 2)
+
+#-----------------------------------------------------------------------------
+# Private API
+#-----------------------------------------------------------------------------
+
+def test__resources_key_models() -> None:
+    from bokeh.model import Model
+    resources = Resources(mode="cdn")
+    key = bsr._resources_key(resources)
+
+    class LazyBuiltinModelForRenderCache(Model):
+        __module__ = "bokeh.models.lazy"
+    assert bsr._resources_key(resources) == key
+
+    class ExtensionModelForRenderCache(Model):
+        pass
+    assert bsr._resources_key(resources) != key
+
+#-----------------------------------------------------------------------------
+# Code
+#-----------------------------------------------------------------------------
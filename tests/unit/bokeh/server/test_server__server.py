@@ -172,6 +172,22 @@ def test_prefix(ManagedServerLoop) -> None:
     with ManagedServerLoop(application, prefix="foo") as server:
         assert server.prefix == "foo"
 
+async def test_metrics(ManagedServerLoop) -> None:
+    application = Application()
+    with ManagedServerLoop(application) as server:
+        with pytest.raises(HTTPError) as e:
+            await http_get(server.io_loop, url(server) + "metrics")
+        assert e.value.code == 404
+
+    with ManagedServerLoop(application, use_metrics=True) as server:
+        await http_get(server.io_loop, url(server))
+        response = await http_get(server.io_loop, url(server) + "metrics")
+        assert response.headers["Content-Type"].startswith("text/plain; version=0.0.4")
+        body = response.body.decode("utf-8")
+        assert '# TYPE bokeh_sessions gauge' in body
+        assert 'bokeh_sessions_created_total{app="/"}' in body
+        assert 'bokeh_session_creation_seconds_count{app="/"}' in body
+
 def test_index(ManagedServerLoop) -> None:
     application = Application()
     with ManagedServerLoop(application) as server:
@@ -14,11 +14,21 @@ import pytest ; pytest
 # Imports
 #-----------------------------------------------------------------------------
 
+# Standard library imports
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+
 # External imports
 import mock
+from tornado.ioloop import IOLoop
 
 # Bokeh imports
 from bokeh.document import Document
+from bokeh.document.events import ColumnsPatchedEvent, ColumnsStreamedEvent
+from bokeh.models import ColumnDataSource
+from bokeh.server.metrics import PERIODIC_CALLBACK_OVERRUNS
+from bokeh.server.tracing import add_lock_tracer, remove_lock_tracer
 
 # Module under test
 import bokeh.server.session as bss # isort:skip
@@ -27,6 +37,9 @@ import bokeh.server.session as bss # isort:skip
 # Setup
 #-----------------------------------------------------------------------------
 
+async def _noop():
+    pass
+
 #-----------------------------------------------------------------------------
 # General API
 #-----------------------------------------------------------------------------
@@ -63,6 +76,75 @@ def test_destroy_calls() -> None:
             docroc.assert_called_with(s)
         docdm.assert_called_once()
 
+def test__document_patched_creates_one_message_for_all_connections() -> None:
+    d = Document()
+    s = bss.ServerSession('some-id', d, 'ioloop')
+    connections = [mock.MagicMock() for _ in range(3)]
+    for c in connections:
+        s.subscribe(c)
+    s._pending_writes = []
+    event = mock.MagicMock(setter=None)
+    s._document_patched(event)
+    created = [c.protocol.create.call_count for c in connections]
+    assert sorted(created) == [0, 0, 1]
+    msg = [c for c in connections if c.protocol.create.call_count][0].protocol.create.return_value
+    for c in connections:
+        c.send_patch_document.assert_called_once_with(event, msg)
+    assert len(s._pending_writes) == 3
+
+async def test__document_patched_combines_streams() -> None:
+    d = Document()
+    source = ColumnDataSource(data=dict(a=[10]))
+    d.add_root(source)
+    s = bss.ServerSession('some-id', d, 'ioloop')
+    connection = mock.MagicMock()
+    s.subscribe(connection)
+
+    def stream():
+        source.stream(dict(a=[11]))
+        source.stream(dict(a=[12, 13]))
+        source.patch(dict(a=[(0, 20)]))
+        source.stream(dict(a=[14]))
+
+    with mock.patch.object(connection, 'send_patch_document', side_effect=lambda e, m: _noop()):
+        await s.with_document_locked(stream)
+        events = [call[0][0] for call in connection.send_patch_document.call_args_list]
+
+    assert [type(e.hint) for e in events] == [ColumnsStreamedEvent, ColumnsPatchedEvent, ColumnsStreamedEvent]
+    assert events[0].hint.data == dict(a=[11, 12, 13])
+    assert events[2].hint.data == dict(a=[14])
+    assert s._pending_stream is None
+
+async def test__handle_patch_in_executor() -> None:
+    d = Document()
+    with ThreadPoolExecutor(max_workers=1) as executor:
+        s = bss.ServerSession('some-id', d, IOLoop.current(), executor=executor)
+        threads = []
+        message = mock.MagicMock()
+        message.apply_to_document.side_effect = lambda doc, setter: threads.append(threading.get_ident())
+        connection = mock.MagicMock()
+        result = await s._handle_patch(message, connection)
+    message.apply_to_document.assert_called_once_with(d, s)
+    assert threads[0] != threading.get_ident()
+    assert result is connection.ok.return_value
+    assert s._current_patch_connection is None
+
+async def test_with_document_locked_traced() -> None:
+    s = bss.ServerSession('some-id', Document(), 'ioloop')
+    traces = []
+    def locked():
+        time.sleep(0.01)
+    add_lock_tracer(traces.append)
+    try:
+        await s.with_document_locked(locked)
+    finally:
+        remove_lock_tracer(traces.append)
+    assert len(traces) == 1
+    assert traces[0].session_id == 'some-id'
+    assert traces[0].origin.endswith("test_with_document_locked_traced.<locals>.locked")
+    assert traces[0].hold >= 0.01
+    assert traces[0].wait >= 0
+
 #-----------------------------------------------------------------------------
 # Dev API
 #-----------------------------------------------------------------------------
@@ -71,6 +153,22 @@ def test_destroy_calls() -> None:
 # Private API
 #-----------------------------------------------------------------------------
 
+async def test__count_overruns() -> None:
+    overruns = PERIODIC_CALLBACK_OVERRUNS.labels()
+    before = overruns._value
+
+    bss._count_overruns(lambda: None, 1000)()
+    assert overruns._value == before
+
+    bss._count_overruns(lambda: time.sleep(0.01), 1)()
+    assert overruns._value == before + 1
+
+    async def slow():
+        time.sleep(0.01)
+        return 10
+    assert await bss._count_overruns(slow, 1)() == 10
+    assert overruns._value == before + 2
+
 #-----------------------------------------------------------------------------
 # Code
 #-----------------------------------------------------------------------------
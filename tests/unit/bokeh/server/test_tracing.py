@@ -0,0 +1,104 @@
+#-----------------------------------------------------------------------------
+# Copyright (c) 2012 - 2020, Anaconda, Inc., and Bokeh Contributors.
+# All rights reserved.
+#
+# The full license is in the file LICENSE.txt, distributed with this software.
+#-----------------------------------------------------------------------------
+
+#-----------------------------------------------------------------------------
+# Boilerplate
+#-----------------------------------------------------------------------------
+import pytest ; pytest
+
+#-----------------------------------------------------------------------------
+# Imports
+#-----------------------------------------------------------------------------
+
+# Standard library imports
+from functools import partial
+
+# Module under test
+import bokeh.server.tracing as bst # isort:skip
+
+#-----------------------------------------------------------------------------
+# Setup
+#-----------------------------------------------------------------------------
+
+def _callback(x):
+    pass
+
+#-----------------------------------------------------------------------------
+# General API
+#-----------------------------------------------------------------------------
+
+class TestLockTracers(object):
+
+    def test_add_remove(self) -> None:
+        traces = []
+        bst.add_lock_tracer(traces.append)
+        try:
+            bst.trace_lock("id", _callback, 0.5, 2.0)
+        finally:
+            bst.remove_lock_tracer(traces.append)
+        bst.trace_lock("id", _callback, 0.5, 2.0)
+        assert traces == [bst.LockTrace("id", __name__ + "._callback", 0.5, 2.0)]
+
+    def test_remove_missing(self) -> None:
+        with pytest.raises(ValueError):
+            bst.remove_lock_tracer(lambda trace: None)
+
+    def test_tracer_errors_ignored(self) -> None:
+        traces = []
+        def bad(trace):
+            raise RuntimeError("bad")
+        bst.add_lock_tracer(bad)
+        bst.add_lock_tracer(traces.append)
+        try:
+            bst.trace_lock("id", _callback, 0.5, 2.0)
+        finally:
+            bst.remove_lock_tracer(bad)
+            bst.remove_lock_tracer(traces.append)
+        assert len(traces) == 1
+
+class TestLockProfiler(object):
+
+    def test_stats(self) -> None:
+        p = bst.LockProfiler()
+        p(bst.LockTrace("a", "f", 0.1, 1.0))
+        p(bst.LockTrace("b", "f", 0.3, 2.0))
+        p(bst.LockTrace("a", "g", 0.0, 5.0))
+        assert p.stats() == [
+            dict(origin="g", count=1, wait_total=0.0, wait_max=0.0, hold_total=5.0, hold_max=5.0),
+            dict(origin="f", count=2, wait_total=pytest.approx(0.4), wait_max=0.3, hold_total=3.0, hold_max=2.0),
+        ]
+        p.reset()
+        assert p.stats() == []
+
+    def test_summary(self) -> None:
+        p = bst.LockProfiler()
+        assert p.summary() == "No document locks were held"
+        p(bst.LockTrace("a", "f", 0.1, 1.0))
+        p(bst.LockTrace("a", "g", 0.0, 5.0))
+        lines = p.summary().splitlines()
+        assert len(lines) == 3
+        assert lines[0].split() == ["count", "hold", "total", "hold", "max", "wait", "total", "wait", "max", "origin"]
+        assert lines[1].split() == ["1", "5.000s", "5.000s", "0.000s", "0.000s", "g"]
+        assert lines[2].split() == ["1", "1.000s", "1.000s", "0.100s", "0.100s", "f"]
+        assert len(p.summary(limit=1).splitlines()) == 2
+
+#-----------------------------------------------------------------------------
+# Dev API
+#-----------------------------------------------------------------------------
+
+def test_callable_name() -> None:
+    assert bst.callable_name(_callback) == __name__ + "._callback"
+    assert bst.callable_name(partial(partial(_callback), 1)) == __name__ + "._callback"
+    assert bst.callable_name(TestLockProfiler.test_stats) == __name__ + ".TestLockProfiler.test_stats"
+
+#-----------------------------------------------------------------------------
+# Private API
+#-----------------------------------------------------------------------------
+
+#-----------------------------------------------------------------------------
+# Code
+#-----------------------------------------------------------------------------
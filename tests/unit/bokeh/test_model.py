@@ -15,7 +15,7 @@ import pytest ; pytest
 #-----------------------------------------------------------------------------
 
 # Bokeh imports
-from bokeh.core.properties import Int, List, String
+from bokeh.core.properties import Instance, Int, List, String
 from bokeh.models import *  # NOQA
 from bokeh.models import CustomJS
 from bokeh.plotting import *  # NOQA
@@ -23,7 +23,7 @@ from bokeh.plotting import *  # NOQA
 from bokeh.document import document # isort:skip
 
 # Module under test
-from bokeh.model import Model # isort:skip
+from bokeh.model import Model, collect_filtered_models, collect_models # isort:skip
 
 #-----------------------------------------------------------------------------
 # Setup
@@ -231,6 +231,38 @@ def test_select() -> None:
 # Dev API
 #-----------------------------------------------------------------------------
 
+class RefModel(Model):
+    name_ = String()
+    child = Instance(Model)
+    children = List(Instance(Model))
+
+def test_collect_models_breadth_first() -> None:
+    c1, c2, c3 = RefModel(), RefModel(), RefModel()
+    g1 = RefModel(children=[c3])
+    c1.child = g1
+    root = RefModel(children=[c1, c2, c1], child=c3)
+    collected = collect_models(root)
+    assert collected[0] is root
+    assert set(collected[1:4]) == {c1, c2, c3}
+    assert collected[4] is g1
+    assert len(collected) == 5
+
+def test_collect_filtered_models_discard() -> None:
+    leaf = RefModel()
+    skipped = RefModel(child=leaf)
+    root = RefModel(children=[skipped, RefModel()])
+    collected = collect_filtered_models(lambda obj: obj is skipped, root)
+    assert root in collected
+    assert skipped not in collected
+    assert leaf not in collected
+    assert len(collected) == 2
+
+def test_collect_models_long_chain() -> None:
+    models = [RefModel() for _ in range(5000)]
+    for parent, child in zip(models, models[1:]):
+        parent.child = child
+    assert collect_models(models[0]) == models
+
 #-----------------------------------------------------------------------------
 # Private API
 #-----------------------------------------------------------------------------
@@ -95,6 +95,11 @@ class TestSRIHashes(object):
         with pytest.raises(KeyError):
             resources.get_sri_hashes_for_version("junk")
 
+    def test_get_sri_hashes_for_version_copies(self) -> None:
+        key = next(iter(resources.get_all_sri_hashes()))
+        resources.get_sri_hashes_for_version(key)["junk"] = "junk"
+        assert "junk" not in resources.get_sri_hashes_for_version(key)
+
 class TestJSResources(object):
 
     def test_js_resources_default_mode_is_cdn(self) -> None:
@@ -444,6 +449,30 @@ def test_external_js_and_css_resource_ordering() -> None:
 # Private API
 # -----------------------------------------------------------------------------
 
+
+class Test__cached_load(object):
+    def test_reused_until_modified(self, tmp_path) -> None:
+        path = str(tmp_path / "bokeh.js")
+        with open(path, "w") as f:
+            f.write("a")
+
+        text = resources.BaseResources._inline(path)
+        assert text == "/* BEGIN bokeh.js */\na\n/* END bokeh.js */"
+        assert resources.BaseResources._inline(path) is text
+
+        with open(path, "w") as f:
+            f.write("b")
+        stat = os.stat(path)
+        os.utime(path, ns=(stat.st_atime_ns, stat.st_mtime_ns + 10**9))
+        assert resources.BaseResources._inline(path) == "/* BEGIN bokeh.js */\nb\n/* END bokeh.js */"
+
+    def test_loaders_cached_separately(self, tmp_path) -> None:
+        path = str(tmp_path / "data.json")
+        with open(path, "w") as f:
+            f.write("{}")
+        assert resources._cached_load(path, resources._load_json) == {}
+        assert resources._cached_load(path, resources._load_inline).endswith("{}\n/* END data.json */")
+
 # -----------------------------------------------------------------------------
 # Code
 # -----------------------------------------------------------------------------
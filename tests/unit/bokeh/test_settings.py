@@ -45,10 +45,13 @@ _expected_settings = (
     'auth_module',
     'browser',
     'cdn_version',
+    'compact_ids',
+    'compiler_cache_dir',
     'cookie_secret',
     'docs_cdn',
     'docs_version',
     'ignore_filename',
+    'json_backend',
     'legacy',
     'log_level',
     'minified',
@@ -59,6 +62,7 @@ _expected_settings = (
     'resources',
     'rootdir',
     'secret_key',
+    'session_template',
     'sign_sessions',
     'simple_ids',
     'ssl_certfile',
@@ -85,9 +89,11 @@ class TestSettings(object):
         assert ps._parent == bs.settings
 
     def test_types(self) -> None:
+        assert bs.settings.compact_ids.convert_type == "Bool"
         assert bs.settings.ignore_filename.convert_type == "Bool"
         assert bs.settings.minified.convert_type == "Bool"
         assert bs.settings.perform_document_validation.convert_type == "Bool"
+        assert bs.settings.session_template.convert_type == "Bool"
         assert bs.settings.simple_ids.convert_type == "Bool"
         assert bs.settings.strict.convert_type == "Bool"
         assert bs.settings.xsrf_cookies.convert_type == "Bool"
@@ -97,10 +103,12 @@ class TestSettings(object):
         assert bs.settings.allowed_ws_origin.convert_type == "List[String]"
 
         default_typed = set(_expected_settings) - set([
+            'compact_ids',
             'ignore_filename',
             'legacy',
             'minified',
             'perform_document_validation',
+            'session_template',
             'simple_ids',
             'strict',
             'py_log_level',
@@ -305,6 +313,55 @@ class TestPrioritizedSetting(object):
         s.bar = 20
         assert s.bar() == 20
 
+    def test_cached(self) -> None:
+        calls = []
+        def convert(value):
+            calls.append(value)
+            return value
+        ps = bs.PrioritizedSetting("foo", env_var="BOKEH_FOO", convert=convert, default=10)
+        assert ps() == 10
+        assert ps() == 10
+        assert calls == [10]
+
+        assert ps(default=20) == 20
+        assert ps(30) == 30
+        assert calls == [10, 20, 30]
+
+    def test_cache_invalidated(self, monkeypatch) -> None:
+        ps = bs.PrioritizedSetting("foo", env_var="BOKEH_FOO", default=10, dev_default=15)
+        assert ps() == 10
+
+        monkeypatch.setenv("BOKEH_FOO", "40")
+        assert ps() == "40"
+        monkeypatch.delenv("BOKEH_FOO")
+        assert ps() == 10
+
+        monkeypatch.setenv("BOKEH_DEV", "yes")
+        assert ps() == 15
+        monkeypatch.delenv("BOKEH_DEV")
+
+        ps.set_value(60)
+        assert ps() == 60
+        ps.unset_value()
+        assert ps() == 10
+
+    def test_cache_invalidated_by_settings(self, tmp_path) -> None:
+        class FakeSettings(bs.Settings):
+            foo = bs.PrioritizedSetting("foo", env_var="BOKEH_FOO", default=10)
+
+        s = FakeSettings()
+        assert s.foo() == 10
+
+        config = tmp_path / "bokeh.yaml"
+        config.write_text("foo: 20")
+        s.load_config(str(config))
+        assert s.foo() == 20
+
+        s._config_override = {}
+        assert s.foo() == 20
+        s.refresh()
+        assert s.foo() == 10
+
 #-----------------------------------------------------------------------------
 # Private API
 #-----------------------------------------------------------------------------
@@ -182,6 +182,39 @@ def test_inline_extension() -> None:
 # Private API
 #-----------------------------------------------------------------------------
 
+class Test__Compiler(object):
+
+    @patch('bokeh.util.compiler._run_npmjs')
+    @patch('bokeh.util.compiler.nodejs_compile', return_value=buc.AttrDict(code="compiled", deps=[]))
+    def test_cache(self, mock_compile, mock_npmjs, tmpdir) -> None:
+        impl = buc.TypeScript("code", file="some.ts")
+        with patch.dict(os.environ, {"BOKEH_COMPILER_CACHE_DIR": str(tmpdir)}):
+            assert buc._Compiler([("dep", "1.0")])(impl) == dict(code="compiled", deps=[])
+            assert buc._Compiler([("dep", "1.0")])(impl) == dict(code="compiled", deps=[])
+            assert mock_compile.call_count == 1
+            assert mock_npmjs.call_count == 1
+
+            buc._Compiler([("dep", "2.0")])(impl)
+            buc._Compiler([("dep", "1.0")])(buc.TypeScript("other code", file="some.ts"))
+            assert mock_compile.call_count == 3
+
+        assert len(tmpdir.listdir()) == 3
+
+    @patch('bokeh.util.compiler.nodejs_compile', return_value=buc.AttrDict(code="compiled", deps=[]))
+    def test_no_cache_dir(self, mock_compile) -> None:
+        impl = buc.TypeScript("code", file="some.ts")
+        buc._Compiler([])(impl)
+        buc._Compiler([])(impl)
+        assert mock_compile.call_count == 2
+
+    @patch('bokeh.util.compiler.nodejs_compile', return_value=buc.AttrDict(error="bad"))
+    def test_error_not_cached(self, mock_compile, tmpdir) -> None:
+        impl = buc.TypeScript("code", file="some.ts")
+        with patch.dict(os.environ, {"BOKEH_COMPILER_CACHE_DIR": str(tmpdir)}):
+            with pytest.raises(buc.CompilationError):
+                buc._Compiler([])(impl)
+        assert tmpdir.listdir() == []
+
 #-----------------------------------------------------------------------------
 # Code
 #-----------------------------------------------------------------------------
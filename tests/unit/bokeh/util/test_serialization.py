@@ -17,7 +17,10 @@ import pytest ; pytest
 # Standard library imports
 import base64
 import datetime
+import json
 import os
+from itertools import count
+from threading import Thread
 
 # External imports
 import numpy as np
@@ -37,13 +40,13 @@ import bokeh.util.serialization as bus # isort:skip
 class Test_make_id(object):
 
     def test_default(self) -> None:
-        bus._simple_id = 999
+        bus._simple_ids = count(1000)
         assert bus.make_id() == "1000"
         assert bus.make_id() == "1001"
         assert bus.make_id() == "1002"
 
     def test_simple_ids_yes(self) -> None:
-        bus._simple_id = 999
+        bus._simple_ids = count(1000)
         os.environ["BOKEH_SIMPLE_IDS"] = "yes"
         assert bus.make_id() == "1000"
         assert bus.make_id() == "1001"
@@ -55,6 +58,27 @@ class Test_make_id(object):
         assert isinstance(bus.make_id(), str)
         del os.environ["BOKEH_SIMPLE_IDS"]
 
+    def test_compact_ids(self) -> None:
+        bus._simple_ids = count(1000)
+        os.environ["BOKEH_COMPACT_IDS"] = "yes"
+        try:
+            assert bus.make_id() == "rs"
+            assert bus.make_id() == "rt"
+        finally:
+            del os.environ["BOKEH_COMPACT_IDS"]
+        assert bus.make_id() == "1002"
+
+    def test_threads(self) -> None:
+        ids = []
+        def make_ids():
+            ids.extend(bus.make_id() for _ in range(1000))
+        threads = [Thread(target=make_ids) for _ in range(4)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+        assert len(set(ids)) == 4000
+
 class Test_make_globally_unique_id(object):
     def test_basic(self) -> None:
         assert len(bus.make_globally_unique_id()) == 36
@@ -148,6 +172,47 @@ expected = [['NaN', 3.0], ['-Infinity', ['Infinity']]]
 def test_traverse_data() -> None:
     assert bus.traverse_data(testing) == expected
 
+def test_traverse_data_numeric_list() -> None:
+    data = [1, 2.5, float('nan'), float('inf'), float('-inf'), 3]
+    out = bus.traverse_data(data)
+    assert out == [1, 2.5, 'NaN', 'Infinity', '-Infinity', 3]
+    assert [type(x) for x in out] == [int, float, str, str, str, int]
+    assert out is not data
+
+def test_traverse_data_numeric_list_large_int() -> None:
+    assert bus.traverse_data([2**1100, float('nan')]) == [2**1100, 'NaN']
+
+@pytest.mark.parametrize('dt', bus.BINARY_ARRAY_TYPES)
+def test_encode_decode_ragged_dict(dt) -> None:
+    arrays = [np.arange(3, dtype=dt), np.arange(0, dtype=dt), np.arange(6, dtype=dt).reshape(2, 3)]
+    d = bus.encode_ragged_dict(arrays)
+    assert d['shapes'] == [(3,), (0,), (2, 3)]
+    assert d['offsets']['dtype'] == 'int32'
+    assert d['__ragged__']['shape'] == (9,)
+    out = bus.decode_ragged_dict(d)
+    assert len(out) == 3
+    for a, b in zip(arrays, out):
+        assert a.dtype == b.dtype
+        assert np.array_equal(a, b)
+
+    bufs = []
+    d = bus.encode_ragged_dict(arrays, buffers=bufs)
+    assert len(bufs) == 2
+    out = bus.decode_ragged_dict(d, bufs)
+    for a, b in zip(arrays, out):
+        assert np.array_equal(a, b)
+
+def test_transform_column_source_data_ragged() -> None:
+    d = dict(xs=[np.arange(3.), np.arange(2.)], ys=[np.arange(3.), np.arange(2, dtype=np.float32)], zs=[np.arange(3.), [1, 2]])
+    bufs = []
+    out = bus.transform_column_source_data(d, buffers=bufs)
+    assert set(out['xs']) == {'__ragged__', 'offsets', 'shapes'}
+    assert len(bufs) == 4
+    assert [np.array_equal(a, b) for a, b in zip(d['xs'], bus.decode_ragged_dict(out['xs'], bufs))] == [True, True]
+    # mixed dtypes or types are sent per item
+    assert isinstance(out['ys'], list) and len(out['ys']) == 2
+    assert isinstance(out['zs'], list) and out['zs'][1] == [1, 2]
+
 @pytest.mark.parametrize('dt', bus.BINARY_ARRAY_TYPES)
 def test_transform_array_force_list_default(dt) -> None:
     a = np.empty(shape=10, dtype=dt)
@@ -408,6 +473,28 @@ def test_encode_binary_dict(dt, shape) -> None:
 
     assert '__buffer__' in d
 
+@pytest.mark.parametrize('dt', bus.BINARY_ARRAY_TYPES)
+@pytest.mark.parametrize('shape', [(12,), (2, 6), (2,2,3)])
+def test_encode_decode_binary_roundtrip(dt, shape) -> None:
+    a = np.arange(12, dtype=dt).reshape(shape)
+    bufs = []
+    bus.encode_binary_dict(np.arange(3, dtype=dt), buffers=bufs)
+    d = bus.encode_binary_dict(a, buffers=bufs)
+    aa = bus.decode_binary_dict(d, bufs)
+    assert aa.shape == a.shape
+    assert aa.dtype == a.dtype
+    assert np.array_equal(a, aa)
+    assert aa.flags['WRITEABLE']
+
+    # buffer headers received from the wire are JSON strings
+    wire_bufs = [(json.dumps(header), payload) for header, payload in bufs]
+    assert np.array_equal(a, bus.decode_binary_dict(d, wire_bufs))
+
+def test_decode_binary_dict_missing_buffer() -> None:
+    d = bus.encode_binary_dict(np.arange(3, dtype=np.float64), buffers=[])
+    with pytest.raises(ValueError):
+        bus.decode_binary_dict(d, [])
+
 @pytest.mark.parametrize('cols', [None, [], ['a'], ['a', 'b'], ['a', 'b', 'c']])
 @pytest.mark.parametrize('dt1', [np.float32, np.float64, np.int64])
 @pytest.mark.parametrize('dt2', [np.float32, np.float64, np.int64])
@@ -440,6 +527,12 @@ def test_transform_column_source_data_with_buffers(pd, cols, dt1, dt2) -> None:
 # Private API
 #-----------------------------------------------------------------------------
 
+def test__base36() -> None:
+    assert bus._base36(0) == "0"
+    assert bus._base36(35) == "z"
+    assert bus._base36(36) == "10"
+    assert all(int(bus._base36(n), 36) == n for n in range(0, 100000, 997))
+
 #-----------------------------------------------------------------------------
 # Code
 #-----------------------------------------------------------------------------